@@ -7,6 +7,8 @@ https://github.com/helgeklein/ha-smart_cover_automation
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from collections.abc import Mapping
 from functools import partial
@@ -19,12 +21,14 @@ from homeassistant.helpers import entity_registry as er  # pyright: ignore[repor
 from homeassistant.loader import async_get_loaded_integration  # pyright: ignore[reportMissingImports]
 
 from . import const
-from .config import CONF_SPECS, ConfKeys, is_runtime_configurable_key
+from .config import CONF_SPECS, ConfKeys, is_runtime_configurable_key, resolve
 from .config_flow import OptionsFlowHandler
 from .const import (
     COVER_SFX_TILT_EXTERNAL_VALUE_DAY,
     COVER_SFX_TILT_EXTERNAL_VALUE_NIGHT,
     DATA_COORDINATORS,
+    DATA_FORECAST_CACHE,
+    DATA_SENSOR_SNAPSHOT_HUB,
     DOMAIN,
     HA_OPTIONS,
     INTEGRATION_NAME,
@@ -38,6 +42,9 @@ from .const import (
     SERVICE_FIELD_LOCK_MODE,
     SERVICE_LOGBOOK_ENTRY,
     SERVICE_SET_LOCK,
+    STARTUP_MIGRATIONS_KEY_STALE_ENTITY_FINGERPRINT,
+    STARTUP_MIGRATIONS_KEY_VERSION,
+    STARTUP_MIGRATIONS_VERSION,
     TIME_KEY_AUTOMATION_DISABLED_TIME_RANGE_EXTERNAL_END,
     TIME_KEY_AUTOMATION_DISABLED_TIME_RANGE_EXTERNAL_START,
     TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME,
@@ -196,6 +203,34 @@ def _is_external_blocked_time_range_key(key: str) -> bool:
     )
 
 
+#
+# _get_valid_auto_managed_keys
+#
+def _get_valid_auto_managed_keys(hass: HomeAssistant, entry: IntegrationConfigEntry) -> set[str]:
+    """Return the keys of the external value entities that should exist for this entry."""
+
+    return (
+        _get_valid_external_tilt_value_keys(hass, entry)
+        | _get_valid_external_morning_opening_keys(entry)
+        | _get_valid_external_evening_closure_keys(entry)
+        | _get_valid_external_blocked_time_range_keys(entry)
+    )
+
+
+#
+# _is_auto_managed_key
+#
+def _is_auto_managed_key(key: str) -> bool:
+    """Return whether the key stores the value of an auto-managed external value entity."""
+
+    return (
+        _is_external_tilt_value_key(key)
+        or _is_external_morning_opening_key(key)
+        or _is_external_evening_closure_key(key)
+        or _is_external_blocked_time_range_key(key)
+    )
+
+
 #
 # _async_migrate_temperature_threshold_keys
 #
@@ -374,39 +409,18 @@ async def _async_remove_stale_registry_entities(hass: HomeAssistant, entry: Inte
     }
 
     stale_entries = [entity for entity in entries if entity.unique_id in removed_unique_ids]
-    valid_external_tilt_value_keys = _get_valid_external_tilt_value_keys(hass, entry)
-    valid_external_morning_opening_keys = _get_valid_external_morning_opening_keys(entry)
-    valid_external_evening_closure_keys = _get_valid_external_evening_closure_keys(entry)
-    valid_external_blocked_time_range_keys = _get_valid_external_blocked_time_range_keys(entry)
-    valid_auto_managed_keys = (
-        valid_external_tilt_value_keys
-        | valid_external_morning_opening_keys
-        | valid_external_evening_closure_keys
-        | valid_external_blocked_time_range_keys
-    )
+    valid_auto_managed_keys = _get_valid_auto_managed_keys(hass, entry)
     valid_auto_managed_unique_ids = {f"{entry.entry_id}_{key}" for key in valid_auto_managed_keys}
     stale_entries.extend(
         entity
         for entity in entries
         if entity.unique_id.startswith(f"{entry.entry_id}_")
-        and (
-            _is_external_tilt_value_key(entity.unique_id.removeprefix(f"{entry.entry_id}_"))
-            or _is_external_morning_opening_key(entity.unique_id.removeprefix(f"{entry.entry_id}_"))
-            or _is_external_evening_closure_key(entity.unique_id.removeprefix(f"{entry.entry_id}_"))
-            or _is_external_blocked_time_range_key(entity.unique_id.removeprefix(f"{entry.entry_id}_"))
-        )
+        and _is_auto_managed_key(entity.unique_id.removeprefix(f"{entry.entry_id}_"))
         and entity.unique_id not in valid_auto_managed_unique_ids
     )
 
     current_options = _get_entry_options_dict(entry)
-    stale_auto_managed_option_keys = {
-        key
-        for key in current_options
-        if _is_external_tilt_value_key(key)
-        or _is_external_morning_opening_key(key)
-        or _is_external_evening_closure_key(key)
-        or _is_external_blocked_time_range_key(key)
-    } - valid_auto_managed_keys
+    stale_auto_managed_option_keys = {key for key in current_options if _is_auto_managed_key(key)} - valid_auto_managed_keys
     if stale_auto_managed_option_keys:
         updated_options = dict(current_options)
         for key in stale_auto_managed_option_keys:
@@ -583,6 +597,73 @@ async def _handle_logbook_entry_service(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+#
+# _get_stale_entity_fingerprint
+#
+def _get_stale_entity_fingerprint(hass: HomeAssistant, entry: IntegrationConfigEntry, integration_version: str) -> str:
+    """Return a digest of everything that decides which registry entities are stale.
+
+    The stale-entity sweep only needs to run again when the integration version
+    (and with it the list of retired entities), the cover list, or the set of
+    expected external value entities changes.
+    """
+
+    covers = tuple(_get_entry_options_dict(entry).get(ConfKeys.COVERS.value, ()))
+    payload = {
+        "integration_version": integration_version,
+        "removed_entity_keys": sorted(REMOVED_ENTITY_UNIQUE_ID_KEYS),
+        "covers": sorted(str(cover) for cover in covers),
+        "auto_managed_keys": sorted(_get_valid_auto_managed_keys(hass, entry)),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+#
+# _async_run_startup_migrations
+#
+async def _async_run_startup_migrations(
+    hass: HomeAssistant,
+    entry: IntegrationConfigEntry,
+    coordinator: DataUpdateCoordinator,
+    integration_version: str,
+) -> None:
+    """Run the registry migrations and the stale-entity sweep when they are due.
+
+    Each of them scans the entity registry entries of the config entry. The
+    persisted migration record lets completed migrations be skipped until
+    STARTUP_MIGRATIONS_VERSION changes, and the sweep until its fingerprint
+    changes.
+    """
+
+    logger = Log(entry_id=entry.entry_id)
+    record = coordinator.startup_migrations
+    if not isinstance(record, dict):
+        record = {}
+    updated_record = dict(record)
+
+    if record.get(STARTUP_MIGRATIONS_KEY_VERSION) != STARTUP_MIGRATIONS_VERSION:
+        await _async_migrate_temperature_threshold_keys(hass, entry)
+
+        # Migrate unique IDs if needed
+        await _async_migrate_unique_ids(hass, entry)
+
+        updated_record[STARTUP_MIGRATIONS_KEY_VERSION] = STARTUP_MIGRATIONS_VERSION
+    else:
+        logger.debug("Startup migrations are up to date, skipping")
+
+    fingerprint = _get_stale_entity_fingerprint(hass, entry, integration_version)
+    if record.get(STARTUP_MIGRATIONS_KEY_STALE_ENTITY_FINGERPRINT) != fingerprint:
+        # Remove registry entries for entities that no longer exist in this integration.
+        await _async_remove_stale_registry_entities(hass, entry)
+
+        updated_record[STARTUP_MIGRATIONS_KEY_STALE_ENTITY_FINGERPRINT] = fingerprint
+    else:
+        logger.debug("Covers and integration version unchanged, skipping stale entity-registry cleanup")
+
+    if updated_record != record:
+        coordinator.set_startup_migrations(updated_record)
+
+
 #
 # async_setup_entry
 #
@@ -598,7 +679,8 @@ async def async_setup_entry(
     - HA restart
 
     What this function does:
-    - Creates the coordinator
+    - Creates the coordinator and restores its persisted state
+    - Runs the startup migrations that are due
     - Merges config + options
     - Stores runtime data on the entry
     - Starts the coordinator
@@ -616,16 +698,19 @@ async def async_setup_entry(
     logger.info("Starting integration setup")
 
     try:
-        await _async_migrate_temperature_threshold_keys(hass, entry)
+        # Create the coordinator
+        coordinator = DataUpdateCoordinator(hass, entry)
 
-        # Migrate unique IDs if needed
-        await _async_migrate_unique_ids(hass, entry)
+        # Restore persisted state first: it records which startup migrations already ran
+        restore_result = coordinator.async_restore_runtime_state()
+        if isawaitable(restore_result):
+            await restore_result
 
-        # Remove registry entries for entities that no longer exist in this integration.
-        await _async_remove_stale_registry_entities(hass, entry)
+        integration = async_get_loaded_integration(hass, entry.domain)
+        await _async_run_startup_migrations(hass, entry, coordinator, str(getattr(integration, "version", "") or ""))
 
-        # Create the coordinator
-        coordinator = DataUpdateCoordinator(hass, entry)
+        # Migrations may have updated the options
+        coordinator.invalidate_resolved_settings()
 
         # Get configuration from options (all user settings are stored in options)
         merged_config = dict(getattr(entry, HA_OPTIONS, {}) or {})
@@ -636,13 +721,13 @@ async def async_setup_entry(
         # Store shared state
         entry.runtime_data = RuntimeData(
             coordinator,
-            async_get_loaded_integration(hass, entry.domain),
+            integration,
             merged_config,
         )
 
-        restore_result = coordinator.async_restore_runtime_state()
-        if isawaitable(restore_result):
-            await restore_result
+        # Drop runtime settings of external value entities that no longer exist
+        stale_runtime_setting_keys = {key for key in coordinator.runtime_setting_keys if _is_auto_managed_key(key)}
+        coordinator.discard_runtime_settings(stale_runtime_setting_keys - _get_valid_auto_managed_keys(hass, entry))
 
         # Track coordinator references for service handling
         domain_data = hass.data.setdefault(DOMAIN, {})
@@ -669,6 +754,9 @@ async def async_setup_entry(
         logger.debug("Starting initial coordinator refresh")
         await coordinator.async_config_entry_first_refresh()
 
+        # Re-evaluate as soon as covers, sun, or weather change
+        coordinator.async_start_state_tracking()
+
         # Register the update listener
         entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -729,6 +817,8 @@ async def async_unload_entry(
 
             if not coordinators:
                 domain_state.pop(DATA_COORDINATORS, None)
+                domain_state.pop(DATA_FORECAST_CACHE, None)
+                domain_state.pop(DATA_SENSOR_SNAPSHOT_HUB, None)
                 if not domain_state:
                     hass.data.pop(DOMAIN, None)
                 if hass.services.has_service(DOMAIN, SERVICE_LOGBOOK_ENTRY):
@@ -805,11 +895,16 @@ async def async_reload_entry(
             # Update the stored config with new values
             coordinator._merged_config = new_config
             entry.runtime_data.config = new_config
+            coordinator.invalidate_resolved_settings()
 
             # Trigger a coordinator refresh to apply the changes
             await coordinator.async_request_refresh()
             return
 
+        # The next setup reads the entry's own storage file only, so move the state there first
+        if ConfKeys.SHARED_STATE_STORAGE.value in changed_keys and not resolve(new_config).shared_state_storage:
+            await coordinator.async_move_runtime_state_to_entry_file()
+
     # For all other changes (structural, new keys, etc.), do a full reload
     logger.info(f"Reloading {INTEGRATION_NAME} integration")
     await hass.config_entries.async_reload(entry.entry_id)
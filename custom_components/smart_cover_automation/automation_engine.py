@@ -3,27 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
 from datetime import time as dt_time
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
-from homeassistant.helpers.sun import get_astral_event_date
 from homeassistant.util import dt as dt_util
 
 from . import const
 from .config import ResolvedConfig, resolve_effective_blocked_time_range_bounds
-from .cover_automation import CoverAutomation, CoverExecutionPlan, SensorData
+from .cover_automation import CoverAutomation, CoverExecutionPlan, CoverState, SensorData
+from .cover_command_scheduler import CoverCommandPriority, CoverCommandScheduler
 from .cover_position_history import CoverPositionHistoryManager, _movement_cause_for_legacy_reason_key
+from .cover_settings import PerCoverSettings, compile_per_cover_settings, compile_per_cover_settings_table
+from .cycle_timing import CycleStage, CycleTimings
 from .data import CoordinatorData
 from .log import Log
-from .movement import AutomationManagedState
+from .movement import AutomationManagedState, MovementControlReason, MovementDirection
+from .sun_ephemeris import get_daily_sun_ephemeris, get_sun_event_for_date
+from .sun_exposure import SunExposureWindow, compute_sun_exposure_windows
 
 if TYPE_CHECKING:
     from homeassistant.core import State
 
+    from .sensor_snapshot import SensorSnapshotHub
+
 
 @dataclass(slots=True)
 class WeatherSnapshot:
@@ -58,7 +66,25 @@ class ScheduledCoverExecution:
     execute_at: datetime
     generation: int
     plan_signature: tuple[int, Any, int | None]
-    task: asyncio.Task[None]
+
+
+@dataclass(slots=True, frozen=True)
+class IdleCoverEvaluation:
+    """Result of an evaluation that found nothing to do, plus the inputs it was based on."""
+
+    fingerprint: tuple[Any, ...]
+    cover_state: CoverState
+
+
+def _get_cover_command_priority(plan: CoverExecutionPlan) -> CoverCommandPriority:
+    """Return the dispatch priority of a queued cover execution."""
+
+    decision = plan.effective_movement_decision
+    if decision.direction == MovementDirection.CLOSING:
+        if decision.control_reason == MovementControlReason.HEAT_PROTECTION:
+            return CoverCommandPriority.HEAT_PROTECTION
+        return CoverCommandPriority.CLOSING
+    return CoverCommandPriority.OPENING
 
 
 class AutomationEngine:
@@ -73,8 +99,10 @@ class AutomationEngine:
         config: dict[str, Any],
         ha_interface: Any,
         logger: Log,
-        on_automation_managed_states_changed: Callable[[dict[str, dict[str, Any]]], None] | None = None,
+        on_automation_managed_states_changed: Callable[[dict[str, dict[str, Any] | None]], None] | None = None,
         on_current_day_temperature_extrema_changed: Callable[[dict[str, Any] | None], None] | None = None,
+        sensor_snapshot_hub: SensorSnapshotHub | None = None,
+        cycle_timings: CycleTimings | None = None,
     ) -> None:
         """Initialize the automation engine.
 
@@ -83,6 +111,8 @@ class AutomationEngine:
             config: Raw configuration dictionary
             ha_interface: Home Assistant interface for API interactions
             logger: Instance-specific logger with entry_id prefix
+            sensor_snapshot_hub: Optional hub sharing sensor reads across config entries (None reads directly)
+            cycle_timings: Timing statistics recording where the time of a cycle goes
         """
 
         self.resolved = resolved
@@ -91,6 +121,8 @@ class AutomationEngine:
         self._ha_interface = ha_interface
         self._logger = logger
         self._on_current_day_temperature_extrema_changed = on_current_day_temperature_extrema_changed
+        self._sensor_snapshot_hub = sensor_snapshot_hub
+        self._cycle_timings = cycle_timings if cycle_timings is not None else CycleTimings()
 
         # First run tracking
         self._first_run: bool = True  # Track first iteration to suppress startup warnings
@@ -103,9 +135,280 @@ class AutomationEngine:
         self._current_day_temperature_extrema: CurrentDayTemperatureExtrema | None = None
         self._disabled_time_range_state = DisabledTimeRangeState()
         self._pending_cover_executions: dict[str, ScheduledCoverExecution] = {}
+        self._command_scheduler = CoverCommandScheduler(lambda: self.resolved, logger)
         self._schedule_sequence = 0
         self._run_generation = 0
 
+        # Per-cover automation instances, reused across runs so per-cover caches survive
+        self._cover_automations: dict[str, CoverAutomation] = {}
+
+        # Idle evaluation results, reused while a cover's inputs are unchanged
+        self._idle_cover_evaluations: dict[str, IdleCoverEvaluation] = {}
+        self._logged_global_settings: tuple[ResolvedConfig, dt_time | None, dt_time | None] | None = (
+            None  # Settings of the last global settings log
+        )
+
+        # Per-cover settings compiled for the config revision they were built from
+        self._per_cover_settings: dict[str, PerCoverSettings] = {}
+        self._per_cover_settings_source: tuple[ResolvedConfig, dict[str, Any]] | None = None
+
+        # Per-cover sun-exposure windows for one day and config revision
+        self._sun_exposure_windows: dict[str, tuple[SunExposureWindow, ...]] = {}
+        self._sun_exposure_windows_source: tuple[date, ResolvedConfig, dict[str, Any]] | None = None
+
+    #
+    # _get_per_cover_settings
+    #
+    def _get_per_cover_settings(self, entity_id: str) -> PerCoverSettings:
+        """Return the compiled settings of one cover for the current config revision.
+
+        The table is rebuilt whenever the engine is handed a different resolved
+        config or raw config object, i.e. once per options revision.
+        """
+
+        source = self._per_cover_settings_source
+        if source is None or source[0] is not self.resolved or source[1] is not self.config:
+            self._per_cover_settings = compile_per_cover_settings_table(self.resolved.covers, self.resolved, self.config, self._logger)
+            self._per_cover_settings_source = (self.resolved, self.config)
+
+        settings = self._per_cover_settings.get(entity_id)
+        if settings is None:
+            settings = compile_per_cover_settings(entity_id, self.resolved, self.config, self._logger)
+            self._per_cover_settings[entity_id] = settings
+
+        return settings
+
+    #
+    # get_sun_exposure_windows
+    #
+    def get_sun_exposure_windows(self, target_date: date) -> dict[str, tuple[SunExposureWindow, ...]]:
+        """Return each cover's sun-exposure windows for one local date.
+
+        The windows are computed once per day and config revision from sun
+        positions sampled between sunrise and sunset.
+        """
+
+        source = self._sun_exposure_windows_source
+        if source is not None and source[0] == target_date and source[1] is self.resolved and source[2] is self.config:
+            return self._sun_exposure_windows
+
+        windows: dict[str, tuple[SunExposureWindow, ...]] = {}
+        ephemeris = get_daily_sun_ephemeris(self._ha_interface.hass, target_date)
+        if ephemeris.sunrise is not None and ephemeris.sunset is not None:
+            sample_times: list[datetime] = []
+            sample_time = ephemeris.sunrise
+            while sample_time < ephemeris.sunset:
+                sample_times.append(sample_time)
+                sample_time += const.SUN_EXPOSURE_SAMPLE_INTERVAL
+            sample_times.append(ephemeris.sunset)
+
+            sun_positions = self._ha_interface.get_sun_data_for_datetimes(sample_times)
+            for entity_id in self.resolved.covers:
+                windows[entity_id] = compute_sun_exposure_windows(self._get_per_cover_settings(entity_id), sample_times, sun_positions)
+
+        self._sun_exposure_windows = windows
+        self._sun_exposure_windows_source = (target_date, self.resolved, self.config)
+        return windows
+
+    #
+    # get_next_sun_exposure_change
+    #
+    def get_next_sun_exposure_change(self, now: datetime) -> datetime | None:
+        """Return the next time at which the sun starts or stops hitting any cover today."""
+
+        windows = self.get_sun_exposure_windows(dt_util.as_local(now).date())
+        boundaries = [
+            boundary
+            for cover_windows in windows.values()
+            for window in cover_windows
+            for boundary in (window.start, window.end)
+            if boundary > now
+        ]
+        return min(boundaries, default=None)
+
+    #
+    # get_next_deadline
+    #
+    def get_next_deadline(self, now: datetime) -> tuple[datetime, str] | None:
+        """Return the earliest upcoming time-based expiry and what it belongs to.
+
+        Considers the manual override expiry, delayed reopening and recent-action
+        drift window of every cover, plus the next evening closure, morning
+        opening and blocked time range start and end times. Reaching such a
+        deadline changes the automation outcome without any entity state
+        changing.
+        """
+
+        deadlines: list[tuple[datetime, str]] = []
+        history = self._cover_pos_history_mgr
+        for entity_id in self.resolved.covers:
+            if history.was_manual_override_blocking(entity_id):
+                latest_entry = history.get_latest_entry(entity_id)
+                if latest_entry is not None:
+                    expiry = latest_entry.timestamp + timedelta(seconds=self.resolved.manual_override_duration)
+                    deadlines.append((expiry, f"{entity_id} manual override expiry"))
+
+            delayed_reopen_action = history.get_delayed_reopen_action(entity_id)
+            if delayed_reopen_action is not None:
+                deadlines.append((delayed_reopen_action.reopen_at, f"{entity_id} delayed reopening"))
+
+            recent_automation_action = history.get_recent_automation_action(entity_id)
+            if recent_automation_action is not None:
+                deadlines.append((recent_automation_action.expires_at, f"{entity_id} recent automation drift window end"))
+
+        blocked_time_range_bounds = self._get_required_blocked_time_range_bounds() if self.resolved.automation_disabled_time_range else None
+        today = dt_util.as_local(now).date()
+        for target_date in (today, today + timedelta(days=1)):
+            evening_closure_time = self._get_evening_closure_time_for_date(target_date)
+            if evening_closure_time is not None:
+                deadlines.append((evening_closure_time, "evening closure"))
+            morning_opening_time = self._get_morning_opening_time_for_date(target_date)
+            if morning_opening_time is not None:
+                deadlines.append((morning_opening_time, "morning opening"))
+            if blocked_time_range_bounds is not None:
+                blocked_time_range_start, blocked_time_range_end = blocked_time_range_bounds
+                deadlines.append((self._get_local_datetime_for_date(target_date, blocked_time_range_start), "blocked time range start"))
+                deadlines.append((self._get_local_datetime_for_date(target_date, blocked_time_range_end), "blocked time range end"))
+
+        return min(((deadline, description) for deadline, description in deadlines if deadline > now), default=None)
+
+    #
+    # _get_cover_automation
+    #
+    def _get_cover_automation(self, entity_id: str) -> CoverAutomation:
+        """Return the persistent automation instance for one cover.
+
+        The instance is created on first use and kept across runs. When the
+        config revision changes, it is handed the new settings instead of being
+        rebuilt, so per-cover caches (e.g. tilt support) are preserved.
+        """
+
+        settings = self._get_per_cover_settings(entity_id)
+        cover_automation = self._cover_automations.get(entity_id)
+        if cover_automation is None:
+            cover_automation = CoverAutomation(
+                entity_id=entity_id,
+                resolved=self.resolved,
+                config=self.config,
+                cover_pos_history_mgr=self._cover_pos_history_mgr,
+                ha_interface=self._ha_interface,
+                logger=self._logger,
+                settings=settings,
+                cycle_timings=self._cycle_timings,
+            )
+            self._cover_automations[entity_id] = cover_automation
+        else:
+            cover_automation.resolved = self.resolved
+            cover_automation.config = self.config
+            cover_automation.settings = settings
+
+        return cover_automation
+
+    #
+    # _prune_cover_automations
+    #
+    def _prune_cover_automations(self, configured_covers: tuple[str, ...]) -> None:
+        """Drop automation instances of covers that are no longer configured."""
+
+        configured_cover_ids = set(configured_covers)
+        for entity_id in tuple(self._cover_automations):
+            if entity_id not in configured_cover_ids:
+                del self._cover_automations[entity_id]
+        for entity_id in tuple(self._idle_cover_evaluations):
+            if entity_id not in configured_cover_ids:
+                del self._idle_cover_evaluations[entity_id]
+        self._cycle_timings.forget_covers(configured_cover_ids)
+
+    #
+    # _get_cover_input_fingerprint
+    #
+    def _get_cover_input_fingerprint(self, entity_id: str, state: State | None, sensor_data: SensorData) -> tuple[Any, ...] | None:
+        """Return a fingerprint of everything an idle cover evaluation depends on.
+
+        Returns None when the cover must be evaluated regardless, e.g., while a
+        time-based expiry (manual override, delayed reopen, recent-action drift
+        window) is pending or a lock mode is active.
+        """
+
+        if state is None or sensor_data.sun_samples is not None or self.resolved.lock_mode != const.LockMode.UNLOCKED:
+            return None
+
+        history = self._cover_pos_history_mgr
+        if (
+            entity_id in self._pending_cover_executions
+            or history.was_manual_override_blocking(entity_id)
+            or history.get_delayed_reopen_action(entity_id) is not None
+            or history.get_recent_automation_action(entity_id) is not None
+        ):
+            return None
+
+        window_sensors = self.config.get(f"{entity_id}_{const.COVER_SFX_WINDOW_SENSORS}")
+        window_sensor_states = (
+            tuple(self._ha_interface.get_entity_state(sensor_id) for sensor_id in window_sensors)
+            if isinstance(window_sensors, list)
+            else ()
+        )
+        quantum = const.COVER_EVALUATION_SUN_QUANTUM
+
+        return (
+            state.last_updated,
+            round(sensor_data.sun_azimuth / quantum),
+            round(sensor_data.sun_elevation / quantum),
+            sensor_data.temp_max,
+            sensor_data.temp_min,
+            sensor_data.temp_hot,
+            sensor_data.weather_condition,
+            sensor_data.weather_sunny,
+            sensor_data.evening_closure,
+            sensor_data.post_evening_closure,
+            sensor_data.has_valid_external_evening_closure_time,
+            sensor_data.has_valid_external_morning_opening_time,
+            sensor_data.ignore_weather_external_controls,
+            sensor_data.pre_closing,
+            self.resolved,
+            self.config,
+            history.get_closed_by_automation_reason(entity_id),
+            history.get_automation_managed_state(entity_id),
+            window_sensor_states,
+        )
+
+    #
+    # _reuse_idle_cover_evaluation
+    #
+    def _reuse_idle_cover_evaluation(self, entity_id: str, state: State | None, sensor_data: SensorData) -> CoverState | None:
+        """Return the previous idle result if the cover's inputs are unchanged."""
+
+        idle_evaluation = self._idle_cover_evaluations.get(entity_id)
+        if idle_evaluation is None or idle_evaluation.fingerprint != self._get_cover_input_fingerprint(entity_id, state, sensor_data):
+            return None
+
+        # Record the position like the skipped evaluation would have, so manual
+        # override detection keeps measuring from the most recent check
+        cover_state = idle_evaluation.cover_state
+        if cover_state.pos_current is not None:
+            self._cover_pos_history_mgr.add(entity_id, cover_state.pos_current, cover_moved=False, tilt_position=cover_state.tilt_current)
+        return replace(cover_state)
+
+    #
+    # _remember_cover_evaluation
+    #
+    def _remember_cover_evaluation(
+        self,
+        entity_id: str,
+        cover_automation: CoverAutomation,
+        state: State | None,
+        sensor_data: SensorData,
+        cover_state: CoverState,
+    ) -> None:
+        """Keep an idle evaluation result for reuse, or forget the previous one."""
+
+        fingerprint = self._get_cover_input_fingerprint(entity_id, state, sensor_data) if cover_automation.last_evaluation_idle else None
+        if fingerprint is None:
+            self._idle_cover_evaluations.pop(entity_id, None)
+            return
+
+        self._idle_cover_evaluations[entity_id] = IdleCoverEvaluation(fingerprint=fingerprint, cover_state=replace(cover_state))
+
     def _get_effective_blocked_time_range_bounds(self) -> tuple[dt_time | None, dt_time | None]:
         """Return the effective blocked-time boundaries for the active mode."""
 
@@ -225,8 +528,10 @@ class AutomationEngine:
     def cancel_pending_cover_executions(self) -> None:
         """Cancel all queued staggered cover executions."""
 
-        for entity_id in tuple(self._pending_cover_executions):
-            self._cancel_pending_cover_execution(entity_id, "automation context ended")
+        if self._pending_cover_executions:
+            self._logger.debug(f"Cancelled {len(self._pending_cover_executions)} queued cover executions: automation context ended")
+            self._pending_cover_executions.clear()
+        self._command_scheduler.cancel_all()
 
     #
     # run
@@ -273,7 +578,8 @@ class AutomationEngine:
             return result
 
         # Gather sensor data
-        sensor_data, message = await self._gather_sensor_data(is_first_run)
+        with self._cycle_timings.measure(CycleStage.SENSOR_DATA):
+            sensor_data, message = await self._gather_sensor_data(is_first_run)
         if sensor_data is None:
             self.cancel_pending_cover_executions()
             # Critical data unavailable, automation canceled
@@ -298,56 +604,19 @@ class AutomationEngine:
         result.weather_sunny = sensor_data.weather_sunny
 
         # Log sensor states
-        sensor_states = {
-            "sun_azimuth": result.sun_azimuth,
-            "sun_elevation": result.sun_elevation,
-            "temp_current_max": result.temp_current_max,
-            "temp_current_min": result.temp_current_min,
-            "temp_hot": result.temp_hot,
-            "weather_sunny": result.weather_sunny,
-        }
-        self._logger.info(f"Sensor states: {str(sensor_states)}")
-
-        # Log global settings
-        blocked_time_range_start, blocked_time_range_end = self._get_effective_blocked_time_range_bounds()
-        global_settings = {
-            "lock_mode": lock_mode,
-            "heat_protection_mode": self.resolved.heat_protection_mode,
-            "automatic_reopening_mode": self.resolved.automatic_reopening_mode,
-            "covers_min_closure": self.resolved.covers_min_closure,
-            "covers_max_closure": self.resolved.covers_max_closure,
-            "evening_closure_max_closure": self.resolved.evening_closure_max_closure,
-            "covers_min_position_delta": self.resolved.covers_min_position_delta,
-            "sun_azimuth_tolerance": self.resolved.sun_azimuth_tolerance,
-            "sun_elevation_threshold": self.resolved.sun_elevation_threshold,
-            "daily_max_temperature_threshold": self.resolved.daily_max_temperature_threshold,
-            "daily_min_temperature_threshold": self.resolved.daily_min_temperature_threshold,
-            "manual_override_duration": self.resolved.manual_override_duration,
-            "automation_disabled_time_range": self.resolved.automation_disabled_time_range,
-            "automation_disabled_time_range_mode": self.resolved.automation_disabled_time_range_mode,
-            "automation_disabled_time_range_start": (
-                blocked_time_range_start.strftime("%H:%M:%S") if blocked_time_range_start is not None else None
-            ),
-            "automation_disabled_time_range_end": (
-                blocked_time_range_end.strftime("%H:%M:%S") if blocked_time_range_end is not None else None
-            ),
-            "automation_disabled_time_range_pre_close_enabled": self.resolved.automation_disabled_time_range_pre_close_enabled,
-            "evening_closure_enabled": self.resolved.evening_closure_enabled,
-            "evening_closure_mode": self.resolved.evening_closure_mode,
-            "evening_closure_time": self.resolved.evening_closure_time.strftime("%H:%M:%S"),
-            "evening_closure_ignore_manual_override_duration": self.resolved.evening_closure_ignore_manual_override_duration,
-            "morning_opening_mode": self.resolved.morning_opening_mode,
-            "morning_opening_time": self.resolved.morning_opening_time.strftime("%H:%M:%S"),
-            "tilt_mode_day": self.resolved.tilt_mode_day,
-            "tilt_mode_night": self.resolved.tilt_mode_night,
-            "tilt_set_value_day": self.resolved.tilt_set_value_day,
-            "tilt_set_value_night": self.resolved.tilt_set_value_night,
-            "tilt_min_change_delta": self.resolved.tilt_min_change_delta,
-            "tilt_open_to_cover_open_delay": self.resolved.tilt_open_to_cover_open_delay,
-            "tilt_slat_overlap_ratio": self.resolved.tilt_slat_overlap_ratio,
-            "cover_movement_stagger_delay": self.resolved.cover_movement_stagger_delay,
-        }
-        self._logger.info(f"Global settings: {str(global_settings)}")
+        if self._logger.isEnabledFor(logging.INFO):
+            sensor_states = {
+                "sun_azimuth": result.sun_azimuth,
+                "sun_elevation": result.sun_elevation,
+                "temp_current_max": result.temp_current_max,
+                "temp_current_min": result.temp_current_min,
+                "temp_hot": result.temp_hot,
+                "weather_sunny": result.weather_sunny,
+            }
+            self._logger.info(f"Sensor states: {str(sensor_states)}")
+
+        # Log global settings (only when they changed)
+        self._log_global_settings()
 
         # Log lock state if active
         if is_locked:
@@ -389,39 +658,80 @@ class AutomationEngine:
         sensor_data: SensorData,
         result: CoordinatorData,
     ) -> None:
-        """Process one sensor snapshot across all configured covers."""
+        """Process one sensor snapshot across all configured covers.
+
+        With batched logbook entries enabled, the movements of this run are
+        logged together at its end. Staggered movements executed later are
+        logged individually.
+        """
+
+        if not self.resolved.logbook_batch_entries:
+            await self._evaluate_and_move_covers(covers, cover_states, sensor_data, result)
+            return
+
+        self._ha_interface.begin_logbook_batch()
+        try:
+            await self._evaluate_and_move_covers(covers, cover_states, sensor_data, result)
+        finally:
+            await self._ha_interface.async_flush_logbook_batch()
+
+    #
+    # _evaluate_and_move_covers
+    #
+    async def _evaluate_and_move_covers(
+        self,
+        covers: tuple[str, ...],
+        cover_states: dict[str, State | None],
+        sensor_data: SensorData,
+        result: CoordinatorData,
+    ) -> None:
+        """Evaluate all covers and execute, schedule or dispatch their movements.
+
+        With rate limiting enabled, all movements are queued and dispatched by
+        the command scheduler, which paces them per command group. With grouped
+        service calls enabled (and neither staggering nor rate limiting), the
+        plans of this run are executed together and covers with identical
+        targets are commanded with one service call.
+        """
 
         stagger_delay = max(0, self.resolved.cover_movement_stagger_delay)
-        if stagger_delay <= 0:
+        rate_limited = self.resolved.cover_movement_rate_limit > 0
+        if stagger_delay <= 0 and not rate_limited:
             self.cancel_pending_cover_executions()
 
+            max_concurrency = max(1, self.resolved.cover_movement_max_concurrency)
+            if max_concurrency > 1 or self.resolved.cover_movement_group_service_calls:
+                await self._process_covers_concurrently(covers, cover_states, sensor_data, result, max_concurrency)
+                self._prune_cover_automations(covers)
+                return
+
         self._run_generation += 1
         run_generation = self._run_generation
         actionable_index = 0
 
         for entity_id in covers:
             state = cover_states.get(entity_id)
-            cover_automation = CoverAutomation(
-                entity_id=entity_id,
-                resolved=self.resolved,
-                config=self.config,
-                cover_pos_history_mgr=self._cover_pos_history_mgr,
-                ha_interface=self._ha_interface,
-                logger=self._logger,
-            )
+            cover_automation = self._get_cover_automation(entity_id)
+
+            idle_cover_state = self._reuse_idle_cover_evaluation(entity_id, state, sensor_data)
+            if idle_cover_state is not None:
+                result.covers[entity_id] = idle_cover_state
+                continue
 
-            if stagger_delay <= 0:
+            if stagger_delay <= 0 and not rate_limited:
                 result.covers[entity_id] = await cover_automation.process(state, sensor_data)
+                self._remember_cover_evaluation(entity_id, cover_automation, state, sensor_data, result.covers[entity_id])
                 continue
 
             cover_attrs, plan, _ownership_debug_snapshot = await cover_automation.evaluate(state, sensor_data)
             result.covers[entity_id] = cover_attrs
+            self._remember_cover_evaluation(entity_id, cover_automation, state, sensor_data, cover_attrs)
 
             if plan is None:
                 self._cancel_pending_cover_execution(entity_id, "no queued action remains valid")
                 continue
 
-            if actionable_index == 0:
+            if actionable_index == 0 and not rate_limited:
                 self._cancel_pending_cover_execution(entity_id, "replaced by immediate execution")
                 result.covers[entity_id] = await cover_automation.execute_plan(plan)
             else:
@@ -431,6 +741,71 @@ class AutomationEngine:
             actionable_index += 1
 
         self._cancel_pending_cover_executions_for_removed_covers(covers)
+        self._prune_cover_automations(covers)
+
+    async def _process_covers_concurrently(
+        self,
+        covers: tuple[str, ...],
+        cover_states: dict[str, State | None],
+        sensor_data: SensorData,
+        result: CoordinatorData,
+        max_concurrency: int,
+    ) -> None:
+        """Evaluate all covers, then execute their plans with bounded concurrency.
+
+        Evaluation runs sequentially in configuration order. The resulting plans
+        are dispatched in parallel, with at most ``max_concurrency`` covers being
+        commanded at the same time, so a single slow cover or backend does not
+        delay all covers behind it. Failures are contained per cover.
+
+        With grouped service calls enabled, all plans are executed together in
+        one service call batch instead, so covers with identical targets are
+        commanded at once. The concurrency limit does not apply then.
+        """
+
+        pending_plans: list[tuple[str, CoverAutomation, CoverExecutionPlan]] = []
+        for entity_id in covers:
+            state = cover_states.get(entity_id)
+            idle_cover_state = self._reuse_idle_cover_evaluation(entity_id, state, sensor_data)
+            if idle_cover_state is not None:
+                result.covers[entity_id] = idle_cover_state
+                continue
+
+            cover_automation = self._get_cover_automation(entity_id)
+            cover_state, plan, ownership_debug_snapshot = await cover_automation.evaluate(state, sensor_data)
+            result.covers[entity_id] = cover_state
+            self._remember_cover_evaluation(entity_id, cover_automation, state, sensor_data, cover_state)
+
+            if plan is None:
+                cover_automation.log_no_movement_result(cover_state, ownership_debug_snapshot)
+                continue
+
+            pending_plans.append((entity_id, cover_automation, plan))
+
+        if not pending_plans:
+            return
+
+        async def _execute(entity_id: str, cover_automation: CoverAutomation, plan: CoverExecutionPlan) -> None:
+            try:
+                result.covers[entity_id] = await cover_automation.execute_plan(plan)
+            except Exception as err:
+                self._logger.error(f"[{entity_id}] Failed cover execution: {err}")
+
+        if self.resolved.cover_movement_group_service_calls:
+            await self._ha_interface.async_run_service_call_batch(
+                [_execute(entity_id, cover_automation, plan) for entity_id, cover_automation, plan in pending_plans]
+            )
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _execute_bounded(entity_id: str, cover_automation: CoverAutomation, plan: CoverExecutionPlan) -> None:
+            async with semaphore:
+                await _execute(entity_id, cover_automation, plan)
+
+        await asyncio.gather(
+            *(_execute_bounded(entity_id, cover_automation, plan) for entity_id, cover_automation, plan in pending_plans)
+        )
 
     async def _run_blocked_time_range_pre_close(
         self,
@@ -610,15 +985,26 @@ class AutomationEngine:
         delay_seconds = max(0.0, (execute_at - dt_util.utcnow()).total_seconds())
         self._schedule_sequence += 1
         schedule_id = self._schedule_sequence
-        task = asyncio.create_task(self._run_pending_cover_execution(entity_id, schedule_id, cover_automation, plan, delay_seconds))
         self._pending_cover_executions[entity_id] = ScheduledCoverExecution(
             schedule_id=schedule_id,
             execute_at=execute_at,
             generation=generation,
             plan_signature=plan.signature,
-            task=task,
         )
-        self._logger.info("[%s] Queued cover execution in %.0f s", entity_id, delay_seconds)
+
+        # Command groups only matter while rate limiting is enabled
+        group = None
+        if self.resolved.cover_movement_rate_limit > 0:
+            group = self._ha_interface.get_cover_command_group(entity_id, self.resolved.cover_movement_rate_limit_scope)
+
+        self._command_scheduler.schedule(
+            entity_id,
+            group,
+            _get_cover_command_priority(plan),
+            delay_seconds,
+            partial(self._run_pending_cover_execution, entity_id, schedule_id, cover_automation, plan),
+        )
+        self._logger.info(f"[{entity_id}] Queued cover execution in {delay_seconds:.0f} s")
 
     async def _run_pending_cover_execution(
         self,
@@ -626,14 +1012,8 @@ class AutomationEngine:
         schedule_id: int,
         cover_automation: CoverAutomation,
         plan: CoverExecutionPlan,
-        delay_seconds: float,
     ) -> None:
-        """Run one delayed cover execution if it is still the active queued job."""
-
-        try:
-            await asyncio.sleep(delay_seconds)
-        except asyncio.CancelledError:
-            return
+        """Run one queued cover execution if it is still the active queued job."""
 
         scheduled = self._pending_cover_executions.get(entity_id)
         if scheduled is None or scheduled.schedule_id != schedule_id:
@@ -643,7 +1023,7 @@ class AutomationEngine:
         try:
             await cover_automation.execute_plan(plan)
         except Exception as err:
-            self._logger.error("[%s] Failed queued cover execution: %s", entity_id, err)
+            self._logger.error(f"[{entity_id}] Failed queued cover execution: {err}")
 
     def _cancel_pending_cover_execution(self, entity_id: str, reason: str) -> None:
         """Cancel one queued cover execution if it exists."""
@@ -652,8 +1032,8 @@ class AutomationEngine:
         if scheduled is None:
             return
 
-        scheduled.task.cancel()
-        self._logger.debug("[%s] Cancelled queued cover execution: %s", entity_id, reason)
+        self._command_scheduler.cancel(entity_id)
+        self._logger.debug(f"[{entity_id}] Cancelled queued cover execution: {reason}")
 
     def _cancel_pending_cover_executions_for_removed_covers(self, configured_covers: tuple[str, ...]) -> None:
         """Cancel queued executions that belong to covers no longer configured."""
@@ -663,6 +1043,66 @@ class AutomationEngine:
             if entity_id not in configured_cover_ids:
                 self._cancel_pending_cover_execution(entity_id, "cover no longer configured")
 
+    #
+    # _log_global_settings
+    #
+    def _log_global_settings(self) -> None:
+        """Log the global settings at INFO level when they differ from the last logged ones."""
+
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+
+        blocked_time_range_start, blocked_time_range_end = self._get_effective_blocked_time_range_bounds()
+        logged_settings = (self.resolved, blocked_time_range_start, blocked_time_range_end)
+        if logged_settings == self._logged_global_settings:
+            return
+        self._logged_global_settings = logged_settings
+
+        global_settings = {
+            "lock_mode": self.resolved.lock_mode,
+            "heat_protection_mode": self.resolved.heat_protection_mode,
+            "automatic_reopening_mode": self.resolved.automatic_reopening_mode,
+            "covers_min_closure": self.resolved.covers_min_closure,
+            "covers_max_closure": self.resolved.covers_max_closure,
+            "evening_closure_max_closure": self.resolved.evening_closure_max_closure,
+            "covers_min_position_delta": self.resolved.covers_min_position_delta,
+            "sun_azimuth_tolerance": self.resolved.sun_azimuth_tolerance,
+            "sun_elevation_threshold": self.resolved.sun_elevation_threshold,
+            "daily_max_temperature_threshold": self.resolved.daily_max_temperature_threshold,
+            "daily_min_temperature_threshold": self.resolved.daily_min_temperature_threshold,
+            "manual_override_duration": self.resolved.manual_override_duration,
+            "automation_disabled_time_range": self.resolved.automation_disabled_time_range,
+            "automation_disabled_time_range_mode": self.resolved.automation_disabled_time_range_mode,
+            "automation_disabled_time_range_start": (
+                blocked_time_range_start.strftime("%H:%M:%S") if blocked_time_range_start is not None else None
+            ),
+            "automation_disabled_time_range_end": (
+                blocked_time_range_end.strftime("%H:%M:%S") if blocked_time_range_end is not None else None
+            ),
+            "automation_disabled_time_range_pre_close_enabled": self.resolved.automation_disabled_time_range_pre_close_enabled,
+            "evening_closure_enabled": self.resolved.evening_closure_enabled,
+            "evening_closure_mode": self.resolved.evening_closure_mode,
+            "evening_closure_time": self.resolved.evening_closure_time.strftime("%H:%M:%S"),
+            "evening_closure_ignore_manual_override_duration": self.resolved.evening_closure_ignore_manual_override_duration,
+            "morning_opening_mode": self.resolved.morning_opening_mode,
+            "morning_opening_time": self.resolved.morning_opening_time.strftime("%H:%M:%S"),
+            "tilt_mode_day": self.resolved.tilt_mode_day,
+            "tilt_mode_night": self.resolved.tilt_mode_night,
+            "tilt_set_value_day": self.resolved.tilt_set_value_day,
+            "tilt_set_value_night": self.resolved.tilt_set_value_night,
+            "tilt_min_change_delta": self.resolved.tilt_min_change_delta,
+            "tilt_open_to_cover_open_delay": self.resolved.tilt_open_to_cover_open_delay,
+            "tilt_slat_overlap_ratio": self.resolved.tilt_slat_overlap_ratio,
+            "cover_movement_stagger_delay": self.resolved.cover_movement_stagger_delay,
+            "cover_movement_max_concurrency": self.resolved.cover_movement_max_concurrency,
+            "cover_movement_group_service_calls": self.resolved.cover_movement_group_service_calls,
+            "cover_movement_rate_limit": self.resolved.cover_movement_rate_limit,
+            "cover_movement_rate_limit_burst": self.resolved.cover_movement_rate_limit_burst,
+            "cover_movement_rate_limit_scope": self.resolved.cover_movement_rate_limit_scope,
+            "logbook_batch_entries": self.resolved.logbook_batch_entries,
+        }
+        self._logger.info(f"Global settings: {str(global_settings)}")
+
     #
     # _gather_sensor_data
     #
@@ -678,9 +1118,16 @@ class AutomationEngine:
         from .coordinator import SunSensorNotFoundError
         from .ha_interface import InvalidSensorReadingError, WeatherEntityNotFoundError
 
+        # Read the shared inputs once for all entries using the same weather entity. The hub
+        # fetches the forecast with its own interface, so the wait is recorded here instead.
+        snapshot = None
+        if self._sensor_snapshot_hub is not None:
+            with self._cycle_timings.measure(CycleStage.FORECAST):
+                snapshot = await self._sensor_snapshot_hub.async_get_snapshot(self.resolved.weather_entity_id)
+
         # Get sun data
         try:
-            sun_azimuth, sun_elevation = self._ha_interface.get_sun_data()
+            sun_azimuth, sun_elevation = snapshot.get_sun_data() if snapshot is not None else self._ha_interface.get_sun_data()
         except SunSensorNotFoundError:
             # SunSensorNotFoundError should propagate as it's critical
             raise
@@ -706,7 +1153,12 @@ class AutomationEngine:
         temperature_available = temp_max is not None
 
         try:
-            forecast_temp_max, forecast_temp_min = await self._ha_interface.get_daily_temperature_extrema(self.resolved.weather_entity_id)
+            if snapshot is not None:
+                forecast_temp_max, forecast_temp_min = snapshot.get_daily_temperature_extrema()
+            else:
+                forecast_temp_max, forecast_temp_min = await self._ha_interface.get_daily_temperature_extrema(
+                    self.resolved.weather_entity_id
+                )
             temp_max, temp_min = self._set_current_day_temperature_extrema(current_day, forecast_temp_max, forecast_temp_min)
             self._weather_snapshot.temp_max = temp_max
             self._weather_snapshot.temp_min = temp_min
@@ -729,7 +1181,10 @@ class AutomationEngine:
         condition_available = weather_condition is not None
 
         try:
-            weather_condition = self._ha_interface.get_weather_condition(self.resolved.weather_entity_id)
+            if snapshot is not None:
+                weather_condition = snapshot.get_weather_condition()
+            else:
+                weather_condition = self._ha_interface.get_weather_condition(self.resolved.weather_entity_id)
             self._weather_snapshot.weather_condition = weather_condition
             condition_available = True
         except InvalidSensorReadingError, WeatherEntityNotFoundError:
@@ -920,7 +1375,7 @@ class AutomationEngine:
             return self._get_local_datetime_for_date(target_date, resolved_time)
 
         # Relative sunset modes: sunset +/- configured delay
-        sunset_time = get_astral_event_date(self._ha_interface.hass, SUN_EVENT_SUNSET, target_date)
+        sunset_time = get_sun_event_for_date(self._ha_interface.hass, SUN_EVENT_SUNSET, target_date)
         if sunset_time is None:
             self._logger.debug("Could not determine sunset time for %s", target_date.isoformat())
             return None
@@ -959,7 +1414,7 @@ class AutomationEngine:
 
             return self._get_local_datetime_for_date(target_date, resolved_time)
 
-        sunrise_time = get_astral_event_date(self._ha_interface.hass, SUN_EVENT_SUNRISE, target_date)
+        sunrise_time = get_sun_event_for_date(self._ha_interface.hass, SUN_EVENT_SUNRISE, target_date)
         if sunrise_time is None:
             self._logger.debug("Could not determine sunrise time for %s", target_date.isoformat())
             return None
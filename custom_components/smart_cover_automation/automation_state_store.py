@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from typing import Any, ClassVar
 
 from homeassistant.helpers.storage import Store
@@ -11,23 +13,273 @@ from . import const
 from .log import Log
 
 
+@dataclass(frozen=True, slots=True)
+class RestoredAutomationState:
+    """Validated runtime state loaded from persistent storage."""
+
+    automation_managed_states: dict[str, dict[str, Any]]
+    closed_markers: dict[str, str]
+    current_day_temperature_extrema: dict[str, Any] | None
+    runtime_settings: dict[str, Any]
+    startup_migrations: dict[str, Any]
+
+
+def _parse_closed_markers(data: Mapping[str, Any]) -> dict[str, str]:
+    """Return the valid automation-closed markers of a persisted payload."""
+
+    raw_markers = data.get(const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS)
+    if not isinstance(raw_markers, dict):
+        return {}
+
+    return {
+        entity_id: reason_key for entity_id, reason_key in raw_markers.items() if isinstance(entity_id, str) and isinstance(reason_key, str)
+    }
+
+
+def _parse_automation_managed_states(data: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
+    """Return the valid automation-managed states of a persisted payload."""
+
+    raw_states = data.get(const.STORAGE_KEY_AUTOMATION_MANAGED_STATES)
+    if not isinstance(raw_states, dict):
+        return {}
+
+    loaded: dict[str, dict[str, Any]] = {}
+    for entity_id, payload in raw_states.items():
+        if not isinstance(entity_id, str) or not isinstance(payload, dict):
+            continue
+        loaded[entity_id] = dict(payload)
+
+    return loaded
+
+
+def _parse_current_day_temperature_extrema(data: Mapping[str, Any]) -> dict[str, Any] | None:
+    """Return the valid current-day temperature extrema of a persisted payload."""
+
+    raw_extrema = data.get(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA)
+    if not isinstance(raw_extrema, dict):
+        return None
+
+    raw_date = raw_extrema.get("date")
+    raw_temp_max = raw_extrema.get("temp_max")
+    raw_temp_min = raw_extrema.get("temp_min")
+    if not isinstance(raw_date, str) or not isinstance(raw_temp_max, int | float):
+        return None
+    if raw_temp_min is not None and not isinstance(raw_temp_min, int | float):
+        return None
+
+    return {
+        "date": raw_date,
+        "temp_max": float(raw_temp_max),
+        "temp_min": float(raw_temp_min) if raw_temp_min is not None else None,
+    }
+
+
+def _parse_runtime_settings(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the valid runtime settings of a persisted payload."""
+
+    raw_settings = data.get(const.STORAGE_KEY_RUNTIME_SETTINGS)
+    if not isinstance(raw_settings, dict):
+        return {}
+
+    return {key: value for key, value in raw_settings.items() if isinstance(key, str) and isinstance(value, bool | int | float | str)}
+
+
+def _parse_startup_migrations(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the startup migration record of a persisted payload."""
+
+    raw_record = data.get(const.STORAGE_KEY_STARTUP_MIGRATIONS)
+    if not isinstance(raw_record, dict):
+        return {}
+
+    return {key: value for key, value in raw_record.items() if isinstance(key, str)}
+
+
+class SharedAutomationStateStore:
+    """Persist the runtime state of several config entries in one storage file.
+
+    Each config entry owns one section of the file. Entries hand in a payload
+    builder when their state changes; a single debounced writer calls the
+    pending builders once per flush and writes the whole file.
+
+    If the file cannot be loaded, the store becomes read-only so the sections
+    it failed to load are never overwritten.
+    """
+
+    def __init__(self, hass: Any) -> None:
+        """Initialize the shared store."""
+
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            const.STORAGE_VERSION,
+            f"{const.DOMAIN}.{const.STORAGE_KEY_AUTOMATION_STATE}",
+        )
+        self._sections: dict[str, dict[str, Any]] | None = None
+        self._pending_builders: dict[str, Callable[[], dict[str, Any]]] = {}
+        self._load_lock = asyncio.Lock()
+        self._read_only = False
+        self._logger = Log()
+
+    @property
+    def read_only(self) -> bool:
+        """Return whether the file failed to load and is therefore never written."""
+
+        return self._read_only
+
+    async def _async_ensure_loaded(self) -> dict[str, dict[str, Any]]:
+        """Load the storage file once, even when several entries set up concurrently."""
+
+        async with self._load_lock:
+            if self._sections is None:
+                try:
+                    loaded_data = await self._store.async_load()
+                except (AttributeError, OSError, TypeError, ValueError) as err:
+                    self._logger.warning("Failed to load shared persisted automation state; not writing it until restart: %s", err)
+                    loaded_data = None
+                    self._read_only = True
+                    self._pending_builders.clear()
+
+                self._sections = (
+                    {entry_id: dict(section) for entry_id, section in loaded_data.items() if isinstance(section, dict)}
+                    if isinstance(loaded_data, dict)
+                    else {}
+                )
+
+                # Saves requested before the file was loaded were deferred
+                if self._pending_builders:
+                    self._schedule_save()
+
+        return self._sections
+
+    def _build_save_payload(self) -> dict[str, Any]:
+        """Apply the pending entry payloads and return the full file content."""
+
+        sections = self._sections if self._sections is not None else {}
+        pending_builders, self._pending_builders = self._pending_builders, {}
+        for entry_id, builder in pending_builders.items():
+            sections[entry_id] = builder()
+        self._sections = sections
+
+        return {entry_id: dict(section) for entry_id, section in sections.items()}
+
+    async def async_load_entry(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the persisted section of a config entry, or None if it has none."""
+
+        sections = await self._async_ensure_loaded()
+        section = sections.get(entry_id)
+        return dict(section) if section is not None else None
+
+    def schedule_save_entry(self, entry_id: str, builder: Callable[[], dict[str, Any]]) -> None:
+        """Schedule a delayed write with the section built by the given callable."""
+
+        if self._read_only:
+            return
+
+        self._pending_builders[entry_id] = builder
+
+        # Writing before the file is loaded would drop the sections of other entries
+        if self._sections is not None:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule a delayed write of the file."""
+
+        try:
+            self._store.async_delay_save(self._build_save_payload, const.STORAGE_SAVE_DELAY_SECONDS)
+        except (AttributeError, OSError, TypeError, ValueError) as err:
+            self._logger.warning("Failed to schedule shared persisted automation state save: %s", err)
+
+    async def async_save_entry(self, entry_id: str, payload: dict[str, Any]) -> bool:
+        """Immediately write the file with the given section of a config entry; return whether it succeeded."""
+
+        await self._async_ensure_loaded()
+        if self._read_only:
+            return False
+
+        self._pending_builders[entry_id] = lambda: payload
+        return await self._async_save()
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Remove the section of a config entry and write the file."""
+
+        sections = await self._async_ensure_loaded()
+        if self._read_only:
+            return
+
+        self._pending_builders.pop(entry_id, None)
+        if sections.pop(entry_id, None) is None:
+            return
+
+        await self._async_save()
+
+    async def _async_save(self) -> bool:
+        """Write the file, including all pending entry payloads; return whether it succeeded."""
+
+        try:
+            await self._store.async_save(self._build_save_payload())
+        except (AttributeError, OSError, TypeError, ValueError) as err:
+            self._logger.warning("Failed to persist shared automation state: %s", err)
+            return False
+
+        return True
+
+
+def get_shared_automation_state_store(hass: Any) -> SharedAutomationStateStore:
+    """Return the shared automation state store of this integration, creating it on first use.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        The shared store.
+    """
+
+    domain_data = hass.data.setdefault(const.DOMAIN, {})
+    shared_store = domain_data.get(const.DATA_SHARED_STATE_STORE)
+    if shared_store is None:
+        shared_store = domain_data[const.DATA_SHARED_STATE_STORE] = SharedAutomationStateStore(hass)
+    return shared_store
+
+
 class AutomationStateStore:
-    """Persist automation state that must survive Home Assistant restarts."""
+    """Persist automation state that must survive Home Assistant restarts.
+
+    The store keeps the persisted payload cached in memory. Updates are diffed
+    against the cache section by section (and entry by entry for the
+    automation-managed states), so unchanged content never schedules a write.
+    Delayed saves are coalesced by the underlying Store; the payload is built
+    once per flush, not once per update.
+
+    With shared storage enabled, the payload is kept as this entry's section of
+    the integration-wide SharedAutomationStateStore instead of a file of its
+    own. The entry's own file is moved into the shared file on the first load
+    in shared mode, and back by async_move_to_entry_file before the setting is
+    turned off; in entry mode, the shared file is never touched.
+    While the shared file is read-only after a failed load, the entry keeps
+    using its own file.
+    """
 
     _fallback_storage: ClassVar[dict[str, dict[str, Any]]] = {}
 
-    def __init__(self, hass: Any, entry_id: str) -> None:
-        """Initialize the store for one config entry."""
+    def __init__(self, hass: Any, entry_id: str, *, shared: bool = False) -> None:
+        """Initialize the store for one config entry.
 
+        Args:
+            hass: Home Assistant instance
+            entry_id: ID of the config entry
+            shared: Whether to keep the state in the integration-wide storage file
+        """
+
+        self._hass = hass
         self._entry_id = entry_id
+        self._shared = shared
+        self._shared_store: SharedAutomationStateStore | None = None
         self._logger = Log(entry_id=entry_id)
         self._store: Store[dict[str, Any]] | None = None
         self._state_cache: dict[str, Any] = {}
+        # Whether the cache holds changes that have not been handed to the store yet
+        self._dirty = False
 
-        try:
-            getattr(hass, "data")
-            getattr(hass, "config")
-        except AttributeError:
+        if not hasattr(hass, "data") or not hasattr(hass, "config"):
             return
 
         self._store = Store(
@@ -35,100 +287,102 @@ class AutomationStateStore:
             const.STORAGE_VERSION,
             f"{const.DOMAIN}.{entry_id}.{const.STORAGE_KEY_AUTOMATION_STATE}",
         )
+        if shared:
+            self._shared_store = get_shared_automation_state_store(hass)
 
-    async def _async_load_state(self) -> dict[str, Any]:
-        """Load and validate the full persisted runtime-state payload."""
+    async def _async_load_entry_file(self) -> Any:
+        """Load the raw payload of this entry's own storage file."""
 
         if self._store is None:
-            cached_data = self._fallback_storage.get(self._entry_id, {})
-            return dict(cached_data) if isinstance(cached_data, dict) else {}
+            return None
 
         try:
-            loaded_data = await self._store.async_load()
+            return await self._store.async_load()
         except (AttributeError, OSError, TypeError, ValueError) as err:
             self._logger.warning("Failed to load persisted automation state: %s", err)
             return {}
 
-        if not isinstance(loaded_data, dict):
-            return {}
-
-        return dict(loaded_data)
-
-    def _build_save_payload(self) -> dict[str, Any]:
-        """Return a copy of the cached runtime-state payload."""
+    async def _async_load_state(self) -> dict[str, Any]:
+        """Load and validate the full persisted runtime-state payload."""
 
-        return dict(self._state_cache)
+        if self._store is None:
+            cached_data = self._fallback_storage.get(self._entry_id, {})
+            return dict(cached_data) if isinstance(cached_data, dict) else {}
 
-    async def async_load_closed_markers(self) -> dict[str, str]:
-        """Load automation-closed markers from persistent storage."""
+        if self._shared_store is not None:
+            shared_data = await self._shared_store.async_load_entry(self._entry_id)
+            if shared_data is not None:
+                return shared_data
 
-        data = await self._async_load_state()
-        self._state_cache = dict(data)
+            if self._shared_store.read_only:
+                self._shared_store = None
+                self._logger.warning("Shared automation state storage is unavailable; using the entry's own storage file")
+                loaded_data = await self._async_load_entry_file()
+            else:
+                # Move the state of the entry's own file into the shared file
+                loaded_data = await self._async_load_entry_file()
+                if isinstance(loaded_data, dict) and loaded_data:
+                    if await self._shared_store.async_save_entry(self._entry_id, dict(loaded_data)):
+                        await self._async_remove_entry_file()
+        else:
+            loaded_data = await self._async_load_entry_file()
 
-        raw_markers = data.get(const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS)
-        if not isinstance(raw_markers, dict):
+        if not isinstance(loaded_data, dict):
             return {}
 
-        return {
-            entity_id: reason_key
-            for entity_id, reason_key in raw_markers.items()
-            if isinstance(entity_id, str) and isinstance(reason_key, str)
-        }
+        return dict(loaded_data)
 
-    async def async_load_automation_managed_states(self) -> dict[str, dict[str, Any]]:
-        """Load automation-managed states from persistent storage."""
+    def _build_save_payload(self) -> dict[str, Any]:
+        """Return a snapshot of the cached runtime-state payload.
 
-        data = await self._async_load_state()
-        self._state_cache = dict(data)
+        Called once per flush. Sections are copied so later in-place updates of
+        the cache cannot leak into a payload that is being written.
+        """
 
-        raw_states = data.get(const.STORAGE_KEY_AUTOMATION_MANAGED_STATES)
-        if not isinstance(raw_states, dict):
-            return {}
+        self._dirty = False
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in self._state_cache.items()}
 
-        loaded: dict[str, dict[str, Any]] = {}
-        for entity_id, payload in raw_states.items():
-            if not isinstance(entity_id, str) or not isinstance(payload, dict):
-                continue
-            loaded[entity_id] = dict(payload)
+    def _sync_fallback_cache(self) -> None:
+        """Reload the cache from the in-memory fallback storage (fallback mode only)."""
 
-        return loaded
+        if self._store is None:
+            self._state_cache = dict(self._fallback_storage.get(self._entry_id, {}))
 
-    async def async_load_current_day_temperature_extrema(self) -> dict[str, Any] | None:
-        """Load current-day temperature extrema from persistent storage."""
+    def _apply_section(self, key: str, snapshot: Any | None) -> bool:
+        """Update one cached payload section.
 
-        data = await self._async_load_state()
-        self._state_cache = dict(data)
+        Args:
+            key: Storage key of the section
+            snapshot: New section content, or None to remove the section
 
-        raw_extrema = data.get(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA)
-        if not isinstance(raw_extrema, dict):
-            return None
+        Returns:
+            True if the section content changed.
+        """
 
-        raw_date = raw_extrema.get("date")
-        raw_temp_max = raw_extrema.get("temp_max")
-        raw_temp_min = raw_extrema.get("temp_min")
-        if not isinstance(raw_date, str) or not isinstance(raw_temp_max, int | float):
-            return None
-        if raw_temp_min is not None and not isinstance(raw_temp_min, int | float):
-            return None
+        self._sync_fallback_cache()
+
+        if snapshot is None:
+            if key not in self._state_cache:
+                return False
+            del self._state_cache[key]
+        else:
+            if key in self._state_cache and self._state_cache[key] == snapshot:
+                return False
+            self._state_cache[key] = snapshot
 
-        return {
-            "date": raw_date,
-            "temp_max": float(raw_temp_max),
-            "temp_min": float(raw_temp_min) if raw_temp_min is not None else None,
-        }
+        self._dirty = True
+        return True
 
-    def schedule_save_closed_markers(self, markers: Mapping[str, str]) -> None:
-        """Schedule persistence for the current automation-closed markers."""
+    def _schedule_save(self) -> None:
+        """Schedule a delayed write of the cached payload."""
 
-        snapshot = dict(markers)
         if self._store is None:
-            payload = dict(self._fallback_storage.get(self._entry_id, {}))
-            payload[const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS] = snapshot
-            self._fallback_storage[self._entry_id] = payload
-            self._state_cache = dict(payload)
+            self._fallback_storage[self._entry_id] = self._build_save_payload()
             return
 
-        self._state_cache[const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS] = snapshot
+        if self._shared_store is not None:
+            self._shared_store.schedule_save_entry(self._entry_id, self._build_save_payload)
+            return
 
         try:
             self._store.async_delay_save(
@@ -138,122 +392,229 @@ class AutomationStateStore:
         except (AttributeError, OSError, TypeError, ValueError) as err:
             self._logger.warning("Failed to schedule persisted automation state save: %s", err)
 
-    def schedule_save_automation_managed_states(self, states: Mapping[str, Mapping[str, Any]]) -> None:
-        """Schedule persistence for the current automation-managed states."""
+    async def _async_save(self) -> None:
+        """Immediately write the cached payload if it has unsaved changes."""
+
+        if not self._dirty:
+            return
 
-        snapshot = {entity_id: dict(payload) for entity_id, payload in states.items()}
         if self._store is None:
-            payload = dict(self._fallback_storage.get(self._entry_id, {}))
-            payload[const.STORAGE_KEY_AUTOMATION_MANAGED_STATES] = snapshot
-            self._fallback_storage[self._entry_id] = payload
-            self._state_cache = dict(payload)
+            self._fallback_storage[self._entry_id] = self._build_save_payload()
+            return
+
+        if self._shared_store is not None:
+            if not await self._shared_store.async_save_entry(self._entry_id, self._build_save_payload()):
+                self._dirty = True
             return
 
-        self._state_cache[const.STORAGE_KEY_AUTOMATION_MANAGED_STATES] = snapshot
+        if not await self._async_write(self._build_save_payload()):
+            self._dirty = True
+
+    async def _async_write(self, payload: dict[str, Any]) -> bool:
+        """Write a payload to this entry's own storage file; return whether it succeeded."""
+
+        if self._store is None:
+            return False
 
         try:
-            self._store.async_delay_save(
-                self._build_save_payload,
-                const.STORAGE_SAVE_DELAY_SECONDS,
-            )
+            await self._store.async_save(payload)
         except (AttributeError, OSError, TypeError, ValueError) as err:
-            self._logger.warning("Failed to schedule persisted automation state save: %s", err)
+            self._logger.warning("Failed to persist automation state: %s", err)
+            return False
 
-    def schedule_save_current_day_temperature_extrema(self, extrema: Mapping[str, Any] | None) -> None:
-        """Schedule persistence for the current-day extrema snapshot."""
+        return True
+
+    async def _async_remove_entry_file(self) -> None:
+        """Remove this entry's own storage file."""
 
-        snapshot = dict(extrema) if extrema is not None else None
         if self._store is None:
-            payload = dict(self._fallback_storage.get(self._entry_id, {}))
-            if snapshot is None:
-                payload.pop(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA, None)
-            else:
-                payload[const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA] = snapshot
-            self._fallback_storage[self._entry_id] = payload
-            self._state_cache = dict(payload)
             return
 
-        if snapshot is None:
-            self._state_cache.pop(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA, None)
-        else:
-            self._state_cache[const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA] = snapshot
-
         try:
-            self._store.async_delay_save(
-                self._build_save_payload,
-                const.STORAGE_SAVE_DELAY_SECONDS,
-            )
+            await self._store.async_remove()
         except (AttributeError, OSError, TypeError, ValueError) as err:
-            self._logger.warning("Failed to schedule persisted automation state save: %s", err)
+            self._logger.warning("Failed to remove persisted automation state: %s", err)
 
-    async def async_save_closed_markers(self, markers: Mapping[str, str]) -> None:
-        """Immediately persist the current automation-closed markers."""
+    async def async_move_to_entry_file(self) -> None:
+        """Move the cached state out of the shared file into this entry's own file.
 
-        snapshot = dict(markers)
-        if self._store is None:
-            payload = dict(self._fallback_storage.get(self._entry_id, {}))
-            payload[const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS] = snapshot
-            self._fallback_storage[self._entry_id] = payload
-            self._state_cache = dict(payload)
+        Called before shared storage is turned off. Later writes go to the
+        entry's own file. If the write fails, the state stays in the shared file.
+        """
+
+        if self._shared_store is None:
             return
 
-        self._state_cache[const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS] = snapshot
+        dirty = self._dirty
+        if not await self._async_write(self._build_save_payload()):
+            self._dirty = dirty
+            return
 
-        try:
-            await self._store.async_save(self._build_save_payload())
-        except (AttributeError, OSError, TypeError, ValueError) as err:
-            self._logger.warning("Failed to persist automation state: %s", err)
+        await self._shared_store.async_remove_entry(self._entry_id)
+        self._shared_store = None
 
-    async def async_save_automation_managed_states(self, states: Mapping[str, Mapping[str, Any]]) -> None:
-        """Immediately persist the current automation-managed states."""
+    async def async_load_runtime_state(self) -> RestoredAutomationState:
+        """Load all persisted runtime state with a single read of the payload."""
+
+        data = await self._async_load_state()
+        self._state_cache = dict(data)
+
+        return RestoredAutomationState(
+            automation_managed_states=_parse_automation_managed_states(data),
+            closed_markers=_parse_closed_markers(data),
+            current_day_temperature_extrema=_parse_current_day_temperature_extrema(data),
+            runtime_settings=_parse_runtime_settings(data),
+            startup_migrations=_parse_startup_migrations(data),
+        )
+
+    async def async_load_closed_markers(self) -> dict[str, str]:
+        """Load automation-closed markers from persistent storage."""
+
+        data = await self._async_load_state()
+        self._state_cache = dict(data)
+        return _parse_closed_markers(data)
+
+    async def async_load_automation_managed_states(self) -> dict[str, dict[str, Any]]:
+        """Load automation-managed states from persistent storage."""
+
+        data = await self._async_load_state()
+        self._state_cache = dict(data)
+        return _parse_automation_managed_states(data)
+
+    async def async_load_current_day_temperature_extrema(self) -> dict[str, Any] | None:
+        """Load current-day temperature extrema from persistent storage."""
+
+        data = await self._async_load_state()
+        self._state_cache = dict(data)
+        return _parse_current_day_temperature_extrema(data)
+
+    def schedule_save_closed_markers(self, markers: Mapping[str, str]) -> None:
+        """Schedule persistence for the current automation-closed markers."""
+
+        if self._apply_section(const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS, dict(markers)):
+            self._schedule_save()
+
+    def schedule_save_automation_managed_states(self, states: Mapping[str, Mapping[str, Any]]) -> None:
+        """Schedule persistence for the current automation-managed states."""
 
         snapshot = {entity_id: dict(payload) for entity_id, payload in states.items()}
-        if self._store is None:
-            payload = dict(self._fallback_storage.get(self._entry_id, {}))
-            payload[const.STORAGE_KEY_AUTOMATION_MANAGED_STATES] = snapshot
-            self._fallback_storage[self._entry_id] = payload
-            self._state_cache = dict(payload)
+        if self._apply_section(const.STORAGE_KEY_AUTOMATION_MANAGED_STATES, snapshot):
+            self._schedule_save()
+
+    def schedule_save_automation_managed_state_changes(self, changes: Mapping[str, Mapping[str, Any] | None]) -> None:
+        """Schedule persistence for changed automation-managed states.
+
+        Only the given entries are updated in the cached payload, so the cost
+        does not depend on the number of covers.
+
+        Args:
+            changes: Persistence payload per changed cover, None for a removed cover
+        """
+
+        self._sync_fallback_cache()
+
+        section = self._state_cache.get(const.STORAGE_KEY_AUTOMATION_MANAGED_STATES)
+        if not isinstance(section, dict):
+            section = {}
+
+        changed = False
+        for entity_id, payload in changes.items():
+            if payload is None:
+                if entity_id in section:
+                    del section[entity_id]
+                    changed = True
+            elif section.get(entity_id) != payload:
+                section[entity_id] = dict(payload)
+                changed = True
+
+        if not changed:
             return
 
-        self._state_cache[const.STORAGE_KEY_AUTOMATION_MANAGED_STATES] = snapshot
+        self._state_cache[const.STORAGE_KEY_AUTOMATION_MANAGED_STATES] = section
+        self._dirty = True
+        self._schedule_save()
 
-        try:
-            await self._store.async_save(self._build_save_payload())
-        except (AttributeError, OSError, TypeError, ValueError) as err:
-            self._logger.warning("Failed to persist automation state: %s", err)
+    def schedule_save_current_day_temperature_extrema(self, extrema: Mapping[str, Any] | None) -> None:
+        """Schedule persistence for the current-day extrema snapshot."""
+
+        snapshot = dict(extrema) if extrema is not None else None
+        if self._apply_section(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA, snapshot):
+            self._schedule_save()
+
+    def schedule_save_runtime_settings(self, settings: Mapping[str, Any]) -> None:
+        """Schedule persistence for the current runtime settings."""
+
+        if self._apply_section(const.STORAGE_KEY_RUNTIME_SETTINGS, dict(settings)):
+            self._schedule_save()
+
+    def schedule_save_startup_migrations(self, record: Mapping[str, Any]) -> None:
+        """Schedule persistence for the startup migration record."""
+
+        if self._apply_section(const.STORAGE_KEY_STARTUP_MIGRATIONS, dict(record)):
+            self._schedule_save()
+
+    async def async_save_runtime_state(
+        self,
+        *,
+        automation_managed_states: Mapping[str, Mapping[str, Any]],
+        closed_markers: Mapping[str, str],
+        current_day_temperature_extrema: Mapping[str, Any] | None,
+        runtime_settings: Mapping[str, Any],
+    ) -> None:
+        """Immediately persist all runtime state with a single write.
+
+        The write is skipped when nothing changed since the last save.
+        """
+
+        self._apply_section(
+            const.STORAGE_KEY_AUTOMATION_MANAGED_STATES,
+            {entity_id: dict(payload) for entity_id, payload in automation_managed_states.items()},
+        )
+        self._apply_section(const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS, dict(closed_markers))
+        self._apply_section(
+            const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA,
+            dict(current_day_temperature_extrema) if current_day_temperature_extrema is not None else None,
+        )
+        self._apply_section(const.STORAGE_KEY_RUNTIME_SETTINGS, dict(runtime_settings))
+        await self._async_save()
+
+    async def async_save_closed_markers(self, markers: Mapping[str, str]) -> None:
+        """Immediately persist the current automation-closed markers."""
+
+        self._apply_section(const.STORAGE_KEY_AUTOMATION_CLOSED_MARKERS, dict(markers))
+        await self._async_save()
+
+    async def async_save_automation_managed_states(self, states: Mapping[str, Mapping[str, Any]]) -> None:
+        """Immediately persist the current automation-managed states."""
+
+        snapshot = {entity_id: dict(payload) for entity_id, payload in states.items()}
+        self._apply_section(const.STORAGE_KEY_AUTOMATION_MANAGED_STATES, snapshot)
+        await self._async_save()
 
     async def async_save_current_day_temperature_extrema(self, extrema: Mapping[str, Any] | None) -> None:
         """Immediately persist the current-day extrema snapshot."""
 
         snapshot = dict(extrema) if extrema is not None else None
-        if self._store is None:
-            payload = dict(self._fallback_storage.get(self._entry_id, {}))
-            if snapshot is None:
-                payload.pop(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA, None)
-            else:
-                payload[const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA] = snapshot
-            self._fallback_storage[self._entry_id] = payload
-            self._state_cache = dict(payload)
-            return
+        self._apply_section(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA, snapshot)
+        await self._async_save()
 
-        if snapshot is None:
-            self._state_cache.pop(const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA, None)
-        else:
-            self._state_cache[const.STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA] = snapshot
+    async def async_save_runtime_settings(self, settings: Mapping[str, Any]) -> None:
+        """Immediately persist the current runtime settings."""
 
-        try:
-            await self._store.async_save(self._build_save_payload())
-        except (AttributeError, OSError, TypeError, ValueError) as err:
-            self._logger.warning("Failed to persist automation state: %s", err)
+        self._apply_section(const.STORAGE_KEY_RUNTIME_SETTINGS, dict(settings))
+        await self._async_save()
 
     async def async_remove(self) -> None:
         """Remove persisted automation state for this config entry."""
 
+        self._dirty = False
+
         if self._store is None:
             self._fallback_storage.pop(self._entry_id, None)
             return
 
-        try:
-            await self._store.async_remove()
-        except (AttributeError, OSError, TypeError, ValueError) as err:
-            self._logger.warning("Failed to remove persisted automation state: %s", err)
+        if self._shared:
+            shared_store = self._shared_store or get_shared_automation_state_store(self._hass)
+            await shared_store.async_remove_entry(self._entry_id)
+
+        await self._async_remove_entry_file()
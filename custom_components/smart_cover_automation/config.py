@@ -29,6 +29,7 @@ from custom_components.smart_cover_automation.const import (
     TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME,
     TIME_KEY_MORNING_OPENING_EXTERNAL_TIME,
     BlockedTimeRangeMode,
+    CoverCommandGroupScope,
     EveningClosureMode,
     HeatProtectionMode,
     LockMode,
@@ -91,10 +92,17 @@ class ConfKeys(StrEnum):
     COVERS_MIN_CLOSURE = "covers_min_closure"  # Minimum closure position (0 = fully closed, 100 = fully open)
     COVERS_MIN_POSITION_DELTA = "covers_min_position_delta"  # Ignore smaller position changes (%).
     COVER_MOVEMENT_STAGGER_DELAY = "cover_movement_stagger_delay"  # Delay in seconds between cover starts within one iteration.
+    COVER_MOVEMENT_MAX_CONCURRENCY = "cover_movement_max_concurrency"  # Max. covers moved in parallel when not staggering.
+    COVER_MOVEMENT_GROUP_SERVICE_CALLS = "cover_movement_group_service_calls"  # Move covers with identical targets in one service call.
+    COVER_MOVEMENT_RATE_LIMIT = "cover_movement_rate_limit"  # Max. cover commands (a movement incl. its tilt call) per minute and command group (0 = unlimited).
+    COVER_MOVEMENT_RATE_LIMIT_BURST = "cover_movement_rate_limit_burst"  # Commands a command group may send back-to-back.
+    COVER_MOVEMENT_RATE_LIMIT_SCOPE = "cover_movement_rate_limit_scope"  # Which covers share one rate limit.
     ENABLED = "enabled"  # Global on/off for all automation.
     LOCK_MODE = "lock_mode"  # Current lock mode for all covers.
+    LOGBOOK_BATCH_ENTRIES = "logbook_batch_entries"  # Combine identical cover movements of one run into a single logbook entry.
     MANUAL_OVERRIDE_DURATION = "manual_override_duration"  # Duration (seconds) to skip a cover's automation after manual cover move.
     SIMULATION_MODE = "simulation_mode"  # If enabled, no actual cover commands are sent.
+    SHARED_STATE_STORAGE = "shared_state_storage"  # Persist runtime state in one storage file shared by all instances.
     DAILY_MAX_TEMPERATURE_THRESHOLD = (
         "daily_max_temperature_threshold"  # Daily high temperature threshold at which heat protection can activate (°C).
     )
@@ -281,10 +289,17 @@ CONF_SPECS: dict[ConfKeys, _ConfSpec[Any]] = {
     ConfKeys.COVERS_MIN_CLOSURE: _ConfSpec(default=100, converter=_Converters.to_int, runtime_configurable=True),
     ConfKeys.COVERS_MIN_POSITION_DELTA: _ConfSpec(default=5, converter=_Converters.to_int),
     ConfKeys.COVER_MOVEMENT_STAGGER_DELAY: _ConfSpec(default=0, converter=_Converters.to_int),
+    ConfKeys.COVER_MOVEMENT_MAX_CONCURRENCY: _ConfSpec(default=1, converter=_Converters.to_int),
+    ConfKeys.COVER_MOVEMENT_GROUP_SERVICE_CALLS: _ConfSpec(default=False, converter=_Converters.to_bool),
+    ConfKeys.COVER_MOVEMENT_RATE_LIMIT: _ConfSpec(default=0, converter=_Converters.to_int),
+    ConfKeys.COVER_MOVEMENT_RATE_LIMIT_BURST: _ConfSpec(default=1, converter=_Converters.to_int),
+    ConfKeys.COVER_MOVEMENT_RATE_LIMIT_SCOPE: _ConfSpec(default=CoverCommandGroupScope.INTEGRATION, converter=CoverCommandGroupScope),
     ConfKeys.ENABLED: _ConfSpec(default=True, converter=_Converters.to_bool, runtime_configurable=True),
     ConfKeys.LOCK_MODE: _ConfSpec(default=LockMode.UNLOCKED, converter=LockMode, runtime_configurable=True),
+    ConfKeys.LOGBOOK_BATCH_ENTRIES: _ConfSpec(default=False, converter=_Converters.to_bool),
     ConfKeys.MANUAL_OVERRIDE_DURATION: _ConfSpec(default=1800, converter=_Converters.to_duration_seconds, runtime_configurable=True),
     ConfKeys.SIMULATION_MODE: _ConfSpec(default=False, converter=_Converters.to_bool, runtime_configurable=True),
+    ConfKeys.SHARED_STATE_STORAGE: _ConfSpec(default=False, converter=_Converters.to_bool),
     ConfKeys.DAILY_MAX_TEMPERATURE_THRESHOLD: _ConfSpec(default=24.0, converter=_Converters.to_float, runtime_configurable=True),
     ConfKeys.DAILY_MIN_TEMPERATURE_THRESHOLD: _ConfSpec(default=13.0, converter=_Converters.to_float, runtime_configurable=True),
     ConfKeys.SUN_AZIMUTH_TOLERANCE: _ConfSpec(default=60, converter=_Converters.to_int, runtime_configurable=True),
@@ -428,10 +443,17 @@ class ResolvedConfig:
     covers_min_closure: int
     covers_min_position_delta: int
     cover_movement_stagger_delay: int
+    cover_movement_max_concurrency: int
+    cover_movement_group_service_calls: bool
+    cover_movement_rate_limit: int
+    cover_movement_rate_limit_burst: int
+    cover_movement_rate_limit_scope: CoverCommandGroupScope
     enabled: bool
     lock_mode: LockMode
+    logbook_batch_entries: bool
     manual_override_duration: int
     simulation_mode: bool
+    shared_state_storage: bool
     daily_max_temperature_threshold: float
     daily_min_temperature_threshold: float
     sun_azimuth_tolerance: int
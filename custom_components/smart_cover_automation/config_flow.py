@@ -806,7 +806,62 @@ class FlowHelper:
                     unit_of_measurement=UnitOfTime.SECONDS,
                     mode=selector.NumberSelectorMode.BOX,
                 )
-            )
+            ),
+            vol.Required(
+                ConfKeys.COVER_MOVEMENT_MAX_CONCURRENCY.value,
+                default=resolved_settings.cover_movement_max_concurrency,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=const.MAX_COVER_MOVEMENT_CONCURRENCY,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                ConfKeys.COVER_MOVEMENT_RATE_LIMIT.value,
+                default=resolved_settings.cover_movement_rate_limit,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=const.MAX_COVER_MOVEMENT_RATE_LIMIT,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                ConfKeys.COVER_MOVEMENT_RATE_LIMIT_BURST.value,
+                default=resolved_settings.cover_movement_rate_limit_burst,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=const.MAX_COVER_MOVEMENT_RATE_LIMIT_BURST,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                ConfKeys.COVER_MOVEMENT_RATE_LIMIT_SCOPE.value,
+                default=resolved_settings.cover_movement_rate_limit_scope,
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[selector.SelectOptionDict(value=scope.value, label=scope.value) for scope in const.CoverCommandGroupScope],
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                    translation_key="cover_movement_rate_limit_scope",
+                )
+            ),
+            vol.Required(
+                ConfKeys.COVER_MOVEMENT_GROUP_SERVICE_CALLS.value,
+                default=resolved_settings.cover_movement_group_service_calls,
+            ): selector.BooleanSelector(),
+            vol.Required(
+                ConfKeys.LOGBOOK_BATCH_ENTRIES.value,
+                default=resolved_settings.logbook_batch_entries,
+            ): selector.BooleanSelector(),
+            vol.Required(
+                ConfKeys.SHARED_STATE_STORAGE.value,
+                default=resolved_settings.shared_state_storage,
+            ): selector.BooleanSelector(),
         }
         schema_dict[vol.Optional(const.STEP_5_SECTION_ADDITIONAL_SETTINGS)] = section(vol.Schema(additional_settings_schema))
 
@@ -2004,6 +2059,27 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             self._config_data[ConfKeys.COVER_MOVEMENT_STAGGER_DELAY.value] = int(
                 additional_settings.get(ConfKeys.COVER_MOVEMENT_STAGGER_DELAY.value, 0)
             )
+            self._config_data[ConfKeys.COVER_MOVEMENT_MAX_CONCURRENCY.value] = int(
+                additional_settings.get(ConfKeys.COVER_MOVEMENT_MAX_CONCURRENCY.value, 1)
+            )
+            self._config_data[ConfKeys.COVER_MOVEMENT_RATE_LIMIT.value] = int(
+                additional_settings.get(ConfKeys.COVER_MOVEMENT_RATE_LIMIT.value, 0)
+            )
+            self._config_data[ConfKeys.COVER_MOVEMENT_RATE_LIMIT_BURST.value] = int(
+                additional_settings.get(ConfKeys.COVER_MOVEMENT_RATE_LIMIT_BURST.value, 1)
+            )
+            self._config_data[ConfKeys.COVER_MOVEMENT_RATE_LIMIT_SCOPE.value] = str(
+                additional_settings.get(ConfKeys.COVER_MOVEMENT_RATE_LIMIT_SCOPE.value, const.CoverCommandGroupScope.INTEGRATION.value)
+            )
+            self._config_data[ConfKeys.COVER_MOVEMENT_GROUP_SERVICE_CALLS.value] = bool(
+                additional_settings.get(ConfKeys.COVER_MOVEMENT_GROUP_SERVICE_CALLS.value, False)
+            )
+            self._config_data[ConfKeys.LOGBOOK_BATCH_ENTRIES.value] = bool(
+                additional_settings.get(ConfKeys.LOGBOOK_BATCH_ENTRIES.value, False)
+            )
+            self._config_data[ConfKeys.SHARED_STATE_STORAGE.value] = bool(
+                additional_settings.get(ConfKeys.SHARED_STATE_STORAGE.value, False)
+            )
 
         # Build complete lists of window sensor settings for all covers
         window_sensor_data = self._build_section_cover_settings(
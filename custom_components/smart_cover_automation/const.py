@@ -103,7 +103,7 @@ COVER_SFX_WINDOW_SENSORS: Final[str] = "cover_window_sensors"  # Window sensor e
 
 # Per-cover position history configuration
 COVER_POSITION_HISTORY_SIZE: Final[int] = 3  # Number of positions to store in history
-COVER_AUTOMATION_SETTLE_CYCLES: Final[int] = 2  # Coordinator cycles to tolerate recent automation settling (1 cycle + safety margin).
+COVER_AUTOMATION_SETTLE_WINDOW: Final = timedelta(minutes=2)  # Time to tolerate recent automation settling (movement + safety margin).
 
 
 #
@@ -176,6 +176,17 @@ class HeatProtectionMode(StrEnum):
     FORCED_ALL_WINDOWS = "forced_all_windows"
 
 
+#
+# CoverCommandGroupScope
+#
+class CoverCommandGroupScope(StrEnum):
+    """Which covers share one command rate limit."""
+
+    ENTRY = "entry"  # All covers of the config entry
+    DEVICE = "device"  # Covers of the same device
+    INTEGRATION = "integration"  # Covers provided by the same integration (e.g., one gateway)
+
+
 #
 # TiltMode
 #
@@ -287,6 +298,8 @@ HA_SUN_ENTITY_ID: Final[str] = "sun.sun"
 HA_SUN_STATE_BELOW_HORIZON: Final[str] = "below_horizon"
 HA_WEATHER_COND_SUNNY: Final[str] = "sunny"
 HA_WEATHER_COND_PARTCLOUDY: Final[str] = "partlycloudy"
+HA_WEATHER_FORECAST_TYPE_DAILY: Final[str] = "daily"
+WEATHER_FORECAST_CACHE_TTL: Final = timedelta(minutes=30)  # Max. age of a cached weather forecast response.
 
 # Weather conditions that indicate sunny conditions
 WEATHER_SUNNY_CONDITIONS: Final[tuple[str, ...]] = (
@@ -299,8 +312,17 @@ COVER_POS_FULLY_OPEN: Final = 100
 COVER_POS_FULLY_CLOSED: Final = 0
 
 # Coordinator
-UPDATE_INTERVAL: Final = timedelta(seconds=60)
+UPDATE_INTERVAL: Final = timedelta(minutes=15)  # Safety-net refresh; state changes and time-based deadlines trigger runs in between
+STATE_CHANGE_REFRESH_COOLDOWN_SECONDS: Final[float] = 1.0  # Debounce window for state-change-triggered refreshes
+SENSOR_SNAPSHOT_MAX_AGE: Final = timedelta(seconds=30)  # Entries updating within this window share one sensor snapshot
+SUN_EPHEMERIS_CACHE_SIZE: Final[int] = 16  # Number of (location, date) sun ephemerides kept in memory
+SUN_EXPOSURE_SAMPLE_INTERVAL: Final = timedelta(minutes=5)  # Resolution of the precomputed per-cover sun-exposure windows
+COVER_EVALUATION_SUN_QUANTUM: Final[float] = 0.5  # Sun movement (°) that makes an otherwise unchanged idle cover re-evaluate
+CYCLE_TIMING_WINDOW_SIZE: Final[int] = 100  # Samples per stage kept for the cycle timing percentiles (diagnostics)
 MAX_COVER_MOVEMENT_STAGGER_DELAY_SECONDS: Final[int] = 3600
+MAX_COVER_MOVEMENT_CONCURRENCY: Final[int] = 50
+MAX_COVER_MOVEMENT_RATE_LIMIT: Final[int] = 600  # Commands per minute and command group
+MAX_COVER_MOVEMENT_RATE_LIMIT_BURST: Final[int] = 50  # Commands a command group may send back-to-back
 SUNSET_CLOSING_WINDOW_MINUTES: Final[int] = 10  # Duration of the evening closure window
 
 # Logbook service/translation keys
@@ -321,6 +343,9 @@ TRANSL_KEY_FIELDS: Final[str] = "fields"
 
 # hass.data keys
 DATA_COORDINATORS: Final[str] = "coordinators"
+DATA_FORECAST_CACHE: Final[str] = "forecast_cache"
+DATA_SENSOR_SNAPSHOT_HUB: Final[str] = "sensor_snapshot_hub"
+DATA_SHARED_STATE_STORE: Final[str] = "shared_state_store"
 
 # Persistent runtime-state storage
 STORAGE_VERSION: Final[int] = 1
@@ -328,7 +353,14 @@ STORAGE_KEY_AUTOMATION_STATE: Final[str] = "automation_state"
 STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: Final[str] = "automation_closed_markers"
 STORAGE_KEY_AUTOMATION_MANAGED_STATES: Final[str] = "automation_managed_states"
 STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA: Final[str] = "current_day_temperature_extrema"
+STORAGE_KEY_RUNTIME_SETTINGS: Final[str] = "runtime_settings"
+STORAGE_KEY_STARTUP_MIGRATIONS: Final[str] = "startup_migrations"
 STORAGE_SAVE_DELAY_SECONDS: Final[int] = 1
 
+# Startup migrations (increment the version when adding or changing a registry migration)
+STARTUP_MIGRATIONS_VERSION: Final[int] = 1
+STARTUP_MIGRATIONS_KEY_VERSION: Final[str] = "version"
+STARTUP_MIGRATIONS_KEY_STALE_ENTITY_FINGERPRINT: Final[str] = "stale_entity_fingerprint"
+
 # Initialize the module-level logger
 _init_logger()
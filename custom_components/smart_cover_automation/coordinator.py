@@ -3,23 +3,34 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.components.cover import CoverState
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator as BaseCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from . import const
 from .automation_engine import AutomationEngine
 from .automation_state_store import AutomationStateStore
-from .config import ConfKeys, ResolvedConfig, resolve_entry
+from .config import ConfKeys, ResolvedConfig
 from .const import HeatProtectionMode, LockMode, ReopeningMode
+from .cycle_timing import CycleTimings
 from .data import CoordinatorData
+from .forecast_cache import get_shared_forecast_cache
 from .ha_interface import HomeAssistantInterface, WeatherEntityNotFoundError
 from .log import Log
+from .sensor_snapshot import get_shared_sensor_snapshot_hub
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant, State
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, Event, EventStateChangedData, HomeAssistant, State
 
     from .data import IntegrationConfigEntry
 
@@ -66,16 +77,35 @@ class DataUpdateCoordinator(BaseCoordinator[CoordinatorData]):
         # Store merged config for comparison during reload
         self._merged_config: dict[str, Any] = {}
 
-        resolved = resolve_entry(config_entry)
+        # Resolved settings cached per options revision (see _resolved_settings)
+        self._resolved_settings_cache: ResolvedConfig | None = None
+        self._resolved_settings_options: dict[str, Any] | None = None
+
+        # Values set at runtime by entities (e.g., external tilt values), overlaid on the options
+        self._runtime_settings: dict[str, Any] = {}
+
+        # Which startup migrations already ran for this config entry
+        self._startup_migrations: dict[str, Any] = {}
+
+        resolved = self._resolved_settings()
         self._logger.info(f"Initializing coordinator: update_interval={const.UPDATE_INTERVAL.total_seconds()} s")
 
         # Get configuration from options (all user settings are stored there)
         config = dict(getattr(config_entry, const.HA_OPTIONS, {}) or {})
 
-        self._automation_state_store = AutomationStateStore(hass, config_entry.entry_id)
+        self._automation_state_store = AutomationStateStore(hass, config_entry.entry_id, shared=resolved.shared_state_storage)
+
+        # Rolling per-stage timing statistics, exposed via diagnostics
+        self.cycle_timings = CycleTimings()
 
         # Create the HA interface layer (pass instance logger)
-        self._ha_interface = HomeAssistantInterface(hass, self._resolved_settings, logger=self._logger)
+        self._ha_interface = HomeAssistantInterface(
+            hass,
+            self._resolved_settings,
+            logger=self._logger,
+            forecast_cache=get_shared_forecast_cache(hass),
+            cycle_timings=self.cycle_timings,
+        )
 
         # Initialize the automation engine (persists across runs, pass instance logger)
         self._automation_engine = AutomationEngine(
@@ -83,10 +113,25 @@ class DataUpdateCoordinator(BaseCoordinator[CoordinatorData]):
             config=config,
             ha_interface=self._ha_interface,
             logger=self._logger,
-            on_automation_managed_states_changed=self._automation_state_store.schedule_save_automation_managed_states,
+            on_automation_managed_states_changed=self._automation_state_store.schedule_save_automation_managed_state_changes,
             on_current_day_temperature_extrema_changed=self._automation_state_store.schedule_save_current_day_temperature_extrema,
+            sensor_snapshot_hub=get_shared_sensor_snapshot_hub(hass),
+            cycle_timings=self.cycle_timings,
         )
 
+        # Debounced refresh triggered by state changes of the automation's input entities
+        self._state_change_debouncer: Debouncer = Debouncer(
+            hass,
+            self._logger.underlying_logger,
+            cooldown=const.STATE_CHANGE_REFRESH_COOLDOWN_SECONDS,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+        # One-shot refresh at the next start or end of a cover's sun exposure (armed once state tracking runs)
+        self._wakeup_enabled = False
+        self._wakeup_unsub: CALLBACK_TYPE | None = None
+
         # Track verbose logging state to avoid redundant setLevel calls
         self._verbose_logging_enabled: bool | None = None
 
@@ -151,29 +196,150 @@ class DataUpdateCoordinator(BaseCoordinator[CoordinatorData]):
         resolved = self._resolved_settings()
         return resolved.lock_mode
 
+    #
+    # async_start_state_tracking
+    #
+    def async_start_state_tracking(self) -> None:
+        """Re-evaluate covers when one of the automation's input entities changes.
+
+        Subscribes to state changes of the configured covers, the sun entity and
+        the weather entity. Changes are coalesced by a short debouncer so that a
+        burst of updates results in a single refresh. The periodic update
+        interval remains active as a safety net for time-based transitions.
+
+        The subscriptions are released automatically when the config entry unloads.
+        """
+
+        resolved = self._resolved_settings()
+        entity_ids = [*resolved.covers, const.HA_SUN_ENTITY_ID]
+        if resolved.weather_entity_id:
+            entity_ids.append(resolved.weather_entity_id)
+
+        self.config_entry.async_on_unload(async_track_state_change_event(self.hass, entity_ids, self._async_handle_tracked_state_change))
+        self.config_entry.async_on_unload(self._state_change_debouncer.async_shutdown)
+        self._logger.debug(f"Tracking state changes of {len(entity_ids)} entities")
+
+        self._wakeup_enabled = True
+        self.config_entry.async_on_unload(self._cancel_wakeup)
+        self._schedule_wakeup()
+
+    #
+    # _async_handle_tracked_state_change
+    #
+    @callback
+    def _async_handle_tracked_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a debounced refresh for a state change of a tracked entity."""
+
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+
+        # Covers in motion report intermediate positions; wait until they settle
+        if new_state.state in (CoverState.OPENING, CoverState.CLOSING):
+            return
+
+        self._state_change_debouncer.async_schedule_call()
+
+    #
+    # _schedule_wakeup
+    #
+    def _schedule_wakeup(self) -> None:
+        """Arm a one-shot refresh at the next point in time that changes the automation outcome.
+
+        That is the earlier of the next sun exposure change (the sun starting or
+        stopping to hit a cover) and the next time-based deadline (manual
+        override expiry, delayed reopening, evening closure, ...). This lets the
+        automation react on time instead of waiting for the next periodic update.
+        """
+
+        self._cancel_wakeup()
+        if not self._wakeup_enabled:
+            return
+
+        now = dt_util.now()
+        candidates: list[tuple[datetime, str]] = []
+        try:
+            next_change = self._automation_engine.get_next_sun_exposure_change(now)
+            if next_change is not None:
+                candidates.append((next_change, "sun exposure change"))
+            next_deadline = self._automation_engine.get_next_deadline(now)
+            if next_deadline is not None:
+                candidates.append(next_deadline)
+        except Exception as err:
+            self._logger.debug(f"Could not determine the next wake-up time: {err}")
+
+        if not candidates:
+            return
+
+        wakeup_at, description = min(candidates)
+        self._logger.debug(f"Next wake-up at {wakeup_at.isoformat()} ({description})")
+        self._wakeup_unsub = async_track_point_in_utc_time(self.hass, self._async_handle_wakeup, wakeup_at)
+
+    #
+    # _cancel_wakeup
+    #
+    @callback
+    def _cancel_wakeup(self) -> None:
+        """Cancel a pending wake-up."""
+
+        if self._wakeup_unsub is not None:
+            self._wakeup_unsub()
+            self._wakeup_unsub = None
+
+    #
+    # _async_handle_wakeup
+    #
+    @callback
+    def _async_handle_wakeup(self, _now: datetime) -> None:
+        """Refresh at a sun exposure boundary or time-based deadline."""
+
+        self._wakeup_unsub = None
+        self._state_change_debouncer.async_schedule_call()
+
     async def async_restore_runtime_state(self) -> None:
         """Restore runtime state that must survive Home Assistant restarts."""
 
-        stored_managed_states = await self._automation_state_store.async_load_automation_managed_states()
-        stored_markers = await self._automation_state_store.async_load_closed_markers()
-        self._automation_engine.restore_automation_managed_states(stored_managed_states, stored_markers)
-        stored_extrema = await self._automation_state_store.async_load_current_day_temperature_extrema()
-        self._automation_engine.restore_current_day_temperature_extrema(stored_extrema)
+        restored = await self._automation_state_store.async_load_runtime_state()
+        self._automation_engine.restore_automation_managed_states(restored.automation_managed_states, restored.closed_markers)
+        self._automation_engine.restore_current_day_temperature_extrema(restored.current_day_temperature_extrema)
+        # Align the stored managed states with what was restored (drops invalid entries; no write if unchanged)
+        self._automation_state_store.schedule_save_automation_managed_states(self._automation_engine.export_automation_managed_states())
+        self._runtime_settings = dict(restored.runtime_settings)
+        self._startup_migrations = dict(restored.startup_migrations)
+        self.invalidate_resolved_settings()
 
     async def async_persist_runtime_state(self) -> None:
-        """Persist runtime state immediately."""
+        """Persist runtime state immediately, with a single write."""
 
-        await self._automation_state_store.async_save_automation_managed_states(self._automation_engine.export_automation_managed_states())
-        await self._automation_state_store.async_save_closed_markers(self._automation_engine.export_closed_by_automation_markers())
-        await self._automation_state_store.async_save_current_day_temperature_extrema(
-            self._automation_engine.export_current_day_temperature_extrema()
+        await self._automation_state_store.async_save_runtime_state(
+            automation_managed_states=self._automation_engine.export_automation_managed_states(),
+            closed_markers=self._automation_engine.export_closed_by_automation_markers(),
+            current_day_temperature_extrema=self._automation_engine.export_current_day_temperature_extrema(),
+            runtime_settings=self._runtime_settings,
         )
 
+    @property
+    def startup_migrations(self) -> dict[str, Any]:
+        """Return a copy of the record of completed startup migrations."""
+
+        return dict(self._startup_migrations)
+
+    def set_startup_migrations(self, record: dict[str, Any]) -> None:
+        """Store the record of completed startup migrations and schedule its persistence."""
+
+        self._startup_migrations = dict(record)
+        self._automation_state_store.schedule_save_startup_migrations(self._startup_migrations)
+
     async def async_remove_runtime_state(self) -> None:
         """Remove persisted runtime state for this config entry."""
 
         await self._automation_state_store.async_remove()
 
+    async def async_move_runtime_state_to_entry_file(self) -> None:
+        """Move persisted runtime state out of the shared storage file before shared storage is turned off."""
+
+        await self._automation_state_store.async_move_to_entry_file()
+
     def cancel_pending_cover_executions(self) -> None:
         """Cancel queued staggered cover executions for this coordinator."""
 
@@ -259,18 +425,148 @@ class DataUpdateCoordinator(BaseCoordinator[CoordinatorData]):
 
         self.hass.config_entries.async_update_entry(self.config_entry, options=new_options)
 
+    #
+    # effective_options
+    #
+    @property
+    def effective_options(self) -> dict[str, Any]:
+        """Return a copy of the config entry options overlaid with the runtime settings."""
+
+        options = dict(getattr(self.config_entry, const.HA_OPTIONS, {}) or {})
+        options.update(self._runtime_settings)
+        return options
+
+    #
+    # has_runtime_setting
+    #
+    def has_runtime_setting(self, key: str) -> bool:
+        """Return whether a value is set for a runtime setting."""
+
+        return key in self._runtime_settings or key in (getattr(self.config_entry, const.HA_OPTIONS, {}) or {})
+
+    #
+    # async_set_runtime_setting
+    #
+    async def async_set_runtime_setting(self, key: str, value: Any) -> None:
+        """Apply a runtime setting and schedule its persistence.
+
+        Runtime settings are values entities receive at runtime, often from
+        other automations (external tilt values, external times, external
+        control switches). They are kept outside the config entry options, so
+        frequent updates neither rewrite the config entries nor go through the
+        reload listener. Values still stored in the options by earlier versions
+        are moved out of them on their first update.
+
+        Args:
+            key: The configuration key of the setting
+            value: The new value
+        """
+
+        options = getattr(self.config_entry, const.HA_OPTIONS, {}) or {}
+        if key not in options and key in self._runtime_settings and self._runtime_settings[key] == value:
+            return
+
+        self._runtime_settings[key] = value
+        await self._async_apply_runtime_settings(key, options)
+
+    #
+    # async_remove_runtime_setting
+    #
+    async def async_remove_runtime_setting(self, key: str) -> None:
+        """Remove a runtime setting so the built-in behavior applies again."""
+
+        options = getattr(self.config_entry, const.HA_OPTIONS, {}) or {}
+        if key not in options and key not in self._runtime_settings:
+            return
+
+        self._runtime_settings.pop(key, None)
+        await self._async_apply_runtime_settings(key, options)
+
+    #
+    # discard_runtime_settings
+    #
+    def discard_runtime_settings(self, keys: set[str]) -> None:
+        """Drop stored runtime settings that no longer belong to an entity."""
+
+        stale_keys = keys & self._runtime_settings.keys()
+        if not stale_keys:
+            return
+
+        for key in stale_keys:
+            del self._runtime_settings[key]
+        self._automation_state_store.schedule_save_runtime_settings(self._runtime_settings)
+        self.invalidate_resolved_settings()
+
+    #
+    # runtime_setting_keys
+    #
+    @property
+    def runtime_setting_keys(self) -> set[str]:
+        """Return the keys of the stored runtime settings."""
+
+        return set(self._runtime_settings)
+
+    #
+    # _async_apply_runtime_settings
+    #
+    async def _async_apply_runtime_settings(self, key: str, options: Mapping[str, Any]) -> None:
+        """Persist the runtime settings after a change and re-evaluate the covers."""
+
+        self._automation_state_store.schedule_save_runtime_settings(self._runtime_settings)
+        self.invalidate_resolved_settings()
+
+        if key in options:
+            # Move a value stored by an earlier version out of the options (refreshes via the reload listener)
+            new_options = dict(options)
+            del new_options[key]
+            self.hass.config_entries.async_update_entry(self.config_entry, options=new_options)
+            return
+
+        await self.async_request_refresh()
+
+    #
+    # resolved_settings
+    #
+    @property
+    def resolved_settings(self) -> ResolvedConfig:
+        """Get the current resolved settings (runtime settings overlaid on the options)."""
+
+        return self._resolved_settings()
+
     #
     # _resolved_settings
     #
     def _resolved_settings(self) -> ResolvedConfig:
-        """Return resolved settings from the config entry options."""
+        """Return resolved settings from the config entry options.
+
+        The runtime settings are overlaid on the options. The resolved settings
+        are cached per options revision. The cache is reused as long as the
+        options compare equal to the snapshot taken when they were last
+        resolved, so an automation cycle resolves at most once regardless of
+        how many covers or service calls access the settings.
+        """
 
         from .config import resolve
 
         # Get configuration from options (all user settings are stored there)
-        opts = dict(getattr(self.config_entry, const.HA_OPTIONS, {}) or {})
+        snapshot = self.effective_options
 
-        return resolve(opts)
+        if self._resolved_settings_cache is not None and snapshot == self._resolved_settings_options:
+            return self._resolved_settings_cache
+
+        resolved = resolve(snapshot)
+        self._resolved_settings_options = snapshot
+        self._resolved_settings_cache = resolved
+        return resolved
+
+    #
+    # invalidate_resolved_settings
+    #
+    def invalidate_resolved_settings(self) -> None:
+        """Drop the cached resolved settings so they are rebuilt on next access."""
+
+        self._resolved_settings_cache = None
+        self._resolved_settings_options = None
 
     #
     # _async_update_data
@@ -302,12 +598,6 @@ class DataUpdateCoordinator(BaseCoordinator[CoordinatorData]):
         try:
             self._logger.info("Starting cover automation update")
 
-            # Read live options so that keys written during platform setup
-            # (e.g. by async_added_to_hass) are visible immediately, even
-            # before the reload listener has had a chance to update the
-            # runtime_data.config snapshot.
-            config = dict(getattr(self.config_entry, const.HA_OPTIONS, {}) or {})
-
             # Get the resolved settings - configuration errors are critical
             try:
                 resolved = self._resolved_settings()
@@ -316,6 +606,14 @@ class DataUpdateCoordinator(BaseCoordinator[CoordinatorData]):
                 self._logger.error(f"Critical configuration error: {err}")
                 raise UpdateFailed(f"Configuration error: {err}") from err
 
+            # Use the live options snapshot the resolved settings were built from,
+            # so that keys written during platform setup (e.g. by
+            # async_added_to_hass) are visible immediately, even before the
+            # reload listener has had a chance to update the runtime_data.config
+            # snapshot. The snapshot is stable per options revision, which lets
+            # the engine reuse its compiled per-cover settings.
+            config = self._resolved_settings_options or {}
+
             # Apply verbose logging setting (may have changed via switch)
             self._apply_verbose_logging(resolved.verbose_logging)
 
@@ -329,7 +627,10 @@ class DataUpdateCoordinator(BaseCoordinator[CoordinatorData]):
             self._automation_engine.config = config
 
             # Run the automation logic
-            return await self._automation_engine.run(states)
+            with self.cycle_timings.cycle():
+                result = await self._automation_engine.run(states)
+            self._schedule_wakeup()
+            return result
 
         except (SunSensorNotFoundError, WeatherEntityNotFoundError) as err:
             # Critical sensor errors - these make the automation non-functional
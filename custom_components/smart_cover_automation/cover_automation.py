@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -23,9 +24,12 @@ from homeassistant.const import (
 from . import const
 from .config import ResolvedConfig
 from .cover_position_history import CoverPositionHistoryManager, PositionEntry
+from .cover_settings import PerCoverSettings, compile_per_cover_settings
+from .cycle_timing import CycleStage, CycleTimings
 from .log import Log
 from .movement import AutomationManagedState, AutomationMode, MovementControlReason, MovementDecision, MovementDirection
-from .util import to_float_or_none, to_int_or_none
+from .sun_exposure import is_sun_hitting
+from .util import to_int_or_none
 
 if TYPE_CHECKING:
     from homeassistant.core import State
@@ -33,6 +37,14 @@ if TYPE_CHECKING:
 
 COVER_RESULT_NO_MOVEMENT = "no movement"
 
+# Standard logging levels of the log severities
+_LOG_SEVERITY_LEVELS: dict[const.LogSeverity, int] = {
+    const.LogSeverity.DEBUG: logging.DEBUG,
+    const.LogSeverity.INFO: logging.INFO,
+    const.LogSeverity.WARNING: logging.WARNING,
+    const.LogSeverity.ERROR: logging.ERROR,
+}
+
 
 class CoverMovementReason(Enum):
     """Encapsulates cover movement and reason."""
@@ -322,6 +334,8 @@ class CoverAutomation:
         cover_pos_history_mgr: CoverPositionHistoryManager,
         ha_interface: Any,
         logger: Log,
+        settings: PerCoverSettings | None = None,
+        cycle_timings: CycleTimings | None = None,
     ) -> None:
         """Initialize cover automation.
 
@@ -332,17 +346,27 @@ class CoverAutomation:
             cover_pos_history_mgr: Cover position history manager
             ha_interface: Home Assistant interface for API interactions
             logger: Instance-specific logger with entry_id prefix
+            settings: Precompiled per-cover settings for the current config revision.
+                When omitted, the settings are resolved from the raw config on access.
+            cycle_timings: Timing statistics recording evaluation and execution time
         """
 
         self.entity_id = entity_id
         self.resolved = resolved
         self.config = config
+        self.settings = settings
         self._cover_pos_history_mgr = cover_pos_history_mgr
         self._ha_interface = ha_interface
         self._logger = logger
+        self._cycle_timings = cycle_timings if cycle_timings is not None else CycleTimings()
 
-        # Tilt support: cached flag (set on first process() call)
+        # Tilt support: cached flag (set on first process() call), along with the
+        # supported-features value it was derived from
         self._cover_supports_tilt: bool | None = None
+        self._cover_supports_tilt_features: int | None = None
+
+        # Whether the last evaluation found nothing to do and only recorded the current position
+        self.last_evaluation_idle = False
 
     #
     # process
@@ -360,7 +384,7 @@ class CoverAutomation:
 
         cover_state, plan, ownership_debug_snapshot = await self.evaluate(state, sensor_data)
         if plan is None:
-            self._logger.debug(self._format_cover_result_debug_message(COVER_RESULT_NO_MOVEMENT, cover_state, ownership_debug_snapshot))
+            self.log_no_movement_result(cover_state, ownership_debug_snapshot)
             return cover_state
 
         return await self.execute_plan(plan)
@@ -370,6 +394,15 @@ class CoverAutomation:
     ) -> tuple[CoverState, CoverExecutionPlan | None, OwnershipDebugSnapshot]:
         """Evaluate automation for this cover and optionally return a deferred execution plan."""
 
+        with self._cycle_timings.measure(CycleStage.EVALUATE, self.entity_id):
+            return await self._evaluate(state, sensor_data)
+
+    async def _evaluate(
+        self, state: State | None, sensor_data: SensorData
+    ) -> tuple[CoverState, CoverExecutionPlan | None, OwnershipDebugSnapshot]:
+        """Evaluate automation for this cover (see evaluate)."""
+
+        self.last_evaluation_idle = False
         cover_state = CoverState()
         empty_ownership_snapshot = OwnershipDebugSnapshot(
             closed_by_automation_reason=None,
@@ -397,8 +430,13 @@ class CoverAutomation:
         features = state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
         cover_state.supported_features = features
 
-        if self._cover_supports_tilt is None:
+        # Refresh the cached tilt flag when the cover reports different features
+        # (e.g. a cover that came up with a reduced feature set at startup)
+        if self._cover_supports_tilt is None or (
+            self._cover_supports_tilt_features is not None and features != self._cover_supports_tilt_features
+        ):
             self._cover_supports_tilt = bool(int(features) & CoverEntityFeature.SET_TILT_POSITION)
+            self._cover_supports_tilt_features = features
 
         if self._cover_supports_tilt:
             cover_state.tilt_current = to_int_or_none(state.attributes.get(ATTR_CURRENT_TILT_POSITION))
@@ -482,6 +520,7 @@ class CoverAutomation:
                 cover_moved=False,
                 tilt_position=cover_state.tilt_current,
             )
+            self.last_evaluation_idle = True
             return cover_state, None, ownership_debug_snapshot
 
         cover_moved = self._is_cover_move_required(current_pos, desired_pos)
@@ -508,6 +547,12 @@ class CoverAutomation:
     async def execute_plan(self, plan: CoverExecutionPlan) -> CoverState:
         """Execute a previously evaluated cover plan."""
 
+        with self._cycle_timings.measure(CycleStage.EXECUTE, self.entity_id):
+            return await self._execute_plan(plan)
+
+    async def _execute_plan(self, plan: CoverExecutionPlan) -> CoverState:
+        """Execute a previously evaluated cover plan (see execute_plan)."""
+
         cover_state = plan.cover_state
         movement_decision = plan.effective_movement_decision
         cover_moved, actual_pos, message = await self._move_cover_if_needed(
@@ -537,9 +582,16 @@ class CoverAutomation:
             cover_moved,
         )
 
-        self._logger.debug(self._format_cover_result_debug_message(message, cover_state, plan.ownership_debug_snapshot))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_cover_result_debug_message(message, cover_state, plan.ownership_debug_snapshot))
         return cover_state
 
+    def log_no_movement_result(self, cover_state: CoverState, ownership_debug_snapshot: OwnershipDebugSnapshot) -> None:
+        """Log the per-cover result of an evaluation that produced no execution plan."""
+
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_cover_result_debug_message(COVER_RESULT_NO_MOVEMENT, cover_state, ownership_debug_snapshot))
+
     def _format_cover_result_debug_message(
         self, message: str, cover_state: CoverState, ownership_debug_snapshot: OwnershipDebugSnapshot
     ) -> str:
@@ -562,49 +614,39 @@ class CoverAutomation:
 
         return desired_pos != current_pos and abs(desired_pos - current_pos) >= self.resolved.covers_min_position_delta
 
+    #
+    # _get_settings
+    #
+    def _get_settings(self) -> PerCoverSettings:
+        """Return the effective per-cover settings.
+
+        Uses the precompiled settings handed in by the engine. Without them,
+        the settings are resolved from the raw config on every access.
+        """
+
+        if self.settings is not None:
+            return self.settings
+
+        return compile_per_cover_settings(self.entity_id, self.resolved, self.config, self._logger)
+
     #
     # _get_cover_azimuth
     #
     def _get_cover_azimuth(self) -> float | None:
         """Get and validate cover azimuth from configuration.
 
-        Args:
-            cover_attrs: Dictionary to store cover attributes
-
         Returns:
             Cover azimuth or None if invalid/missing
         """
-        cover_azimuth_raw = self.config.get(f"{self.entity_id}_{const.COVER_SFX_AZIMUTH}")
-        cover_azimuth = to_float_or_none(cover_azimuth_raw)
+        cover_azimuth = self._get_settings().azimuth
         if cover_azimuth is None:
             self._log_cover_msg("Cover has invalid or missing azimuth (direction), skipping", const.LogSeverity.INFO)
             return None
         return cover_azimuth
 
-    def _get_cover_sun_azimuth_tolerance_range(self) -> tuple[int, int]:
-        cover_tolerance_start_raw = self.config.get(f"{self.entity_id}_{const.COVER_SFX_SUN_AZIMUTH_TOLERANCE_START}")
-        cover_tolerance_end_raw = self.config.get(f"{self.entity_id}_{const.COVER_SFX_SUN_AZIMUTH_TOLERANCE_END}")
-        cover_tolerance_start = to_int_or_none(cover_tolerance_start_raw)
-        cover_tolerance_end = to_int_or_none(cover_tolerance_end_raw)
-        fallback_tolerance = self.resolved.sun_azimuth_tolerance
-
-        return (
-            fallback_tolerance if cover_tolerance_start is None else cover_tolerance_start,
-            fallback_tolerance if cover_tolerance_end is None else cover_tolerance_end,
-        )
-
     def _get_cover_sun_elevation_range(self) -> tuple[float, float]:
-        cover_elevation_min_raw = self.config.get(f"{self.entity_id}_{const.COVER_SFX_SUN_ELEVATION_MIN}")
-        cover_elevation_max_raw = self.config.get(f"{self.entity_id}_{const.COVER_SFX_SUN_ELEVATION_MAX}")
-        cover_elevation_min = to_float_or_none(cover_elevation_min_raw)
-        cover_elevation_max = to_float_or_none(cover_elevation_max_raw)
-        fallback_elevation_min = to_float_or_none(self.resolved.sun_elevation_threshold)
-        fallback_elevation_max = to_float_or_none(self.resolved.sun_elevation_max)
-
-        return (
-            0.0 if fallback_elevation_min is None else (fallback_elevation_min if cover_elevation_min is None else cover_elevation_min),
-            90.0 if fallback_elevation_max is None else (fallback_elevation_max if cover_elevation_max is None else cover_elevation_max),
-        )
+        settings = self._get_settings()
+        return settings.sun_elevation_min, settings.sun_elevation_max
 
     #
     # _validate_cover_state
@@ -952,16 +994,17 @@ class CoverAutomation:
         if self._cover_pos_history_mgr.get_closed_by_automation_reason(self.entity_id) is not None:
             self._cover_pos_history_mgr.set_automation_owned_position(self.entity_id, current_pos)
 
-        change_parts: list[str] = []
-        if position_changed:
-            change_parts.append(f"position {last_history_entry.position}% -> {current_pos}%")
-        if tilt_changed and current_tilt is not None and last_history_entry.tilt_position is not None:
-            change_parts.append(f"tilt {last_history_entry.tilt_position}% -> {current_tilt}%")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            change_parts: list[str] = []
+            if position_changed:
+                change_parts.append(f"position {last_history_entry.position}% -> {current_pos}%")
+            if tilt_changed and current_tilt is not None and last_history_entry.tilt_position is not None:
+                change_parts.append(f"tilt {last_history_entry.tilt_position}% -> {current_tilt}%")
 
-        self._log_cover_msg(
-            f"Ignoring expected recent automation {' and '.join(change_parts)} drift",
-            const.LogSeverity.DEBUG,
-        )
+            self._log_cover_msg(
+                f"Ignoring expected recent automation {' and '.join(change_parts)} drift",
+                const.LogSeverity.DEBUG,
+            )
         return True
 
     #
@@ -978,7 +1021,7 @@ class CoverAutomation:
         if expected_position is None:
             return
 
-        expires_at = datetime.now(timezone.utc) + (const.UPDATE_INTERVAL * const.COVER_AUTOMATION_SETTLE_CYCLES)
+        expires_at = datetime.now(timezone.utc) + const.COVER_AUTOMATION_SETTLE_WINDOW
         self._cover_pos_history_mgr.set_recent_automation_action(
             self.entity_id,
             expected_position=expected_position,
@@ -1123,13 +1166,7 @@ class CoverAutomation:
         """
 
         sun_azimuth_difference = self._calculate_angle_difference(sun_azimuth, cover_azimuth)
-        signed_sun_azimuth_difference = self._calculate_signed_angle_difference(sun_azimuth, cover_azimuth)
-        sun_azimuth_tolerance_start, sun_azimuth_tolerance_end = self._get_cover_sun_azimuth_tolerance_range()
-        sun_elevation_min, sun_elevation_max = self._get_cover_sun_elevation_range()
-        if sun_elevation_min <= sun_elevation_max and sun_elevation_min <= sun_elevation <= sun_elevation_max:
-            sun_hitting = -sun_azimuth_tolerance_start < signed_sun_azimuth_difference < sun_azimuth_tolerance_end
-        else:
-            sun_hitting = False
+        sun_hitting = is_sun_hitting(self._get_settings(), sun_azimuth, sun_elevation)
 
         return sun_hitting, sun_azimuth_difference
 
@@ -1184,12 +1221,6 @@ class CoverAutomation:
             diff = 360 - diff
         return diff
 
-    @staticmethod
-    def _calculate_signed_angle_difference(angle1: float, angle2: float) -> float:
-        """Calculate signed angle difference in degrees within the range [-180, 180)."""
-
-        return (angle1 - angle2 + 180) % 360 - 180
-
     #
     # _calculate_desired_position
     #
@@ -1576,10 +1607,11 @@ class CoverAutomation:
         per_cover_override = self.config.get(per_cover_key)
         if per_cover_override is not None:
             effective_temp_hot = bool(per_cover_override)
-            self._log_cover_msg(
-                f"Per-cover weather hot external control active: {'hot' if effective_temp_hot else 'not hot'}",
-                const.LogSeverity.DEBUG,
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._log_cover_msg(
+                    f"Per-cover weather hot external control active: {'hot' if effective_temp_hot else 'not hot'}",
+                    const.LogSeverity.DEBUG,
+                )
             return effective_temp_hot
 
         return sensor_data.temp_hot
@@ -1646,19 +1678,12 @@ class CoverAutomation:
             Closure limit position (0-100)
         """
 
+        settings = self._get_settings()
         if get_max and evening_closure:
-            per_cover_key = f"{self.entity_id}_{const.COVER_SFX_EVENING_CLOSURE_MAX_CLOSURE}"
-            global_default = self.resolved.evening_closure_max_closure
-        elif get_max:
-            per_cover_key = f"{self.entity_id}_{const.COVER_SFX_MAX_CLOSURE}"
-            global_default = self.resolved.covers_max_closure
-        else:
-            per_cover_key = f"{self.entity_id}_{const.COVER_SFX_MIN_CLOSURE}"
-            global_default = self.resolved.covers_min_closure
-
-        # Check for per-cover override, otherwise use global config
-        limit = to_int_or_none(self.config.get(per_cover_key))
-        return limit if limit is not None else global_default
+            return settings.evening_closure_max_closure
+        if get_max:
+            return settings.max_closure
+        return settings.min_closure
 
     #
     # _move_cover_if_needed
@@ -2076,7 +2101,8 @@ class CoverAutomation:
 
         Per-cover external tilt values are only considered when the cover has an
         explicit per-cover external mode override. Otherwise the matching global
-        external tilt value is used.
+        external tilt value is used. Invalid or out-of-range values are dropped
+        (and logged) when the per-cover settings are compiled.
 
         Args:
             is_night: True when evaluating night/evening closure, False for day.
@@ -2085,46 +2111,8 @@ class CoverAutomation:
             Tilt value between 0 and 100, or None when no external value exists.
         """
 
-        def _validate_external_tilt_value(raw_value: Any, config_key: str) -> int | None:
-            """Convert and validate one external tilt value.
-
-            Invalid or out-of-range values are ignored so they never reach the
-            service layer.
-            """
-
-            tilt_value = to_int_or_none(raw_value)
-            if tilt_value is None:
-                if raw_value is not None:
-                    self._log_cover_msg(
-                        f"Invalid external tilt value for {config_key}: {raw_value!r}, skipping",
-                        const.LogSeverity.WARNING,
-                    )
-                return None
-
-            if not (const.COVER_POS_FULLY_CLOSED <= tilt_value <= const.COVER_POS_FULLY_OPEN):
-                self._log_cover_msg(
-                    f"External tilt value out of range for {config_key}: {tilt_value}, skipping",
-                    const.LogSeverity.WARNING,
-                )
-                return None
-
-            return tilt_value
-
-        if is_night:
-            per_cover_mode_suffix = const.COVER_SFX_TILT_MODE_NIGHT
-            per_cover_value_suffix = const.COVER_SFX_TILT_EXTERNAL_VALUE_NIGHT
-            global_value_key = const.NUMBER_KEY_TILT_EXTERNAL_VALUE_NIGHT
-        else:
-            per_cover_mode_suffix = const.COVER_SFX_TILT_MODE_DAY
-            per_cover_value_suffix = const.COVER_SFX_TILT_EXTERNAL_VALUE_DAY
-            global_value_key = const.NUMBER_KEY_TILT_EXTERNAL_VALUE_DAY
-
-        per_cover_mode_key = f"{self.entity_id}_{per_cover_mode_suffix}"
-        if self.config.get(per_cover_mode_key) == const.TiltMode.EXTERNAL:
-            per_cover_value_key = f"{self.entity_id}_{per_cover_value_suffix}"
-            return _validate_external_tilt_value(self.config.get(per_cover_value_key), per_cover_value_key)
-
-        return _validate_external_tilt_value(self.config.get(global_value_key), global_value_key)
+        settings = self._get_settings()
+        return settings.external_tilt_value_night if is_night else settings.external_tilt_value_day
 
     #
     # _apply_tilt
@@ -2278,6 +2266,10 @@ class CoverAutomation:
             severity: Log severity level
         """
 
+        # Skip formatting for disabled levels
+        if not self._logger.isEnabledFor(_LOG_SEVERITY_LEVELS[severity]):
+            return
+
         # Prefix message with entity ID
         message = f"[{self.entity_id}] {message}"
 
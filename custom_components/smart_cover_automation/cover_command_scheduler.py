@@ -0,0 +1,377 @@
+"""Rate-limited scheduler for queued cover commands.
+
+Covers are commonly controlled through radio gateways (Zigbee, KNX, ...) that
+each have their own throughput limit. Queued cover executions are therefore
+dispatched per command group (config entry, device or integration): while rate
+limiting is enabled, each group honors a token bucket and has at most one
+command in flight, and due commands run in priority order, e.g., heat-protection
+closings before let-light-in openings. Every dispatched command runs as its own
+task, so a slow cover only holds back its own group. Without rate limiting,
+commands run as soon as they are due and may overlap freely.
+
+A command is one cover execution and is charged one token, even if it sends a
+tilt call after the position call. The rate limit thus counts cover movements,
+not service calls.
+
+Queued commands are kept in two heaps: a timeline ordered by due time and a
+ready queue ordered by priority. Replacing or cancelling a command only marks
+its heap entries stale. Dispatching is driven by a single ``loop.call_at``
+timer armed for the earliest deadline, and by finishing commands.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from enum import IntEnum
+
+from .config import ResolvedConfig
+from .log import Log
+
+__all__ = ["CoverCommandPriority", "CoverCommandScheduler"]
+
+# Stale heap entries tolerated before the heaps are compacted
+_STALE_ENTRY_SLACK = 32
+
+# Commands of one rate-limited command group executing at the same time
+_MAX_IN_FLIGHT_PER_GROUP = 1
+
+
+#
+# CoverCommandPriority
+#
+class CoverCommandPriority(IntEnum):
+    """Dispatch priority of a queued cover command (lower values run first)."""
+
+    HEAT_PROTECTION = 0
+    CLOSING = 1
+    OPENING = 2
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    """Token bucket limiting the command rate of one command group."""
+
+    capacity: float
+    refill_per_second: float
+    tokens: float
+    updated_at: float
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    def seconds_until_token(self) -> float:
+        """Return the time until the next token is available."""
+
+        return max(0.0, (1.0 - self.tokens) / self.refill_per_second)
+
+
+@dataclass(slots=True)
+class _ScheduledCommand:
+    """One queued command."""
+
+    key: str
+    group: Hashable
+    priority: int
+    due: float
+    sequence: int
+    job: Callable[[], Awaitable[None]]
+
+
+class CoverCommandScheduler:
+    """Dispatches queued cover commands per command group."""
+
+    #
+    # __init__
+    #
+    def __init__(self, resolved_settings_callback: Callable[[], ResolvedConfig], logger: Log) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            resolved_settings_callback: Callback to get current resolved configuration
+            logger: Instance-specific logger with entry_id prefix
+        """
+
+        self._resolved_settings_callback = resolved_settings_callback
+        self._logger = logger
+        self._commands: dict[str, _ScheduledCommand] = {}
+        self._timeline: list[tuple[float, int, str]] = []  # Heap of (due, sequence, key) not yet due
+        self._ready: list[tuple[int, float, int, str]] = []  # Heap of (priority, due, sequence, key) due
+        self._buckets: dict[Hashable, _TokenBucket] = {}
+        self._in_flight: dict[Hashable, int] = {}
+        self._running: set[asyncio.Task[None]] = set()
+        self._sequence = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    #
+    # __contains__
+    #
+    def __contains__(self, key: object) -> bool:
+        """Return whether a command is queued for the key."""
+
+        return key in self._commands
+
+    #
+    # schedule
+    #
+    def schedule(
+        self,
+        key: str,
+        group: Hashable,
+        priority: int,
+        delay_seconds: float,
+        job: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Queue a command, replacing a command already queued for the same key.
+
+        Args:
+            key: Identifies the command (e.g., the cover entity ID)
+            group: Command group sharing one rate limit
+            priority: Dispatch priority among due commands (lower runs first)
+            delay_seconds: Earliest time the command may run, relative to now
+            job: Coroutine function executing the command
+        """
+
+        loop = asyncio.get_running_loop()
+        self._sequence += 1
+        command = _ScheduledCommand(
+            key=key,
+            group=group,
+            priority=priority,
+            due=loop.time() + max(0.0, delay_seconds),
+            sequence=self._sequence,
+            job=job,
+        )
+        # A command queued earlier for the key becomes stale in the heaps
+        self._commands[key] = command
+        heapq.heappush(self._timeline, (command.due, command.sequence, key))
+        if len(self._timeline) + len(self._ready) > 2 * len(self._commands) + _STALE_ENTRY_SLACK:
+            self._compact()
+
+        self._arm_timer(command.due)
+
+    #
+    # cancel
+    #
+    def cancel(self, key: str) -> bool:
+        """Remove the command queued for the key. Returns whether one was queued."""
+
+        if self._commands.pop(key, None) is None:
+            return False
+
+        if not self._commands:
+            self._clear_queue()
+        return True
+
+    #
+    # cancel_all
+    #
+    def cancel_all(self) -> None:
+        """Remove all queued commands. Commands already executing are not interrupted."""
+
+        self._clear_queue()
+
+    #
+    # _dispatch
+    #
+    def _dispatch(self) -> None:
+        """Start all commands allowed to run now and arm the timer for the next one."""
+
+        loop = asyncio.get_running_loop()
+        while True:
+            command, wait_seconds = self._next_command(loop.time())
+            if command is None:
+                break
+
+            del self._commands[command.key]
+            self._in_flight[command.group] = self._in_flight.get(command.group, 0) + 1
+            task = asyncio.create_task(self._async_run_command(command))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+        if wait_seconds is not None:
+            self._arm_timer(loop.time() + wait_seconds)
+
+    #
+    # _async_run_command
+    #
+    async def _async_run_command(self, command: _ScheduledCommand) -> None:
+        """Execute one dispatched command, then dispatch the commands it held back."""
+
+        try:
+            await command.job()
+        except Exception as err:
+            self._logger.error(f"[{command.key}] Failed queued cover command: {err}")
+        finally:
+            in_flight = self._in_flight.pop(command.group, 1) - 1
+            if in_flight > 0:
+                self._in_flight[command.group] = in_flight
+            if self._commands:
+                self._dispatch()
+
+    #
+    # _next_command
+    #
+    def _next_command(self, now: float) -> tuple[_ScheduledCommand | None, float | None]:
+        """Return the next command allowed to run, or how long to wait for one.
+
+        Due commands are considered in priority order. Without rate limiting,
+        the first due command is returned. Otherwise, a command whose group has
+        no token left or a command in flight is skipped so it does not hold back
+        other groups. Groups waiting for an executing command report no wait
+        time; they are dispatched again once that command finishes.
+        """
+
+        # Move the commands that became due from the timeline to the ready queue
+        while self._timeline and self._timeline[0][0] <= now:
+            due, sequence, key = heapq.heappop(self._timeline)
+            command = self._get_live_command(key, sequence)
+            if command is not None:
+                heapq.heappush(self._ready, (command.priority, due, sequence, key))
+
+        wait_seconds: float | None = None
+        blocked_entries: list[tuple[int, float, int, str]] = []
+        blocked_groups: set[Hashable] = set()
+        next_command: _ScheduledCommand | None = None
+        while self._ready:
+            entry = heapq.heappop(self._ready)
+            command = self._get_live_command(entry[3], entry[2])
+            if command is None:
+                continue
+
+            if command.group in blocked_groups:
+                blocked_entries.append(entry)
+                continue
+
+            bucket = self._get_bucket(command.group, now)
+            if bucket is None:
+                next_command = command
+                break
+
+            if self._in_flight.get(command.group, 0) >= _MAX_IN_FLIGHT_PER_GROUP:
+                blocked_entries.append(entry)
+                blocked_groups.add(command.group)
+                continue
+
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                next_command = command
+                break
+
+            blocked_entries.append(entry)
+            blocked_groups.add(command.group)
+            wait_seconds = self._min_wait(wait_seconds, bucket.seconds_until_token())
+
+        for entry in blocked_entries:
+            heapq.heappush(self._ready, entry)
+
+        if next_command is not None:
+            return next_command, None
+
+        while self._timeline and self._get_live_command(self._timeline[0][2], self._timeline[0][1]) is None:
+            heapq.heappop(self._timeline)
+        if self._timeline:
+            wait_seconds = self._min_wait(wait_seconds, self._timeline[0][0] - now)
+
+        return None, wait_seconds
+
+    #
+    # _get_live_command
+    #
+    def _get_live_command(self, key: str, sequence: int) -> _ScheduledCommand | None:
+        """Return the command for a heap entry, or None if the entry is stale."""
+
+        command = self._commands.get(key)
+        if command is None or command.sequence != sequence:
+            return None
+        return command
+
+    #
+    # _arm_timer
+    #
+    def _arm_timer(self, when: float) -> None:
+        """Arm the dispatch timer for the given loop time unless an earlier one is armed."""
+
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+
+        self._timer = asyncio.get_running_loop().call_at(when, self._on_timer)
+
+    #
+    # _on_timer
+    #
+    def _on_timer(self) -> None:
+        """Dispatch the commands due when the armed deadline is reached."""
+
+        self._timer = None
+        self._dispatch()
+
+    #
+    # _cancel_timer
+    #
+    def _cancel_timer(self) -> None:
+        """Cancel the armed wake-up timer."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    #
+    # _compact
+    #
+    def _compact(self) -> None:
+        """Drop stale heap entries left behind by replaced or cancelled commands."""
+
+        self._timeline = [entry for entry in self._timeline if self._get_live_command(entry[2], entry[1]) is not None]
+        self._ready = [entry for entry in self._ready if self._get_live_command(entry[3], entry[2]) is not None]
+        heapq.heapify(self._timeline)
+        heapq.heapify(self._ready)
+
+    #
+    # _clear_queue
+    #
+    def _clear_queue(self) -> None:
+        """Drop all queued commands and their heap entries."""
+
+        self._commands.clear()
+        self._timeline.clear()
+        self._ready.clear()
+        self._cancel_timer()
+
+    #
+    # _get_bucket
+    #
+    def _get_bucket(self, group: Hashable, now: float) -> _TokenBucket | None:
+        """Return the refilled token bucket for a group (None when rate limiting is off)."""
+
+        resolved = self._resolved_settings_callback()
+        commands_per_minute = max(0, resolved.cover_movement_rate_limit)
+        if commands_per_minute == 0:
+            self._buckets.clear()
+            return None
+
+        capacity = float(max(1, resolved.cover_movement_rate_limit_burst))
+        refill_per_second = commands_per_minute / 60.0
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            bucket = self._buckets[group] = _TokenBucket(capacity, refill_per_second, capacity, now)
+        else:
+            bucket.refill(now)
+            bucket.capacity = capacity
+            bucket.refill_per_second = refill_per_second
+            bucket.tokens = min(bucket.tokens, capacity)
+
+        return bucket
+
+    @staticmethod
+    def _min_wait(current: float | None, candidate: float) -> float:
+        """Return the smaller of two wait times, treating None as unbounded."""
+
+        return candidate if current is None else min(current, candidate)
@@ -113,10 +113,16 @@ class CoverPositionHistoryManager:
 
     def __init__(
         self,
-        on_automation_managed_states_changed: Callable[[dict[str, dict[str, Any]]], None] | None = None,
+        on_automation_managed_states_changed: Callable[[dict[str, dict[str, Any] | None]], None] | None = None,
         on_closed_by_automation_changed: Callable[[dict[str, str]], None] | None = None,
     ) -> None:
-        """Initialize the position history manager."""
+        """Initialize the position history manager.
+
+        Args:
+            on_automation_managed_states_changed: Called with the persistence payload
+                of each changed cover (None for a cleared cover)
+            on_closed_by_automation_changed: Legacy callback receiving all close markers
+        """
         if on_automation_managed_states_changed is None and on_closed_by_automation_changed is not None:
             on_automation_managed_states_changed = lambda _states: on_closed_by_automation_changed(  # noqa: E731
                 self.export_closed_by_automation_markers()
@@ -129,13 +135,14 @@ class CoverPositionHistoryManager:
         self._on_automation_managed_states_changed = on_automation_managed_states_changed
         self._recent_automation_actions: dict[str, RecentAutomationAction] = {}
 
-    def _notify_automation_managed_states_changed(self) -> None:
-        """Persist automation-managed states when they change."""
+    def _notify_automation_managed_states_changed(self, entity_id: str) -> None:
+        """Persist the automation-managed state of a cover when it changes."""
 
         if self._on_automation_managed_states_changed is None:
             return
 
-        self._on_automation_managed_states_changed(self.export_automation_managed_states())
+        state = self._automation_managed_states.get(entity_id)
+        self._on_automation_managed_states_changed({entity_id: None if state is None else _export_automation_managed_state(state)})
 
     #
     # add
@@ -270,7 +277,7 @@ class CoverPositionHistoryManager:
             return
 
         self._automation_managed_states[entity_id] = state
-        self._notify_automation_managed_states_changed()
+        self._notify_automation_managed_states_changed(entity_id)
 
     def get_automation_managed_state(self, entity_id: str) -> AutomationManagedState | None:
         """Return the current automation-managed state for a cover."""
@@ -284,7 +291,7 @@ class CoverPositionHistoryManager:
             return
 
         self._automation_managed_states.pop(entity_id, None)
-        self._notify_automation_managed_states_changed()
+        self._notify_automation_managed_states_changed(entity_id)
 
     def was_closed_by_automation(self, entity_id: str) -> bool:
         """Return whether the cover is currently marked as automation-closed."""
@@ -355,10 +362,7 @@ class CoverPositionHistoryManager:
     def export_automation_managed_states(self) -> dict[str, dict[str, Any]]:
         """Return automation-managed state as a persistence-friendly payload."""
 
-        return {
-            entity_id: {"position": state.position, "automation_mode": state.automation_mode.value}
-            for entity_id, state in self._automation_managed_states.items()
-        }
+        return {entity_id: _export_automation_managed_state(state) for entity_id, state in self._automation_managed_states.items()}
 
     def restore_closed_by_automation_markers(self, markers: Mapping[str, str]) -> None:
         """Restore only the legacy close markers for compatibility.
@@ -453,3 +457,9 @@ def _automation_mode_for_persisted_value(raw_value: str) -> AutomationMode | Non
         return AutomationMode(raw_value)
     except ValueError:
         return _movement_cause_for_legacy_reason_key(raw_value)
+
+
+def _export_automation_managed_state(state: AutomationManagedState) -> dict[str, Any]:
+    """Return the persistence payload of one automation-managed state."""
+
+    return {"position": state.position, "automation_mode": state.automation_mode.value}
@@ -0,0 +1,152 @@
+"""Precompiled per-cover settings.
+
+Per-cover settings are stored as flat, suffixed keys in the config entry
+options (e.g. ``cover.living_room_cover_azimuth``). Looking them up requires
+string formatting, dict probes and type coercion. This module resolves them
+once per configuration revision into slotted records that the per-cycle hot
+path can read with plain attribute access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from . import const
+from .config import ResolvedConfig
+from .log import Log
+from .util import to_float_or_none, to_int_or_none
+
+__all__ = ["PerCoverSettings", "compile_per_cover_settings", "compile_per_cover_settings_table"]
+
+
+@dataclass(slots=True, frozen=True)
+class PerCoverSettings:
+    """Effective settings of one cover, with per-cover overrides applied."""
+
+    entity_id: str
+    azimuth: float | None
+    sun_azimuth_tolerance_start: int
+    sun_azimuth_tolerance_end: int
+    sun_elevation_min: float
+    sun_elevation_max: float
+    min_closure: int
+    max_closure: int
+    evening_closure_max_closure: int
+    external_tilt_value_day: int | None
+    external_tilt_value_night: int | None
+
+
+#
+# compile_per_cover_settings
+#
+def compile_per_cover_settings(
+    entity_id: str,
+    resolved: ResolvedConfig,
+    config: Mapping[str, Any],
+    logger: Log,
+) -> PerCoverSettings:
+    """Resolve the effective settings of one cover.
+
+    Args:
+        entity_id: Cover entity ID
+        resolved: Resolved global settings (fallbacks for per-cover overrides)
+        config: Raw configuration dictionary holding the per-cover keys
+        logger: Logger used to report invalid external tilt values
+
+    Returns:
+        Compiled settings record for the cover
+    """
+
+    def _per_cover(suffix: str) -> Any:
+        return config.get(f"{entity_id}_{suffix}")
+
+    # Sun azimuth tolerance range
+    fallback_tolerance = resolved.sun_azimuth_tolerance
+    tolerance_start = to_int_or_none(_per_cover(const.COVER_SFX_SUN_AZIMUTH_TOLERANCE_START))
+    tolerance_end = to_int_or_none(_per_cover(const.COVER_SFX_SUN_AZIMUTH_TOLERANCE_END))
+
+    # Sun elevation range
+    elevation_min = to_float_or_none(_per_cover(const.COVER_SFX_SUN_ELEVATION_MIN))
+    elevation_max = to_float_or_none(_per_cover(const.COVER_SFX_SUN_ELEVATION_MAX))
+    fallback_elevation_min = to_float_or_none(resolved.sun_elevation_threshold)
+    fallback_elevation_max = to_float_or_none(resolved.sun_elevation_max)
+
+    # Closure limits
+    min_closure = to_int_or_none(_per_cover(const.COVER_SFX_MIN_CLOSURE))
+    max_closure = to_int_or_none(_per_cover(const.COVER_SFX_MAX_CLOSURE))
+    evening_closure_max_closure = to_int_or_none(_per_cover(const.COVER_SFX_EVENING_CLOSURE_MAX_CLOSURE))
+
+    return PerCoverSettings(
+        entity_id=entity_id,
+        azimuth=to_float_or_none(_per_cover(const.COVER_SFX_AZIMUTH)),
+        sun_azimuth_tolerance_start=fallback_tolerance if tolerance_start is None else tolerance_start,
+        sun_azimuth_tolerance_end=fallback_tolerance if tolerance_end is None else tolerance_end,
+        sun_elevation_min=0.0 if fallback_elevation_min is None else (fallback_elevation_min if elevation_min is None else elevation_min),
+        sun_elevation_max=90.0 if fallback_elevation_max is None else (fallback_elevation_max if elevation_max is None else elevation_max),
+        min_closure=resolved.covers_min_closure if min_closure is None else min_closure,
+        max_closure=resolved.covers_max_closure if max_closure is None else max_closure,
+        evening_closure_max_closure=(
+            resolved.evening_closure_max_closure if evening_closure_max_closure is None else evening_closure_max_closure
+        ),
+        external_tilt_value_day=_resolve_external_tilt_value(entity_id, config, logger, is_night=False),
+        external_tilt_value_night=_resolve_external_tilt_value(entity_id, config, logger, is_night=True),
+    )
+
+
+#
+# compile_per_cover_settings_table
+#
+def compile_per_cover_settings_table(
+    covers: Iterable[str],
+    resolved: ResolvedConfig,
+    config: Mapping[str, Any],
+    logger: Log,
+) -> dict[str, PerCoverSettings]:
+    """Resolve the effective settings of all given covers, keyed by entity ID."""
+
+    return {entity_id: compile_per_cover_settings(entity_id, resolved, config, logger) for entity_id in covers}
+
+
+#
+# _resolve_external_tilt_value
+#
+def _resolve_external_tilt_value(entity_id: str, config: Mapping[str, Any], logger: Log, is_night: bool) -> int | None:
+    """Resolve the active external tilt value for one cover.
+
+    Per-cover external tilt values are only considered when the cover has an
+    explicit per-cover external mode override. Otherwise the matching global
+    external tilt value is used. Invalid or out-of-range values are ignored so
+    they never reach the service layer.
+
+    Returns:
+        Tilt value between 0 and 100, or None when no valid external value exists.
+    """
+
+    if is_night:
+        per_cover_mode_suffix = const.COVER_SFX_TILT_MODE_NIGHT
+        per_cover_value_suffix = const.COVER_SFX_TILT_EXTERNAL_VALUE_NIGHT
+        global_value_key = const.NUMBER_KEY_TILT_EXTERNAL_VALUE_NIGHT
+    else:
+        per_cover_mode_suffix = const.COVER_SFX_TILT_MODE_DAY
+        per_cover_value_suffix = const.COVER_SFX_TILT_EXTERNAL_VALUE_DAY
+        global_value_key = const.NUMBER_KEY_TILT_EXTERNAL_VALUE_DAY
+
+    if config.get(f"{entity_id}_{per_cover_mode_suffix}") == const.TiltMode.EXTERNAL:
+        config_key = f"{entity_id}_{per_cover_value_suffix}"
+    else:
+        config_key = global_value_key
+
+    raw_value = config.get(config_key)
+    tilt_value = to_int_or_none(raw_value)
+    if tilt_value is None:
+        if raw_value is not None:
+            logger.warning(f"[{entity_id}] Invalid external tilt value for {config_key}: {raw_value!r}, skipping")
+        return None
+
+    if not (const.COVER_POS_FULLY_CLOSED <= tilt_value <= const.COVER_POS_FULLY_OPEN):
+        logger.warning(f"[{entity_id}] External tilt value out of range for {config_key}: {tilt_value}, skipping")
+        return None
+
+    return tilt_value
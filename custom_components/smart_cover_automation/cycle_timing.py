@@ -0,0 +1,185 @@
+"""Rolling timing statistics for automation cycles.
+
+Each coordinator update is one cycle. Within a cycle, the time spent in each
+stage (sensor gathering, forecast call, cover evaluation and execution,
+service calls, logbook) is summed up, and the per-stage totals are added to a
+rolling window when the cycle ends. Evaluation and execution are additionally
+tracked per cover, which shows the covers or backends slowing the loop down.
+
+Stage totals are summed busy time, not wall time: when covers are processed
+concurrently, the time of overlapping work adds up and a stage total can exceed
+the duration of the cycle.
+
+Work is attributed to a cycle by context: only code running in the cycle's
+task, or in tasks started from it, adds to the cycle totals. Work done outside
+a cycle, e.g., queued cover executions still running after the cycle ended,
+is recorded as a sample of its own.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any
+
+from . import const
+
+__all__ = ["CycleStage", "CycleTimings"]
+
+
+#
+# CycleStage
+#
+class CycleStage(StrEnum):
+    """Timed stages of an automation cycle."""
+
+    CYCLE = "cycle"  # The complete coordinator update
+    SENSOR_DATA = "sensor_data"  # Gathering sun, weather and temperature data
+    FORECAST = "forecast"  # Weather forecast service call (part of sensor data)
+    EVALUATE = "evaluate"  # Evaluating the covers
+    EXECUTE = "execute"  # Executing cover movements (includes service calls and logbook)
+    SERVICE_CALLS = "service_calls"  # Cover service calls
+    LOGBOOK = "logbook"  # Writing logbook entries
+
+
+class CycleTimings:
+    """Collects stage timings and summarizes them as rolling percentiles."""
+
+    #
+    # __init__
+    #
+    def __init__(self, window_size: int = const.CYCLE_TIMING_WINDOW_SIZE) -> None:
+        """Initialize the timing statistics.
+
+        Args:
+            window_size: Number of samples kept per stage and per cover stage
+        """
+
+        self._window_size = window_size
+        self._samples: dict[CycleStage, deque[float]] = {}
+        self._cover_samples: dict[str, dict[CycleStage, deque[float]]] = {}
+        self._cycle_totals: ContextVar[dict[CycleStage, float] | None] = ContextVar(f"cycle_totals_{id(self)}", default=None)
+        self._active_cycle_totals: dict[CycleStage, float] | None = None
+
+    #
+    # cycle
+    #
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        """Time one automation cycle and record its per-stage totals at the end."""
+
+        cycle_totals: dict[CycleStage, float] = {}
+        self._active_cycle_totals = cycle_totals
+        token = self._cycle_totals.set(cycle_totals)
+        try:
+            with self.measure(CycleStage.CYCLE):
+                yield
+        finally:
+            self._cycle_totals.reset(token)
+            self._active_cycle_totals = None
+            for stage, seconds in cycle_totals.items():
+                self._add_sample(self._samples, stage, seconds)
+
+    #
+    # measure
+    #
+    @contextmanager
+    def measure(self, stage: CycleStage, entity_id: str | None = None) -> Iterator[None]:
+        """Time a block of work belonging to a stage.
+
+        Args:
+            stage: The stage the work belongs to
+            entity_id: The cover the work is done for, if any
+        """
+
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started_at, entity_id)
+
+    #
+    # record
+    #
+    def record(self, stage: CycleStage, seconds: float, entity_id: str | None = None) -> None:
+        """Record time spent in a stage.
+
+        Work running in the context of the current cycle is added to the stage's
+        cycle total. Anything else, including tasks started by an earlier cycle
+        that has ended since, is recorded as a sample of its own.
+        """
+
+        if entity_id is not None:
+            self._add_sample(self._cover_samples.setdefault(entity_id, {}), stage, seconds)
+
+        cycle_totals = self._cycle_totals.get()
+        if cycle_totals is None or cycle_totals is not self._active_cycle_totals or stage == CycleStage.CYCLE:
+            self._add_sample(self._samples, stage, seconds)
+        else:
+            cycle_totals[stage] = cycle_totals.get(stage, 0.0) + seconds
+
+    #
+    # forget_covers
+    #
+    def forget_covers(self, keep: set[str]) -> None:
+        """Drop the per-cover samples of covers that are no longer configured."""
+
+        for entity_id in tuple(self._cover_samples):
+            if entity_id not in keep:
+                del self._cover_samples[entity_id]
+
+    #
+    # as_dict
+    #
+    def as_dict(self) -> dict[str, Any]:
+        """Return the rolling p50/p95/max per stage and per cover stage, in milliseconds."""
+
+        return {
+            "window_size": self._window_size,
+            "stages": {stage.value: _summarize(samples) for stage, samples in self._samples.items()},
+            "covers": {
+                entity_id: {stage.value: _summarize(samples) for stage, samples in cover_samples.items()}
+                for entity_id, cover_samples in sorted(self._cover_samples.items())
+            },
+        }
+
+    #
+    # _add_sample
+    #
+    def _add_sample(self, samples: dict[CycleStage, deque[float]], stage: CycleStage, seconds: float) -> None:
+        """Append a sample to a stage's rolling window."""
+
+        window = samples.get(stage)
+        if window is None:
+            window = samples[stage] = deque(maxlen=self._window_size)
+        window.append(seconds)
+
+
+#
+# _summarize
+#
+def _summarize(samples: deque[float]) -> dict[str, Any]:
+    """Return the sample count and the p50/p95/max of a rolling window in milliseconds."""
+
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": _percentile_ms(ordered, 50),
+        "p95_ms": _percentile_ms(ordered, 95),
+        "max_ms": round(ordered[-1] * 1000, 1),
+    }
+
+
+#
+# _percentile_ms
+#
+def _percentile_ms(ordered: list[float], percentile: int) -> float:
+    """Return the nearest-rank percentile of sorted samples in milliseconds."""
+
+    rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+    return round(ordered[rank - 1] * 1000, 1)
@@ -0,0 +1,28 @@
+"""Diagnostics support for Smart Cover Automation.
+
+The diagnostics download contains the rolling timing statistics of the
+automation cycles, showing where the time of a cycle goes and which covers
+or backends slow it down.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import IntegrationConfigEntry
+
+
+#
+# async_get_config_entry_diagnostics
+#
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: IntegrationConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    coordinator = entry.runtime_data.coordinator
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "cycle_timings": coordinator.cycle_timings.as_dict(),
+    }
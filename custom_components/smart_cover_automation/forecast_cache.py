@@ -0,0 +1,123 @@
+"""Shared cache for weather forecast service responses.
+
+Calling ``weather.get_forecasts`` is a blocking service round trip, while daily
+forecasts only change a few times per day. Responses are therefore cached per
+weather entity and forecast type. A cached forecast is reused until
+``const.WEATHER_FORECAST_CACHE_TTL`` expires or the weather entity's state is updated, whichever comes first.
+
+One cache instance is kept in ``hass.data`` so that all config entries using the
+same weather entity share the cached responses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from . import const
+
+__all__ = ["ForecastCache", "get_shared_forecast_cache"]
+
+
+@dataclass(slots=True, frozen=True)
+class _ForecastCacheEntry:
+    """One cached forecast list plus the data needed to validate it."""
+
+    forecast_list: list[Any]
+    weather_last_updated: datetime
+    fetched_at: datetime
+
+
+class ForecastCache:
+    """Cache of forecast lists keyed by weather entity and forecast type."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+
+        self._entries: dict[tuple[str, str], _ForecastCacheEntry] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    #
+    # lock
+    #
+    def lock(self, entity_id: str, forecast_type: str) -> asyncio.Lock:
+        """Return the lock serializing fetches for one cache key.
+
+        Holding the lock while checking the cache and fetching makes concurrent
+        callers (e.g., several config entries refreshing at the same time) wait
+        for the first fetch instead of issuing their own service calls.
+        """
+
+        key = (entity_id, forecast_type)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    #
+    # get
+    #
+    def get(self, entity_id: str, forecast_type: str, weather_last_updated: datetime) -> list[Any] | None:
+        """Return the cached forecast list, or None if missing or stale.
+
+        Args:
+            entity_id: Weather entity ID
+            forecast_type: Forecast type (e.g., "daily")
+            weather_last_updated: Current ``last_updated`` of the weather entity's state
+
+        Returns:
+            Cached forecast list, or None if the entry must be refreshed
+        """
+
+        key = (entity_id, forecast_type)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.weather_last_updated != weather_last_updated or dt_util.utcnow() - entry.fetched_at >= const.WEATHER_FORECAST_CACHE_TTL:
+            del self._entries[key]
+            return None
+
+        return entry.forecast_list
+
+    #
+    # store
+    #
+    def store(self, entity_id: str, forecast_type: str, weather_last_updated: datetime, forecast_list: list[Any]) -> None:
+        """Cache a freshly fetched forecast list."""
+
+        self._entries[(entity_id, forecast_type)] = _ForecastCacheEntry(
+            forecast_list=forecast_list,
+            weather_last_updated=weather_last_updated,
+            fetched_at=dt_util.utcnow(),
+        )
+
+    #
+    # invalidate
+    #
+    def invalidate(self, entity_id: str | None = None) -> None:
+        """Drop cached forecasts of one weather entity, or all if no entity is given."""
+
+        if entity_id is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == entity_id]:
+            del self._entries[key]
+
+
+#
+# get_shared_forecast_cache
+#
+def get_shared_forecast_cache(hass: Any) -> ForecastCache:
+    """Return the forecast cache shared by all config entries of this integration."""
+
+    domain_data = hass.data.setdefault(const.DOMAIN, {})
+    cache = domain_data.get(const.DATA_FORECAST_CACHE)
+    if cache is None:
+        cache = domain_data[const.DATA_FORECAST_CACHE] = ForecastCache()
+    return cache
@@ -6,12 +6,12 @@ encapsulating all direct interactions with the HA core system.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Coroutine, Sequence
 from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
-from astral.sun import azimuth as astral_azimuth  # type: ignore[import-untyped]
-from astral.sun import elevation as astral_elevation
+from astral.sun import zenith_and_azimuth as astral_zenith_and_azimuth  # type: ignore[import-untyped]
 from homeassistant.components.cover import ATTR_POSITION, ATTR_TILT_POSITION, CoverEntityFeature
 from homeassistant.components.logbook import async_log_entry
 from homeassistant.components.weather import SERVICE_GET_FORECASTS
@@ -32,40 +32,64 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as ha_entity_registry
 from homeassistant.helpers import sun as ha_sun
 from homeassistant.helpers import translation
-from homeassistant.helpers.sun import get_astral_event_date
 from homeassistant.util import dt as dt_util
 
 from . import const
+from .cycle_timing import CycleStage, CycleTimings
 from .log import Log
+from .sun_ephemeris import get_sun_event_for_date
 
 get_astral_observer: Callable[[HomeAssistant], Any] | None = getattr(ha_sun, "get_astral_observer", None)
 get_astral_location: Callable[[HomeAssistant], tuple[Any, Any]] | None = getattr(ha_sun, "get_astral_location", None)
 
 PRE_CLOSE_SUN_SAMPLE_INTERVAL = timedelta(minutes=15)
 
+# Common prefix of the logbook entry field translations
+_LOGBOOK_FIELDS_TRANSLATION_PREFIX = (
+    f"component.{const.DOMAIN}.{const.TRANSL_KEY_SERVICES}.{const.SERVICE_LOGBOOK_ENTRY}.{const.TRANSL_KEY_FIELDS}."
+)
+
+# Tilt services are issued after position services when flushing a service call batch
+_TILT_SERVICES = frozenset({SERVICE_SET_COVER_TILT_POSITION, SERVICE_OPEN_COVER_TILT, SERVICE_CLOSE_COVER_TILT})
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .config import ResolvedConfig
+    from .forecast_cache import ForecastCache
 
 
 def _get_solar_position_for_datetime(hass: HomeAssistant, target_datetime: datetime) -> tuple[float, float]:
     """Return sun azimuth and elevation using the best available HA astral helper."""
 
-    local_datetime = dt_util.as_local(target_datetime)
+    return _get_solar_positions_for_datetimes(hass, (target_datetime,))[0]
+
+
+def _get_solar_positions_for_datetimes(hass: HomeAssistant, target_datetimes: Sequence[datetime]) -> tuple[tuple[float, float], ...]:
+    """Return sun azimuth and elevation for a series of datetimes.
+
+    The astral observer (or location) is resolved once for the whole series. With
+    the observer helper, azimuth and zenith are computed in a single pass per sample.
+    """
+
+    local_datetimes = [dt_util.as_local(target_datetime) for target_datetime in target_datetimes]
 
     if get_astral_observer is not None:
         observer = get_astral_observer(hass)
-        return (
-            astral_azimuth(observer, local_datetime),
-            astral_elevation(observer, local_datetime),
-        )
+        positions: list[tuple[float, float]] = []
+        for local_datetime in local_datetimes:
+            zenith, azimuth = astral_zenith_and_azimuth(observer, local_datetime)
+            positions.append((azimuth, 90.0 - zenith))
+        return tuple(positions)
 
     if get_astral_location is not None:
         location, elevation = get_astral_location(hass)
-        return (
-            location.solar_azimuth(local_datetime, observer_elevation=elevation),
-            location.solar_elevation(local_datetime, observer_elevation=elevation),
+        return tuple(
+            (
+                location.solar_azimuth(local_datetime, observer_elevation=elevation),
+                location.solar_elevation(local_datetime, observer_elevation=elevation),
+            )
+            for local_datetime in local_datetimes
         )
 
     raise RuntimeError("Home Assistant sun helpers are unavailable")
@@ -105,6 +129,44 @@ class ServiceCallError(SmartCoverHAError):
         self.error = error
 
 
+#
+# _ServiceCallBatch
+#
+class _ServiceCallBatch:
+    """Cover service calls collected from the participating tasks of one automation run.
+
+    Each participant blocks on a future per submitted call. The batch is ready
+    to be issued once every participant is either blocked on a call or finished.
+    """
+
+    def __init__(self) -> None:
+        self.tasks: set[asyncio.Task[None]] = set()
+        self.calls: dict[tuple[str, tuple[tuple[str, Any], ...]], list[tuple[str, asyncio.Future[None]]]] = {}
+        self.waiting = 0
+        self.finished = 0
+        self.ready = asyncio.Event()
+
+    def add_call(self, service: str, service_data: dict[str, Any]) -> asyncio.Future[None]:
+        """Add a call of a participant and return the future resolved when it was issued."""
+
+        data_items = tuple(sorted((key, value) for key, value in service_data.items() if key != ATTR_ENTITY_ID))
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.calls.setdefault((service, data_items), []).append((service_data[ATTR_ENTITY_ID], future))
+        self.waiting += 1
+        self._update_ready()
+        return future
+
+    def participant_done(self, _task: asyncio.Task[None]) -> None:
+        """Count a finished participant."""
+
+        self.finished += 1
+        self._update_ready()
+
+    def _update_ready(self) -> None:
+        if self.waiting + self.finished >= len(self.tasks):
+            self.ready.set()
+
+
 #
 # HomeAssistantInterface
 #
@@ -123,6 +185,8 @@ class HomeAssistantInterface:
         hass: HomeAssistant,
         resolved_settings_callback: Callable[[], ResolvedConfig],
         logger: Log,
+        forecast_cache: ForecastCache | None = None,
+        cycle_timings: CycleTimings | None = None,
     ) -> None:
         """Initialize the HA interface.
 
@@ -130,11 +194,19 @@ class HomeAssistantInterface:
             hass: Home Assistant instance
             resolved_settings_callback: Callback to get current resolved configuration
             logger: Instance-specific logger with entry_id prefix
+            forecast_cache: Optional cache for weather forecast responses (None disables caching)
+            cycle_timings: Timing statistics recording service call, forecast and logbook time
         """
 
         self.hass = hass
         self._resolved_settings_callback = resolved_settings_callback
         self._logger = logger
+        self._forecast_cache = forecast_cache
+        self._cycle_timings = cycle_timings if cycle_timings is not None else CycleTimings()
+        self._logbook_strings: tuple[str, dict[str, str]] | None = None
+        self._logbook_batch: list[tuple[str, str, str, int]] | None = None
+        self._service_call_batches: dict[asyncio.Task[Any], _ServiceCallBatch] = {}
+        self._sun_samples_cache: dict[tuple[Any, Any, Any, datetime], tuple[tuple[float, float], ...]] = {}
         self.status_sensor_unique_id: str | None = None
 
     #
@@ -200,7 +272,7 @@ class HomeAssistantInterface:
                 )
             else:
                 # Call the service (waiting until HA has processed it, but not waiting until the cover has finished moving)
-                await self.hass.services.async_call(Platform.COVER, service, service_data)
+                await self._async_call_cover_service(service, service_data)
 
             # Return the actual position the cover is moving to
             return actual_position
@@ -278,7 +350,7 @@ class HomeAssistantInterface:
                     f"[{entity_id}] Simulation mode enabled; skipping actual {service} call; would have set tilt to {actual_tilt}%"
                 )
             else:
-                await self.hass.services.async_call(Platform.COVER, service, service_data)
+                await self._async_call_cover_service(service, service_data)
 
             return actual_tilt
 
@@ -297,6 +369,114 @@ class HomeAssistantInterface:
             self._logger.error(f"[{entity_id}] {error_msg}")
             raise ServiceCallError(service, entity_id, str(err)) from err
 
+    #
+    # async_run_service_call_batch
+    #
+    async def async_run_service_call_batch(self, executions: Sequence[Coroutine[Any, Any, None]]) -> None:
+        """Run cover executions in parallel, grouping their cover service calls.
+
+        Every execution runs as a task participating in the batch. Their service
+        calls are collected until all participants wait for a call or are
+        finished, then issued with one call per identical target. Each call
+        resumes (or raises in) only its own participant, so state bookkeeping
+        and logbook entries follow the outcome for that cover. Calls from any
+        other task, e.g. queued executions dispatched by the command scheduler,
+        are issued immediately.
+
+        Args:
+            executions: Cover executions of the current automation run
+        """
+
+        batch = _ServiceCallBatch()
+        for execution in executions:
+            task = asyncio.create_task(execution)
+            batch.tasks.add(task)
+            self._service_call_batches[task] = batch
+            task.add_done_callback(batch.participant_done)
+
+        try:
+            while batch.finished < len(batch.tasks):
+                await batch.ready.wait()
+                batch.ready.clear()
+                calls, batch.calls, batch.waiting = batch.calls, {}, 0
+                await self._async_issue_grouped_service_calls(calls)
+        finally:
+            for task in batch.tasks:
+                self._service_call_batches.pop(task, None)
+                task.cancel()
+            await asyncio.gather(*batch.tasks, return_exceptions=True)
+
+    #
+    # _async_issue_grouped_service_calls
+    #
+    async def _async_issue_grouped_service_calls(
+        self, calls: dict[tuple[str, tuple[tuple[str, Any], ...]], list[tuple[str, asyncio.Future[None]]]]
+    ) -> None:
+        """Issue collected cover service calls and resolve their futures.
+
+        Covers with the same service and service data are moved with a single
+        call targeting all of them. Position calls are issued before tilt calls
+        so each cover receives its commands in the original order. A failing
+        call raises in the executions of all covers it targeted; it does not
+        prevent the remaining calls.
+        """
+
+        for (service, data_items), targets in sorted(calls.items(), key=lambda item: item[0][0] in _TILT_SERVICES):
+            entity_ids = [entity_id for entity_id, _future in targets]
+            service_data: dict[str, Any] = {ATTR_ENTITY_ID: entity_ids if len(entity_ids) > 1 else entity_ids[0], **dict(data_items)}
+            try:
+                with self._cycle_timings.measure(CycleStage.SERVICE_CALLS):
+                    await self.hass.services.async_call(Platform.COVER, service, service_data)
+            except Exception as err:
+                self._logger.error(f"[{', '.join(entity_ids)}] Failed grouped {service} call: {err}")
+                for _entity_id, future in targets:
+                    if not future.done():
+                        future.set_exception(err)
+            else:
+                if len(entity_ids) > 1:
+                    self._logger.debug(f"Called {service} for {len(entity_ids)} covers at once: {', '.join(entity_ids)}")
+                for _entity_id, future in targets:
+                    if not future.done():
+                        future.set_result(None)
+
+    #
+    # _async_call_cover_service
+    #
+    async def _async_call_cover_service(self, service: str, service_data: dict[str, Any]) -> None:
+        """Call a cover service, or add it to the batch the current task participates in."""
+
+        batch = self._service_call_batches.get(asyncio.current_task()) if self._service_call_batches else None
+        if batch is None:
+            with self._cycle_timings.measure(CycleStage.SERVICE_CALLS):
+                await self.hass.services.async_call(Platform.COVER, service, service_data)
+            return
+
+        await batch.add_call(service, service_data)
+
+    #
+    # get_cover_command_group
+    #
+    def get_cover_command_group(self, entity_id: str, scope: const.CoverCommandGroupScope) -> str:
+        """Return the command group sharing one rate limit with the cover.
+
+        Covers unknown to the entity registry (or without a device) form their
+        own group.
+
+        Args:
+            entity_id: The cover entity ID
+            scope: Which covers share one rate limit
+        """
+
+        if scope == const.CoverCommandGroupScope.ENTRY:
+            return const.CoverCommandGroupScope.ENTRY.value
+
+        registry_entry = ha_entity_registry.async_get(self.hass).async_get(entity_id)
+        if registry_entry is None:
+            return entity_id
+        if scope == const.CoverCommandGroupScope.DEVICE:
+            return f"device:{registry_entry.device_id}" if registry_entry.device_id else entity_id
+        return f"integration:{registry_entry.platform}"
+
     #
     # get_weather_condition
     #
@@ -362,23 +542,40 @@ class HomeAssistantInterface:
 
         return _get_solar_position_for_datetime(self.hass, target_datetime)
 
+    def get_sun_data_for_datetimes(self, target_datetimes: Sequence[datetime]) -> tuple[tuple[float, float], ...]:
+        """Return sun azimuth and elevation for a series of datetimes."""
+
+        return _get_solar_positions_for_datetimes(self.hass, target_datetimes)
+
     def get_sun_samples_from_sunrise_until(self, target_datetime: datetime) -> tuple[tuple[float, float], ...]:
         """Return sampled sun positions from local sunrise until a target datetime."""
 
         local_target = dt_util.as_local(target_datetime)
-        sunrise_time = get_astral_event_date(self.hass, SUN_EVENT_SUNRISE, local_target.date())
+        cache_key = (self.hass.config.latitude, self.hass.config.longitude, self.hass.config.elevation, local_target)
+        cached_samples = self._sun_samples_cache.get(cache_key)
+        if cached_samples is not None:
+            return cached_samples
+
+        sunrise_time = get_sun_event_for_date(self.hass, SUN_EVENT_SUNRISE, local_target.date())
         if sunrise_time is None or sunrise_time >= local_target:
             sample_time = local_target
         else:
             sample_time = sunrise_time
 
-        sun_samples: list[tuple[float, float]] = []
+        sample_times: list[datetime] = []
         while sample_time < local_target:
-            sun_samples.append(self.get_sun_data_for_datetime(sample_time))
+            sample_times.append(sample_time)
             sample_time += PRE_CLOSE_SUN_SAMPLE_INTERVAL
+        sample_times.append(target_datetime)
 
-        sun_samples.append(self.get_sun_data_for_datetime(target_datetime))
-        return tuple(sun_samples)
+        sun_samples = _get_solar_positions_for_datetimes(self.hass, sample_times)
+
+        # Samples only depend on date, location and target time; keep the current date only
+        target_date = local_target.date()
+        for key in [key for key in self._sun_samples_cache if key[3].date() != target_date]:
+            del self._sun_samples_cache[key]
+        self._sun_samples_cache[cache_key] = sun_samples
+        return sun_samples
 
     #
     # get_sun_state
@@ -655,13 +852,46 @@ class HomeAssistantInterface:
     # _get_day_forecast
     #
     async def _get_forecast_list(self, entity_id: str, log_context: str | None = None) -> list[Any] | None:
-        """Return the validated daily forecast list for a weather entity."""
+        """Return the validated daily forecast list for a weather entity.
+
+        Responses are served from the forecast cache while they are younger than
+        ``const.WEATHER_FORECAST_CACHE_TTL`` and the weather entity's state has not
+        been updated.
+        """
+
+        forecast_type = const.HA_WEATHER_FORECAST_TYPE_DAILY
+        cache = self._forecast_cache
+        if cache is None:
+            return await self._fetch_forecast_list(entity_id, forecast_type, log_context)
+
+        weather_state = self.hass.states.get(entity_id)
+        weather_last_updated = getattr(weather_state, "last_updated", None)
+        if not isinstance(weather_last_updated, datetime):
+            return await self._fetch_forecast_list(entity_id, forecast_type, log_context)
+
+        async with cache.lock(entity_id, forecast_type):
+            forecast_list = cache.get(entity_id, forecast_type, weather_last_updated)
+            if forecast_list is not None:
+                self._logger.debug(f"Using cached weather forecast for {entity_id}")
+                return forecast_list
+
+            forecast_list = await self._fetch_forecast_list(entity_id, forecast_type, log_context)
+            if forecast_list is not None:
+                cache.store(entity_id, forecast_type, weather_last_updated, forecast_list)
+            return forecast_list
+
+    #
+    # _fetch_forecast_list
+    #
+    async def _fetch_forecast_list(self, entity_id: str, forecast_type: str, log_context: str | None = None) -> list[Any] | None:
+        """Call the weather forecast service and return the validated forecast list."""
 
         try:
-            service_data = {"entity_id": entity_id, "type": "daily"}
-            response = await self.hass.services.async_call(
-                Platform.WEATHER, SERVICE_GET_FORECASTS, service_data, blocking=True, return_response=True
-            )
+            service_data = {"entity_id": entity_id, "type": forecast_type}
+            with self._cycle_timings.measure(CycleStage.FORECAST):
+                response = await self.hass.services.async_call(
+                    Platform.WEATHER, SERVICE_GET_FORECASTS, service_data, blocking=True, return_response=True
+                )
 
             if log_context is None:
                 self._logger.debug(f"Weather forecast service response for {entity_id}: {response}")
@@ -907,6 +1137,9 @@ class HomeAssistantInterface:
     ) -> None:
         """Add a detailed logbook entry for cover movement.
 
+        While a logbook batch is open (see begin_logbook_batch), the entry is
+        collected and written when the batch is flushed.
+
         Args:
             verb_key: Translation key for the verb (e.g., "opening", "closing")
             entity_id: Cover entity ID
@@ -914,45 +1147,75 @@ class HomeAssistantInterface:
             target_pos: Target position percentage
         """
 
+        if self._logbook_batch is not None:
+            self._logbook_batch.append((verb_key, entity_id, reason_key, target_pos))
+            return
+
+        with self._cycle_timings.measure(CycleStage.LOGBOOK):
+            await self._async_write_logbook_entry(verb_key, entity_id, reason_key, target_pos)
+
+    #
+    # begin_logbook_batch
+    #
+    def begin_logbook_batch(self) -> None:
+        """Start collecting logbook entries instead of writing them immediately."""
+
+        if self._logbook_batch is None:
+            self._logbook_batch = []
+
+    #
+    # async_flush_logbook_batch
+    #
+    async def async_flush_logbook_batch(self) -> None:
+        """Write the collected logbook entries and close the batch.
+
+        Movements with the same verb, reason and target position are combined
+        into one entry that lists all affected covers.
+        """
+
+        batch, self._logbook_batch = self._logbook_batch, None
+        if not batch:
+            return
+
+        grouped_entity_ids: dict[tuple[str, str, int], list[str]] = {}
+        for verb_key, entity_id, reason_key, target_pos in batch:
+            grouped_entity_ids.setdefault((verb_key, reason_key, target_pos), []).append(entity_id)
+
+        with self._cycle_timings.measure(CycleStage.LOGBOOK):
+            for (verb_key, reason_key, target_pos), entity_ids in grouped_entity_ids.items():
+                await self._async_write_logbook_entry(verb_key, ", ".join(entity_ids), reason_key, target_pos)
+
+    #
+    # _async_write_logbook_entry
+    #
+    async def _async_write_logbook_entry(self, verb_key: str, entity_id: str, reason_key: str, target_pos: int) -> None:
+        """Translate and write one logbook entry."""
+
         try:
-            # Look up the entity ID from the entity registry using the stored unique_id
+            # Look up the entity ID from the entity registry's unique_id index (O(1), follows renames)
             registry = ha_entity_registry.async_get(self.hass)
             unique_id = self.status_sensor_unique_id
 
-            # Find the entity by unique_id
             integration_entity_id = None
-            for entity in registry.entities.values():
-                if entity.unique_id == unique_id and entity.platform == const.DOMAIN:
-                    integration_entity_id = entity.entity_id
-                    break
+            if unique_id is not None:
+                integration_entity_id = registry.async_get_entity_id(Platform.BINARY_SENSOR, const.DOMAIN, unique_id)
 
             if integration_entity_id is None:
                 self._logger.warning(f"Could not find integration entity for logbook entry by its unique_id: {unique_id}")
                 return
 
-            # Get translations for the current language
-            translations = await translation.async_get_translations(
-                self.hass,
-                self.hass.config.language,
-                const.TRANSL_KEY_SERVICES,
-                [const.DOMAIN],
-            )
-
-            # Build translation keys
-            base_fields_key = (
-                f"component.{const.DOMAIN}.{const.TRANSL_KEY_SERVICES}.{const.SERVICE_LOGBOOK_ENTRY}.{const.TRANSL_KEY_FIELDS}"
-            )
-            verb_key = f"{base_fields_key}.{verb_key}.{const.TRANSL_ATTR_NAME}"
-            reason_key = f"{base_fields_key}.{reason_key}.{const.TRANSL_ATTR_NAME}"
-            template_key = f"{base_fields_key}.{const.TRANSL_LOGBOOK_TEMPLATE_COVER_MOVEMENT}.{const.TRANSL_ATTR_NAME}"
-
-            # Get translated strings
-            translated_verb = translations.get(verb_key)
-            translated_reason = translations.get(reason_key)
-            translated_template = translations.get(template_key)
+            # Get the pre-resolved logbook strings for the current language
+            logbook_strings = await self._async_get_logbook_strings()
+            translated_verb = logbook_strings.get(verb_key)
+            translated_reason = logbook_strings.get(reason_key)
+            translated_template = logbook_strings.get(const.TRANSL_LOGBOOK_TEMPLATE_COVER_MOVEMENT)
             if translated_verb is None or translated_reason is None or translated_template is None:
+                prefix = _LOGBOOK_FIELDS_TRANSLATION_PREFIX
+                suffix = f".{const.TRANSL_ATTR_NAME}"
+                template_key = const.TRANSL_LOGBOOK_TEMPLATE_COVER_MOVEMENT
                 self._logger.warning(
-                    f"Missing translations for logbook entry: verb='{verb_key}', reason='{reason_key}', template='{template_key}'"
+                    f"Missing translations for logbook entry: verb='{prefix}{verb_key}{suffix}', "
+                    f"reason='{prefix}{reason_key}{suffix}', template='{prefix}{template_key}{suffix}'"
                 )
                 return
 
@@ -975,3 +1238,36 @@ class HomeAssistantInterface:
         except Exception as err:
             # Don't fail the entire automation if logbook entry fails
             self._logger.debug(f"[{entity_id}] Failed to add logbook entry: {err}")
+
+    #
+    # _async_get_logbook_strings
+    #
+    async def _async_get_logbook_strings(self) -> dict[str, str]:
+        """Return the translated logbook verbs, reasons and templates for the current language.
+
+        The strings are keyed by their field name (e.g., "verb_opening") and
+        cached per language, so that logbook entries only need a dict lookup.
+        """
+
+        language = self.hass.config.language
+        if self._logbook_strings is not None and self._logbook_strings[0] == language:
+            return self._logbook_strings[1]
+
+        translations = await translation.async_get_translations(
+            self.hass,
+            language,
+            const.TRANSL_KEY_SERVICES,
+            [const.DOMAIN],
+        )
+
+        name_suffix = f".{const.TRANSL_ATTR_NAME}"
+        logbook_strings = {
+            key[len(_LOGBOOK_FIELDS_TRANSLATION_PREFIX) : -len(name_suffix)]: value
+            for key, value in translations.items()
+            if key.startswith(_LOGBOOK_FIELDS_TRANSLATION_PREFIX) and key.endswith(name_suffix)
+        }
+
+        # Don't cache failed loads so they are retried with the next entry
+        if logbook_strings:
+            self._logbook_strings = (language, logbook_strings)
+        return logbook_strings
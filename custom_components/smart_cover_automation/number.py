@@ -223,14 +223,13 @@ class ExternalTiltNumber(IntegrationNumber):
     def native_value(self) -> float | None:  # pyright: ignore[reportIncompatibleMethodOverride]
         """Return the currently stored external tilt value, if any."""
 
-        options = dict(self.coordinator.config_entry.options or {})
-        value = to_int_or_none(options.get(self._config_key))
+        value = to_int_or_none(self.coordinator.effective_options.get(self._config_key))
         return float(value) if value is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
-        """Persist a new external tilt value."""
+        """Persist a new external tilt value as a runtime setting."""
 
-        await self._async_persist_option(self._config_key, int(value))
+        await self.coordinator.async_set_runtime_setting(self._config_key, int(value))
 
 
 #
@@ -191,7 +191,7 @@ class AutomationDisabledTimeRangeSensor(IntegrationSensor):
 
         start_time, end_time = resolve_effective_blocked_time_range_bounds(
             resolved,
-            dict(self.coordinator.config_entry.options or {}),
+            self.coordinator.effective_options,
         )
         if start_time is None or end_time is None:
             return "external"
@@ -239,7 +239,7 @@ class EveningClosureTimeSensor(IntegrationSensor):
         time_value: time | None = resolved.evening_closure_time
 
         if resolved.evening_closure_mode == EveningClosureMode.EXTERNAL:
-            options = dict(self.coordinator.config_entry.options or {})
+            options = self.coordinator.effective_options
             time_value = self._parse_configured_time(options.get(TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME))
 
         return self._format_time_value(time_value)
@@ -312,7 +312,7 @@ class MorningOpeningTimeSensor(IntegrationSensor):
         time_value: time | None = resolved.morning_opening_time
 
         if resolved.morning_opening_mode == MorningOpeningMode.EXTERNAL:
-            options = dict(self.coordinator.config_entry.options or {})
+            options = self.coordinator.effective_options
             time_value = self._parse_configured_time(options.get(TIME_KEY_MORNING_OPENING_EXTERNAL_TIME))
 
         return self._format_time_value(time_value)
@@ -0,0 +1,218 @@
+"""Shared sensor inputs for all config entries of this integration.
+
+Every config entry reads the same upstream inputs once per update cycle: the
+sun position, the daily forecast temperature extrema and the current weather
+condition. With several entries, these reads happen once per entry within the
+same minute. The hub in this module takes one snapshot per weather entity and
+hands it to all entries, which then apply their own thresholds.
+
+The reads do not depend on any entry's settings. The hub therefore uses its own
+``HomeAssistantInterface`` with default settings and the integration's base
+logger instead of borrowing the interface of whichever entry asks first.
+
+A snapshot is reused while the sun and weather entity states are unchanged and
+it is younger than ``const.SENSOR_SNAPSHOT_MAX_AGE``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from . import const
+from .config import resolve
+from .forecast_cache import get_shared_forecast_cache
+from .ha_interface import HomeAssistantInterface
+from .log import Log
+
+__all__ = ["SensorSnapshot", "SensorSnapshotHub", "get_shared_sensor_snapshot_hub"]
+
+
+@dataclass(slots=True, frozen=True)
+class SensorSnapshot:
+    """Sensor inputs read at one point in time.
+
+    Each input holds either its value or the exception raised while reading it,
+    so every consumer can handle failures exactly as if it had read the input itself.
+    """
+
+    sun_data: tuple[float, float] | BaseException
+    temperature_extrema: tuple[float, float | None] | BaseException
+    weather_condition: str | BaseException
+    sun_last_updated: datetime | None
+    weather_last_updated: datetime | None
+    taken_at: datetime
+
+    #
+    # get_sun_data
+    #
+    def get_sun_data(self) -> tuple[float, float]:
+        """Return (azimuth, elevation) or raise the error of the original read."""
+
+        return _unwrap(self.sun_data)
+
+    #
+    # get_daily_temperature_extrema
+    #
+    def get_daily_temperature_extrema(self) -> tuple[float, float | None]:
+        """Return (daily max, daily min) or raise the error of the original read."""
+
+        return _unwrap(self.temperature_extrema)
+
+    #
+    # get_weather_condition
+    #
+    def get_weather_condition(self) -> str:
+        """Return the weather condition or raise the error of the original read."""
+
+        return _unwrap(self.weather_condition)
+
+
+class SensorSnapshotHub:
+    """Takes and shares sensor snapshots, keyed by weather entity."""
+
+    def __init__(self, ha_interface: HomeAssistantInterface) -> None:
+        """Initialize the hub without snapshots.
+
+        Args:
+            ha_interface: Entry-independent interface used to read the inputs
+        """
+
+        self._ha_interface = ha_interface
+        self._snapshots: dict[str, SensorSnapshot] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    #
+    # async_get_snapshot
+    #
+    async def async_get_snapshot(self, weather_entity_id: str) -> SensorSnapshot:
+        """Return a current snapshot for the weather entity, taking a new one if needed.
+
+        Args:
+            weather_entity_id: Weather entity providing forecast and condition
+
+        Returns:
+            Snapshot shared by all entries using the same weather entity
+        """
+
+        lock = self._locks.get(weather_entity_id)
+        if lock is None:
+            lock = self._locks[weather_entity_id] = asyncio.Lock()
+
+        async with lock:
+            sun_last_updated = self._get_last_updated(const.HA_SUN_ENTITY_ID)
+            weather_last_updated = self._get_last_updated(weather_entity_id)
+
+            snapshot = self._snapshots.get(weather_entity_id)
+            if (
+                snapshot is not None
+                and sun_last_updated is not None
+                and weather_last_updated is not None
+                and snapshot.sun_last_updated == sun_last_updated
+                and snapshot.weather_last_updated == weather_last_updated
+                and dt_util.utcnow() - snapshot.taken_at < const.SENSOR_SNAPSHOT_MAX_AGE
+            ):
+                return snapshot
+
+            snapshot = await self._async_take_snapshot(weather_entity_id, sun_last_updated, weather_last_updated)
+            self._snapshots[weather_entity_id] = snapshot
+            return snapshot
+
+    #
+    # invalidate
+    #
+    def invalidate(self) -> None:
+        """Drop all snapshots so the next request reads fresh inputs."""
+
+        self._snapshots.clear()
+
+    #
+    # _get_last_updated
+    #
+    def _get_last_updated(self, entity_id: str) -> datetime | None:
+        """Return the last_updated timestamp of an entity's state, if available."""
+
+        last_updated = getattr(self._ha_interface.hass.states.get(entity_id), "last_updated", None)
+        return last_updated if isinstance(last_updated, datetime) else None
+
+    #
+    # _async_take_snapshot
+    #
+    async def _async_take_snapshot(
+        self,
+        weather_entity_id: str,
+        sun_last_updated: datetime | None,
+        weather_last_updated: datetime | None,
+    ) -> SensorSnapshot:
+        """Read all inputs, capturing errors instead of raising them."""
+
+        sun_data: tuple[float, float] | BaseException
+        temperature_extrema: tuple[float, float | None] | BaseException
+        weather_condition: str | BaseException
+
+        try:
+            sun_data = self._ha_interface.get_sun_data()
+        except Exception as err:
+            sun_data = err
+
+        try:
+            temperature_extrema = await self._ha_interface.get_daily_temperature_extrema(weather_entity_id)
+        except Exception as err:
+            temperature_extrema = err
+
+        try:
+            weather_condition = self._ha_interface.get_weather_condition(weather_entity_id)
+        except Exception as err:
+            weather_condition = err
+
+        return SensorSnapshot(
+            sun_data=sun_data,
+            temperature_extrema=temperature_extrema,
+            weather_condition=weather_condition,
+            sun_last_updated=sun_last_updated,
+            weather_last_updated=weather_last_updated,
+            taken_at=dt_util.utcnow(),
+        )
+
+
+#
+# get_shared_sensor_snapshot_hub
+#
+def get_shared_sensor_snapshot_hub(hass: Any) -> SensorSnapshotHub:
+    """Return the sensor snapshot hub shared by all config entries of this integration."""
+
+    domain_data = hass.data.setdefault(const.DOMAIN, {})
+    hub = domain_data.get(const.DATA_SENSOR_SNAPSHOT_HUB)
+    if hub is None:
+        default_settings = resolve(None)
+        ha_interface = HomeAssistantInterface(
+            hass,
+            lambda: default_settings,
+            logger=Log(),
+            forecast_cache=get_shared_forecast_cache(hass),
+        )
+        hub = domain_data[const.DATA_SENSOR_SNAPSHOT_HUB] = SensorSnapshotHub(ha_interface)
+    return hub
+
+
+#
+# _unwrap
+#
+def _unwrap(result: Any) -> Any:
+    """Return a captured value or raise a copy of a captured exception.
+
+    Each consumer gets its own exception instance; re-raising the captured one
+    would append every consumer's frames to its shared traceback.
+    """
+
+    if isinstance(result, BaseException):
+        # Bypass __init__: custom exceptions take other arguments than their args
+        err_type = type(result)
+        fresh = err_type.__new__(err_type, *result.args)
+        fresh.__dict__.update(result.__dict__)
+        raise fresh from result
+    return result
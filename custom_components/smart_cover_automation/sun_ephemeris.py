@@ -0,0 +1,81 @@
+"""Per-day sun event ephemeris.
+
+Evening-closure and morning-opening times are derived from sunrise and sunset,
+which are recalculated through astral on every update cycle for today,
+yesterday and the pre-close target date. Sun events only depend on the date and
+the configured location, so they are computed once per day and location and
+kept in a small LRU cache shared by all config entries.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
+from homeassistant.helpers.sun import get_astral_event_date
+
+from . import const
+
+__all__ = ["DailySunEphemeris", "get_daily_sun_ephemeris", "get_sun_event_for_date"]
+
+
+@dataclass(slots=True, frozen=True)
+class DailySunEphemeris:
+    """Sun events of one local date at one location."""
+
+    date: date
+    sunrise: datetime | None
+    sunset: datetime | None
+
+
+# LRU of ephemerides keyed by location and date
+_ephemeris_cache: OrderedDict[tuple[Any, ...], DailySunEphemeris] = OrderedDict()
+
+
+#
+# get_daily_sun_ephemeris
+#
+def get_daily_sun_ephemeris(hass: Any, target_date: date) -> DailySunEphemeris:
+    """Return the sun events for a date, computing them on first use.
+
+    The cache key includes the configured location and time zone, so changing
+    the location in Home Assistant transparently leads to a recalculation.
+    """
+
+    config = hass.config
+    key = (config.latitude, config.longitude, config.elevation, config.time_zone, target_date)
+    ephemeris = _ephemeris_cache.get(key)
+    if ephemeris is not None:
+        _ephemeris_cache.move_to_end(key)
+        return ephemeris
+
+    ephemeris = DailySunEphemeris(
+        date=target_date,
+        sunrise=get_astral_event_date(hass, SUN_EVENT_SUNRISE, target_date),
+        sunset=get_astral_event_date(hass, SUN_EVENT_SUNSET, target_date),
+    )
+    _ephemeris_cache[key] = ephemeris
+    while len(_ephemeris_cache) > const.SUN_EPHEMERIS_CACHE_SIZE:
+        _ephemeris_cache.popitem(last=False)
+    return ephemeris
+
+
+#
+# get_sun_event_for_date
+#
+def get_sun_event_for_date(hass: Any, event: str, target_date: date) -> datetime | None:
+    """Return sunrise or sunset for a date from the ephemeris cache.
+
+    Drop-in replacement for ``homeassistant.helpers.sun.get_astral_event_date``
+    for the two events this integration uses.
+    """
+
+    ephemeris = get_daily_sun_ephemeris(hass, target_date)
+    if event == SUN_EVENT_SUNRISE:
+        return ephemeris.sunrise
+    if event == SUN_EVENT_SUNSET:
+        return ephemeris.sunset
+    return get_astral_event_date(hass, event, target_date)
@@ -0,0 +1,87 @@
+"""Daily sun-exposure windows per cover.
+
+Whether the sun hits a window depends only on the sun position and the cover's
+azimuth, azimuth tolerance range and elevation range. For a given day and
+location, the periods in which a cover is exposed to the sun are therefore
+fully determined by the sun's path. This module derives these periods from a
+series of sampled sun positions.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from .cover_settings import PerCoverSettings
+
+__all__ = ["SunExposureWindow", "compute_sun_exposure_windows", "is_sun_hitting"]
+
+
+@dataclass(slots=True, frozen=True)
+class SunExposureWindow:
+    """One period in which the sun hits a cover's window."""
+
+    start: datetime
+    end: datetime
+
+
+#
+# is_sun_hitting
+#
+def is_sun_hitting(settings: PerCoverSettings, sun_azimuth: float, sun_elevation: float) -> bool:
+    """Return whether the sun hits the cover's window at the given sun position.
+
+    This is the single sun-hitting predicate, used both for live evaluation and
+    for precomputing exposure windows. Covers without a configured azimuth are
+    never hit.
+    """
+
+    if settings.azimuth is None:
+        return False
+
+    if not (
+        settings.sun_elevation_min <= settings.sun_elevation_max
+        and settings.sun_elevation_min <= sun_elevation <= settings.sun_elevation_max
+    ):
+        return False
+
+    signed_azimuth_difference = (sun_azimuth - settings.azimuth + 180) % 360 - 180
+    return -settings.sun_azimuth_tolerance_start < signed_azimuth_difference < settings.sun_azimuth_tolerance_end
+
+
+#
+# compute_sun_exposure_windows
+#
+def compute_sun_exposure_windows(
+    settings: PerCoverSettings,
+    sample_times: Sequence[datetime],
+    sun_positions: Sequence[tuple[float, float]],
+) -> tuple[SunExposureWindow, ...]:
+    """Return the periods in which the sun hits the cover's window.
+
+    Args:
+        settings: Compiled settings of the cover
+        sample_times: Ascending sample times
+        sun_positions: (azimuth, elevation) at each sample time
+
+    Returns:
+        Exposure windows in chronological order. A window starts at the first
+        sample with the sun hitting and ends at the next sample without (or at
+        the last sample if the sun is still hitting then).
+    """
+
+    windows: list[SunExposureWindow] = []
+    window_start: datetime | None = None
+    for sample_time, (sun_azimuth, sun_elevation) in zip(sample_times, sun_positions, strict=True):
+        hitting = is_sun_hitting(settings, sun_azimuth, sun_elevation)
+        if hitting and window_start is None:
+            window_start = sample_time
+        elif not hitting and window_start is not None:
+            windows.append(SunExposureWindow(start=window_start, end=sample_time))
+            window_start = None
+
+    if window_start is not None and sample_times:
+        windows.append(SunExposureWindow(start=window_start, end=sample_times[-1]))
+
+    return tuple(windows)
@@ -135,7 +135,7 @@ class IntegrationSwitch(IntegrationEntity, SwitchEntity):  # pyright: ignore[rep
         Reads from the resolved settings to get the current state.
         This reflects changes made through the integration's options flow.
         """
-        resolved = resolve_entry(self.coordinator.config_entry)
+        resolved = self.coordinator.resolved_settings
         return bool(getattr(resolved, self._config_key.lower()))
 
     #
@@ -256,7 +256,7 @@ class VerboseLoggingSwitch(IntegrationSwitch):
         ha_logger_is_debug = logger.isEnabledFor(logging.DEBUG)
 
         # Check integration config
-        resolved = resolve_entry(self.coordinator.config_entry)
+        resolved = self.coordinator.resolved_settings
         config_value = bool(getattr(resolved, self._config_key.lower()))
 
         # Return true if either is enabled
@@ -269,7 +269,7 @@ class VerboseLoggingSwitch(IntegrationSwitch):
 class TriStateExternalControlSwitch(IntegrationEntity, SwitchEntity):  # pyright: ignore[reportIncompatibleVariableOverride]
     """Base class for disabled-by-default tri-state external control switches.
 
-    The switch state is persisted directly in config entry options:
+    The switch state is persisted as a runtime setting of the coordinator:
     - key absent: external control disabled
     - key present with True: force True
     - key present with False: force False
@@ -294,7 +294,7 @@ class TriStateExternalControlSwitch(IntegrationEntity, SwitchEntity):  # pyright
 
         Args:
             coordinator: The DataUpdateCoordinator managing this entry.
-            config_key: Raw config key to persist in entry options.
+            config_key: Raw config key of the runtime setting.
             translation_key: Translation key used for the entity description.
             icon: Icon shown in Home Assistant.
             name: Optional explicit entity name.
@@ -324,8 +324,7 @@ class TriStateExternalControlSwitch(IntegrationEntity, SwitchEntity):  # pyright
         """Persist the initial override state when the entity is first enabled."""
 
         await super().async_added_to_hass()
-        options: dict[str, Any] = dict(self.coordinator.config_entry.options or {})
-        if self._config_key not in options:
+        if not self.coordinator.has_runtime_setting(self._config_key):
             await self._async_persist_override(False)
 
     #
@@ -339,8 +338,7 @@ class TriStateExternalControlSwitch(IntegrationEntity, SwitchEntity):  # pyright
         control has not yet been persisted for this config entry.
         """
 
-        options: Any = self.coordinator.config_entry.options or {}
-        return bool(options.get(self._config_key, False))
+        return bool(self.coordinator.effective_options.get(self._config_key, False))
 
     #
     # async_turn_on
@@ -368,26 +366,19 @@ class TriStateExternalControlSwitch(IntegrationEntity, SwitchEntity):  # pyright
         if registry_entry is not None and getattr(registry_entry, "disabled_by", None) is None:
             return
 
-        entry = self.coordinator.config_entry
-        current_options = dict(entry.options or {})
-        if self._config_key in current_options:
-            del current_options[self._config_key]
-            self.coordinator.hass.config_entries.async_update_entry(entry, options=current_options)
+        await self.coordinator.async_remove_runtime_setting(self._config_key)
 
     #
     # _async_persist_override
     #
     async def _async_persist_override(self, value: bool) -> None:
-        """Persist the external control value to config options.
+        """Persist the external control value as a runtime setting.
 
         Args:
             value: True to force the controlled state on, False to force it off.
         """
 
-        entry = self.coordinator.config_entry
-        current_options = dict(entry.options or {})
-        current_options[self._config_key] = value
-        self.coordinator.hass.config_entries.async_update_entry(entry, options=current_options)
+        await self.coordinator.async_set_runtime_setting(self._config_key, value)
 
 
 #
@@ -82,8 +82,7 @@ class IntegrationTime(IntegrationEntity, TimeEntity):  # pyright: ignore[reportI
     def native_value(self) -> time | None:  # pyright: ignore[reportIncompatibleMethodOverride]
         """Return the currently stored time value, if any."""
 
-        options = dict(self.coordinator.config_entry.options or {})
-        raw_value = options.get(self._config_key)
+        raw_value = self.coordinator.effective_options.get(self._config_key)
         if raw_value in (None, ""):
             return None
 
@@ -95,12 +94,9 @@ class IntegrationTime(IntegrationEntity, TimeEntity):  # pyright: ignore[reportI
             return None
 
     async def async_set_value(self, value: time) -> None:
-        """Persist a new time value."""
+        """Persist a new time value as a runtime setting."""
 
-        entry = self.coordinator.config_entry
-        current_options = dict(entry.options or {})
-        current_options[self._config_key] = value.isoformat()
-        self.coordinator.hass.config_entries.async_update_entry(entry, options=current_options)
+        await self.coordinator.async_set_runtime_setting(self._config_key, value.isoformat())
 
 
 #
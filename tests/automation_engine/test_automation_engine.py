@@ -11,10 +11,12 @@ This module tests the AutomationEngine in isolation, focusing on:
 from __future__ import annotations
 
 import asyncio
-from datetime import date, datetime, time, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import date, datetime, time, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.core import State
 from homeassistant.util import dt as dt_util
 
 from custom_components.smart_cover_automation import const
@@ -25,12 +27,19 @@ from custom_components.smart_cover_automation.automation_engine import (
 )
 from custom_components.smart_cover_automation.config import ConfKeys, resolve
 from custom_components.smart_cover_automation.cover_automation import (
+    CoverAutomation,
     CoverExecutionPlan,
     CoverMovementReason,
     CoverState,
     OwnershipDebugSnapshot,
     SensorData,
 )
+from custom_components.smart_cover_automation.cover_command_scheduler import CoverCommandPriority
+from custom_components.smart_cover_automation.cycle_timing import CycleTimings
+from custom_components.smart_cover_automation.data import CoordinatorData
+from custom_components.smart_cover_automation.diagnostics import async_get_config_entry_diagnostics
+from custom_components.smart_cover_automation.sensor_snapshot import SensorSnapshotHub
+from custom_components.smart_cover_automation.sun_ephemeris import DailySunEphemeris
 
 
 @pytest.fixture
@@ -240,6 +249,109 @@ class TestAutomationEngineInitialization:
         assert engine._cover_pos_history_mgr.get_automation_managed_state("cover.invalid_reason") is None
 
 
+class TestPerCoverSettingsTable:
+    """Test the per-cover settings table compiled per config revision."""
+
+    def test_settings_reused_within_config_revision(self, automation_engine):
+        """The same compiled record is returned while resolved/config objects are unchanged."""
+
+        first = automation_engine._get_per_cover_settings("cover.test")
+        second = automation_engine._get_per_cover_settings("cover.test")
+
+        assert first is second
+
+    def test_settings_rebuilt_on_config_revision_change(self, automation_engine, basic_config):
+        """Handing the engine a new config revision recompiles the table."""
+
+        first = automation_engine._get_per_cover_settings("cover.test")
+
+        new_config = {**basic_config, f"cover.test_{const.COVER_SFX_AZIMUTH}": 135}
+        automation_engine.config = new_config
+        automation_engine.resolved = resolve(new_config)
+        second = automation_engine._get_per_cover_settings("cover.test")
+
+        assert second is not first
+        assert first.azimuth is None
+        assert second.azimuth == 135.0
+
+
+class TestSunExposureWindows:
+    """Test the per-day sun-exposure window precomputation."""
+
+    @staticmethod
+    def _ephemeris(sunrise: datetime, sunset: datetime) -> DailySunEphemeris:
+        return DailySunEphemeris(date=sunrise.date(), sunrise=sunrise, sunset=sunset)
+
+    def test_windows_are_computed_once_per_day(self, mock_ha_interface, mock_logger):
+        """Windows are cached for the date and config revision and yield the next boundary."""
+
+        config = {ConfKeys.COVERS.value: ["cover.test"], f"cover.test_{const.COVER_SFX_AZIMUTH}": 180}
+        engine = AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+        sunrise = datetime(2026, 6, 1, 4, 0, tzinfo=timezone.utc)
+        sunset = sunrise + 2 * const.SUN_EXPOSURE_SAMPLE_INTERVAL
+        mock_ha_interface.get_sun_data_for_datetimes = MagicMock(return_value=((90.0, 5.0), (180.0, 30.0), (270.0, 5.0)))
+
+        with patch(
+            "custom_components.smart_cover_automation.automation_engine.get_daily_sun_ephemeris",
+            return_value=self._ephemeris(sunrise, sunset),
+        ):
+            windows = engine.get_sun_exposure_windows(sunrise.date())
+            assert engine.get_sun_exposure_windows(sunrise.date()) is windows
+            next_change = engine.get_next_sun_exposure_change(sunrise)
+
+        window_start = sunrise + const.SUN_EXPOSURE_SAMPLE_INTERVAL
+        assert [(window.start, window.end) for window in windows["cover.test"]] == [(window_start, sunset)]
+        assert next_change == window_start
+        mock_ha_interface.get_sun_data_for_datetimes.assert_called_once()
+
+    def test_no_windows_without_sun_events(self, automation_engine, mock_ha_interface):
+        """Days without sunrise or sunset (polar regions) have no exposure windows."""
+
+        sunrise = datetime(2026, 6, 1, 4, 0, tzinfo=timezone.utc)
+        with patch(
+            "custom_components.smart_cover_automation.automation_engine.get_daily_sun_ephemeris",
+            return_value=DailySunEphemeris(date=sunrise.date(), sunrise=None, sunset=None),
+        ):
+            assert automation_engine.get_next_sun_exposure_change(sunrise) is None
+
+
+class TestCoverAutomationRegistry:
+    """Test reuse of per-cover automation instances across runs."""
+
+    def test_instance_reused_across_runs(self, automation_engine):
+        """The same CoverAutomation instance is returned for a cover on every run."""
+
+        first = automation_engine._get_cover_automation("cover.test")
+        second = automation_engine._get_cover_automation("cover.test")
+
+        assert first is second
+
+    def test_instance_receives_new_config_revision(self, automation_engine, basic_config):
+        """A reused instance is handed the new settings when the config changes."""
+
+        cover_automation = automation_engine._get_cover_automation("cover.test")
+
+        new_config = {**basic_config, f"cover.test_{const.COVER_SFX_AZIMUTH}": 200}
+        automation_engine.config = new_config
+        automation_engine.resolved = resolve(new_config)
+
+        assert automation_engine._get_cover_automation("cover.test") is cover_automation
+        assert cover_automation.config is new_config
+        assert cover_automation.resolved is automation_engine.resolved
+        assert cover_automation.settings is not None
+        assert cover_automation.settings.azimuth == 200.0
+
+    def test_removed_covers_are_pruned(self, automation_engine):
+        """Instances of covers that are no longer configured are dropped."""
+
+        automation_engine._get_cover_automation("cover.test")
+        automation_engine._get_cover_automation("cover.removed")
+
+        automation_engine._prune_cover_automations(("cover.test",))
+
+        assert set(automation_engine._cover_automations) == {"cover.test"}
+
+
 class TestGatherSensorData:
     """Test _gather_sensor_data method."""
 
@@ -265,6 +377,52 @@ class TestGatherSensorData:
         assert sensor_data.weather_sunny is True
         assert message == ""
 
+    async def test_gather_sensor_data_uses_shared_snapshot(self, basic_config, mock_ha_interface, mock_logger):
+        """Engines sharing a snapshot hub apply their own thresholds to one set of reads."""
+
+        hub = SensorSnapshotHub(mock_ha_interface)
+        mock_ha_interface.hass.states.get = MagicMock(return_value=MagicMock(last_updated=dt_util.utcnow()))
+        mock_ha_interface.get_daily_temperature_extrema.return_value = (22.0, 16.0)
+        cool_config = {**basic_config, ConfKeys.DAILY_MAX_TEMPERATURE_THRESHOLD.value: 25.0}
+        engines = [
+            AutomationEngine(
+                resolved=resolve(config),
+                config=config,
+                ha_interface=mock_ha_interface,
+                logger=mock_logger,
+                sensor_snapshot_hub=hub,
+            )
+            for config in (basic_config, cool_config)
+        ]
+
+        results = [await engine._gather_sensor_data() for engine in engines]
+
+        mock_ha_interface.get_daily_temperature_extrema.assert_awaited_once()
+        assert mock_ha_interface.get_sun_data.call_count == 1
+        assert [sensor_data.temp_hot for sensor_data, _ in results] == [True, False]
+
+    async def test_shared_snapshot_forecast_time_in_entry_diagnostics(self, basic_config, mock_ha_interface, mock_logger):
+        """Forecast time spent in the shared snapshot hub is recorded in the entry's timings."""
+
+        timings = CycleTimings()
+        mock_ha_interface.hass.states.get = MagicMock(return_value=MagicMock(last_updated=dt_util.utcnow()))
+        engine = AutomationEngine(
+            resolved=resolve(basic_config),
+            config=basic_config,
+            ha_interface=mock_ha_interface,
+            logger=mock_logger,
+            sensor_snapshot_hub=SensorSnapshotHub(mock_ha_interface),
+            cycle_timings=timings,
+        )
+        coordinator = SimpleNamespace(last_update_success=True, cycle_timings=timings)
+        entry = SimpleNamespace(runtime_data=SimpleNamespace(coordinator=coordinator))
+
+        with timings.cycle():
+            await engine._gather_sensor_data()
+        diagnostics = await async_get_config_entry_diagnostics(MagicMock(), entry)
+
+        assert diagnostics["cycle_timings"]["stages"]["forecast"]["count"] == 1
+
     async def test_gather_sensor_data_temp_hot_when_both_thresholds_equal(self, automation_engine, mock_ha_interface):
         """Test sensor data when both daily extrema equal the configured thresholds."""
 
@@ -885,7 +1043,7 @@ class TestGatherSensorData:
         assert "ran forecast-based pre-close evaluation" in message
 
     async def test_run_logs_global_settings(self, mock_ha_interface, mock_logger):
-        """Each coordinator run should include modes and cover positions in the global settings log."""
+        """The global settings log should include modes and cover positions."""
 
         config = {
             ConfKeys.COVERS.value: ["cover.test"],
@@ -916,6 +1074,38 @@ class TestGatherSensorData:
         assert any("'covers_max_closure': 20" in message for message in info_messages)
         assert any("'evening_closure_max_closure': 10" in message for message in info_messages)
 
+    async def test_run_logs_global_settings_only_when_changed(self, mock_ha_interface, mock_logger):
+        """Global settings should be logged again only after the configuration changed."""
+
+        config = {
+            ConfKeys.COVERS.value: ["cover.test"],
+            ConfKeys.WEATHER_ENTITY_ID.value: "weather.test",
+        }
+        engine = AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+
+        def global_settings_log_count() -> int:
+            return sum(
+                1
+                for call in mock_logger.info.call_args_list
+                if call.args and isinstance(call.args[0], str) and call.args[0].startswith("Global settings: ")
+            )
+
+        with patch.object(engine, "_check_global_conditions", return_value=(False, "blocked", const.LogSeverity.DEBUG)):
+            await engine.run({"cover.test": MagicMock()})
+            await engine.run({"cover.test": MagicMock()})
+            assert global_settings_log_count() == 1
+
+            engine.resolved = resolve({**config, ConfKeys.COVERS_MAX_CLOSURE.value: 30})
+            await engine.run({"cover.test": MagicMock()})
+            assert global_settings_log_count() == 2
+
+            mock_logger.isEnabledFor.return_value = False
+            engine.resolved = resolve(config)
+            with patch.object(engine, "_get_effective_blocked_time_range_bounds") as mock_bounds:
+                await engine.run({"cover.test": MagicMock()})
+            mock_bounds.assert_not_called()
+            assert global_settings_log_count() == 2
+
     def test_time_period_disabled_outside_same_day_range(self, mock_ha_interface, mock_logger):
         """Same-day disabled periods should remain inactive before the configured start time."""
 
@@ -1195,7 +1385,7 @@ class TestTimeCalculationHelpers:
         assert result.hour == 21
         assert result.minute == 15
 
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_get_evening_closure_time_for_date_after_sunset_applies_delay(self, mock_get_astral, mock_ha_interface, mock_logger):
         """Test evening closure datetime calculation in after-sunset mode."""
         from datetime import datetime
@@ -1220,7 +1410,7 @@ class TestTimeCalculationHelpers:
 
         assert result == datetime(2025, 11, 5, 18, 45, 0, tzinfo=dt_util.get_default_time_zone())
 
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_get_evening_closure_time_for_date_before_sunset_subtracts_delay(self, mock_get_astral, mock_ha_interface, mock_logger):
         """Test evening closure datetime calculation in before-sunset mode."""
         from datetime import datetime
@@ -1246,7 +1436,7 @@ class TestTimeCalculationHelpers:
 
         assert result == datetime(2025, 11, 5, 18, 15, 0, tzinfo=dt_util.get_default_time_zone())
 
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_get_evening_closure_time_for_date_returns_none_when_sunset_unavailable(self, mock_get_astral, mock_ha_interface, mock_logger):
         """Test evening closure datetime calculation when sunset data is unavailable."""
 
@@ -1433,7 +1623,7 @@ class TestTimeCalculationHelpers:
 
         assert engine._in_time_period_automation_disabled() == (False, "")
 
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_get_morning_opening_time_for_date_relative_returns_none_when_sunrise_unavailable(
         self, mock_get_astral, mock_ha_interface, mock_logger
     ):
@@ -1456,7 +1646,7 @@ class TestTimeCalculationHelpers:
 
         assert engine._get_morning_opening_time_for_date(date(2025, 11, 5)) is None
 
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_get_morning_opening_time_for_date_before_sunrise_subtracts_delay(self, mock_get_astral, mock_ha_interface, mock_logger):
         """Test morning opening datetime calculation in before-sunrise mode."""
         from datetime import datetime
@@ -1984,11 +2174,10 @@ class TestPendingCoverExecutionQueue:
             execute_at=datetime(2026, 5, 23, 10, 5, tzinfo=timezone.utc),
             generation=0,
             plan_signature=plan.signature,
-            task=MagicMock(),
         )
         engine._pending_cover_executions["cover.test"] = existing
 
-        with patch("custom_components.smart_cover_automation.automation_engine.asyncio.create_task") as mock_create_task:
+        with patch.object(engine._command_scheduler, "schedule") as mock_schedule:
             engine._schedule_pending_cover_execution(
                 "cover.test",
                 MagicMock(),
@@ -1998,7 +2187,7 @@ class TestPendingCoverExecutionQueue:
             )
 
         assert engine._pending_cover_executions["cover.test"] is existing
-        mock_create_task.assert_not_called()
+        mock_schedule.assert_not_called()
 
     def test_schedule_pending_cover_execution_adds_new_plan(self, mock_ha_interface, mock_logger):
         """A new queued execution should be stored and logged when no pending entry exists yet."""
@@ -2010,20 +2199,12 @@ class TestPendingCoverExecutionQueue:
             logger=mock_logger,
         )
         plan = self._make_plan()
-        created_task = MagicMock(spec=asyncio.Task)
-
-        def create_task_side_effect(coroutine):
-            coroutine.close()
-            return created_task
 
         with patch(
             "custom_components.smart_cover_automation.automation_engine.dt_util.utcnow",
             return_value=datetime(2026, 5, 23, 10, 0, tzinfo=timezone.utc),
         ):
-            with patch(
-                "custom_components.smart_cover_automation.automation_engine.asyncio.create_task",
-                side_effect=create_task_side_effect,
-            ):
+            with patch.object(engine._command_scheduler, "schedule") as mock_schedule:
                 engine._schedule_pending_cover_execution(
                     "cover.test",
                     MagicMock(),
@@ -2036,8 +2217,9 @@ class TestPendingCoverExecutionQueue:
         assert scheduled.schedule_id == 1
         assert scheduled.generation == 2
         assert scheduled.plan_signature == plan.signature
-        assert scheduled.task is created_task
-        mock_logger.info.assert_any_call("[%s] Queued cover execution in %.0f s", "cover.test", 60.0)
+        mock_schedule.assert_called_once_with("cover.test", None, CoverCommandPriority.OPENING, 60.0, ANY)
+        mock_ha_interface.get_cover_command_group.assert_not_called()
+        mock_logger.info.assert_any_call("[cover.test] Queued cover execution in 60 s")
 
     def test_schedule_pending_cover_execution_replaces_superseded_plan(self, mock_ha_interface, mock_logger):
         """A newer queued execution should replace the existing pending one when the plan changes."""
@@ -2055,23 +2237,14 @@ class TestPendingCoverExecutionQueue:
             execute_at=datetime(2026, 5, 23, 10, 5, tzinfo=timezone.utc),
             generation=0,
             plan_signature=existing_plan.signature,
-            task=MagicMock(),
         )
-        created_task = MagicMock(spec=asyncio.Task)
-
-        def create_task_side_effect(coroutine):
-            coroutine.close()
-            return created_task
 
         with patch.object(engine, "_cancel_pending_cover_execution") as mock_cancel:
             with patch(
                 "custom_components.smart_cover_automation.automation_engine.dt_util.utcnow",
                 return_value=datetime(2026, 5, 23, 10, 0, tzinfo=timezone.utc),
             ):
-                with patch(
-                    "custom_components.smart_cover_automation.automation_engine.asyncio.create_task",
-                    side_effect=create_task_side_effect,
-                ):
+                with patch.object(engine._command_scheduler, "schedule") as mock_schedule:
                     engine._schedule_pending_cover_execution(
                         "cover.test",
                         MagicMock(),
@@ -2084,8 +2257,8 @@ class TestPendingCoverExecutionQueue:
         scheduled = engine._pending_cover_executions["cover.test"]
         assert scheduled.plan_signature == new_plan.signature
         assert scheduled.generation == 1
-        assert scheduled.task is created_task
-        mock_logger.info.assert_any_call("[%s] Queued cover execution in %.0f s", "cover.test", 600.0)
+        mock_schedule.assert_called_once()
+        mock_logger.info.assert_any_call("[cover.test] Queued cover execution in 600 s")
 
     async def test_run_pending_cover_execution_logs_execute_errors(self, mock_ha_interface, mock_logger):
         """Queued execution should log plan execution failures and clear the pending entry."""
@@ -2104,20 +2277,15 @@ class TestPendingCoverExecutionQueue:
             execute_at=datetime(2026, 5, 23, 10, 5, tzinfo=timezone.utc),
             generation=0,
             plan_signature=plan.signature,
-            task=MagicMock(),
         )
 
-        with patch("custom_components.smart_cover_automation.automation_engine.asyncio.sleep", new=AsyncMock()):
-            await engine._run_pending_cover_execution("cover.test", 7, cover_automation, plan, delay_seconds=0)
+        await engine._run_pending_cover_execution("cover.test", 7, cover_automation, plan)
 
         assert "cover.test" not in engine._pending_cover_executions
-        mock_logger.error.assert_called_once()
-        assert mock_logger.error.call_args.args[:2] == ("[%s] Failed queued cover execution: %s", "cover.test")
-        assert isinstance(mock_logger.error.call_args.args[2], RuntimeError)
-        assert str(mock_logger.error.call_args.args[2]) == "boom"
+        mock_logger.error.assert_called_once_with("[cover.test] Failed queued cover execution: boom")
 
-    async def test_run_pending_cover_execution_returns_when_sleep_is_cancelled(self, mock_ha_interface, mock_logger):
-        """Queued execution should stop quietly when the scheduled delay is cancelled."""
+    def test_cancel_pending_cover_execution_removes_scheduler_entry(self, mock_ha_interface, mock_logger):
+        """Cancelling a queued execution should remove it from the command scheduler."""
 
         engine = AutomationEngine(
             resolved=resolve({ConfKeys.COVERS.value: ["cover.test"], ConfKeys.WEATHER_ENTITY_ID.value: "weather.test"}),
@@ -2125,25 +2293,19 @@ class TestPendingCoverExecutionQueue:
             ha_interface=mock_ha_interface,
             logger=mock_logger,
         )
-        plan = self._make_plan()
-        cover_automation = MagicMock()
-        cover_automation.execute_plan = AsyncMock()
         engine._pending_cover_executions["cover.test"] = ScheduledCoverExecution(
             schedule_id=7,
             execute_at=datetime(2026, 5, 23, 10, 5, tzinfo=timezone.utc),
             generation=0,
-            plan_signature=plan.signature,
-            task=MagicMock(),
+            plan_signature=self._make_plan().signature,
         )
 
-        async def raise_cancelled(_delay_seconds: float) -> None:
-            raise asyncio.CancelledError
-
-        with patch("custom_components.smart_cover_automation.automation_engine.asyncio.sleep", side_effect=raise_cancelled):
-            await engine._run_pending_cover_execution("cover.test", 7, cover_automation, plan, delay_seconds=0)
+        with patch.object(engine._command_scheduler, "cancel") as mock_cancel:
+            engine._cancel_pending_cover_execution("cover.test", "test")
+            engine._cancel_pending_cover_execution("cover.test", "test")
 
-        assert "cover.test" in engine._pending_cover_executions
-        cover_automation.execute_plan.assert_not_awaited()
+        assert "cover.test" not in engine._pending_cover_executions
+        mock_cancel.assert_called_once_with("cover.test")
 
     async def test_run_pending_cover_execution_returns_when_schedule_is_missing(self, mock_ha_interface, mock_logger):
         """Queued execution should stop quietly when the pending entry was already removed."""
@@ -2157,8 +2319,7 @@ class TestPendingCoverExecutionQueue:
         cover_automation = MagicMock()
         cover_automation.execute_plan = AsyncMock()
 
-        with patch("custom_components.smart_cover_automation.automation_engine.asyncio.sleep", new=AsyncMock()):
-            await engine._run_pending_cover_execution("cover.test", 7, cover_automation, self._make_plan(), delay_seconds=0)
+        await engine._run_pending_cover_execution("cover.test", 7, cover_automation, self._make_plan())
 
         cover_automation.execute_plan.assert_not_awaited()
 
@@ -2179,11 +2340,9 @@ class TestPendingCoverExecutionQueue:
             execute_at=datetime(2026, 5, 23, 10, 5, tzinfo=timezone.utc),
             generation=0,
             plan_signature=plan.signature,
-            task=MagicMock(),
         )
 
-        with patch("custom_components.smart_cover_automation.automation_engine.asyncio.sleep", new=AsyncMock()):
-            await engine._run_pending_cover_execution("cover.test", 7, cover_automation, plan, delay_seconds=0)
+        await engine._run_pending_cover_execution("cover.test", 7, cover_automation, plan)
 
         assert "cover.test" in engine._pending_cover_executions
         cover_automation.execute_plan.assert_not_awaited()
@@ -2203,14 +2362,12 @@ class TestPendingCoverExecutionQueue:
             execute_at=datetime(2026, 5, 23, 10, 5, tzinfo=timezone.utc),
             generation=0,
             plan_signature=plan.signature,
-            task=MagicMock(),
         )
         engine._pending_cover_executions["cover.remove"] = ScheduledCoverExecution(
             schedule_id=2,
             execute_at=datetime(2026, 5, 23, 10, 6, tzinfo=timezone.utc),
             generation=0,
             plan_signature=plan.signature,
-            task=MagicMock(),
         )
 
         with patch.object(engine, "_cancel_pending_cover_execution") as mock_cancel:
@@ -2218,6 +2375,326 @@ class TestPendingCoverExecutionQueue:
 
         mock_cancel.assert_called_once_with("cover.remove", "cover no longer configured")
 
+    async def test_rate_limit_queues_all_movements_by_priority_and_group(self, mock_ha_interface, mock_logger):
+        """With rate limiting, even the first movement is queued, with its command group and priority."""
+
+        config = {
+            ConfKeys.COVERS.value: ["cover.test_1", "cover.test_2"],
+            ConfKeys.WEATHER_ENTITY_ID.value: "weather.test",
+            ConfKeys.COVER_MOVEMENT_RATE_LIMIT.value: 6,
+            ConfKeys.COVER_MOVEMENT_RATE_LIMIT_SCOPE.value: "device",
+        }
+        engine = AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+        mock_ha_interface.get_cover_command_group.side_effect = lambda entity_id, scope: f"{scope}:{entity_id}"
+        opening_plan = self._make_plan()
+        closing_plan = CoverExecutionPlan(
+            cover_state=CoverState(pos_current=100, pos_target_desired=0),
+            sensor_data=opening_plan.sensor_data,
+            features=0,
+            current_pos=100,
+            desired_pos=0,
+            movement_reason=CoverMovementReason.CLOSING_HEAT_PROTECTION,
+            planned_tilt_target=None,
+            ownership_debug_snapshot=self._ownership_snapshot(),
+        )
+
+        with (
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.evaluate",
+                new=AsyncMock(
+                    side_effect=[
+                        (CoverState(), opening_plan, self._ownership_snapshot()),
+                        (CoverState(), closing_plan, self._ownership_snapshot()),
+                    ]
+                ),
+            ),
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.execute_plan", new=AsyncMock()
+            ) as mock_execute,
+            patch.object(engine._command_scheduler, "schedule") as mock_schedule,
+        ):
+            await engine._process_covers(("cover.test_1", "cover.test_2"), {}, opening_plan.sensor_data, CoordinatorData(covers={}))
+
+        mock_execute.assert_not_awaited()
+        assert [call.args[:3] for call in mock_schedule.call_args_list] == [
+            ("cover.test_1", "device:cover.test_1", CoverCommandPriority.OPENING),
+            ("cover.test_2", "device:cover.test_2", CoverCommandPriority.HEAT_PROTECTION),
+        ]
+        assert set(engine._pending_cover_executions) == {"cover.test_1", "cover.test_2"}
+
+
+class TestNextDeadline:
+    """Test the earliest upcoming time-based expiry across all covers."""
+
+    def test_earliest_deadline_wins(self, mock_ha_interface, mock_logger):
+        """Per-cover expiries and evening/morning times are merged; past deadlines are ignored."""
+
+        config = {
+            ConfKeys.COVERS.value: ["cover.a", "cover.b"],
+            ConfKeys.WEATHER_ENTITY_ID.value: "weather.test",
+            ConfKeys.MANUAL_OVERRIDE_DURATION.value: 600,
+        }
+        engine = AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+        now = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+        evening_closure = now + timedelta(hours=8)
+
+        with (
+            patch.object(engine, "_get_evening_closure_time_for_date", side_effect=[now - timedelta(hours=16), evening_closure]),
+            patch.object(engine, "_get_morning_opening_time_for_date", return_value=None),
+        ):
+            assert engine.get_next_deadline(now) == (evening_closure, "evening closure")
+
+        history = engine._cover_pos_history_mgr
+        history.add("cover.a", 50, cover_moved=False, timestamp=now - timedelta(seconds=200))
+        history.mark_manual_override_blocked("cover.a")
+        history.set_delayed_reopen_action("cover.b", now + timedelta(minutes=20))
+
+        with (
+            patch.object(engine, "_get_evening_closure_time_for_date", return_value=evening_closure),
+            patch.object(engine, "_get_morning_opening_time_for_date", return_value=None),
+        ):
+            assert engine.get_next_deadline(now) == (now + timedelta(seconds=400), "cover.a manual override expiry")
+
+            history.clear_manual_override_blocked("cover.a")
+            assert engine.get_next_deadline(now) == (now + timedelta(minutes=20), "cover.b delayed reopening")
+
+    def test_blocked_time_range_boundaries_are_deadlines(self, mock_ha_interface, mock_logger):
+        """With a blocked time range configured, its start and end are deadlines too."""
+
+        config = {
+            ConfKeys.COVERS.value: ["cover.a"],
+            ConfKeys.WEATHER_ENTITY_ID.value: "weather.test",
+            ConfKeys.AUTOMATION_DISABLED_TIME_RANGE.value: True,
+        }
+        engine = AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+        now = dt_util.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        range_start = engine._get_local_datetime_for_date(now.date(), time(13, 0))
+        range_end = engine._get_local_datetime_for_date(now.date(), time(14, 0))
+
+        with (
+            patch.object(engine, "_get_evening_closure_time_for_date", return_value=None),
+            patch.object(engine, "_get_morning_opening_time_for_date", return_value=None),
+            patch.object(engine, "_get_required_blocked_time_range_bounds", return_value=(time(13, 0), time(14, 0))),
+        ):
+            assert engine.get_next_deadline(now) == (range_start, "blocked time range start")
+            assert engine.get_next_deadline(range_start) == (range_end, "blocked time range end")
+
+
+class TestIdleCoverEvaluation:
+    """Test reuse of idle evaluation results while a cover's inputs are unchanged."""
+
+    @staticmethod
+    def _make_engine(mock_ha_interface, mock_logger) -> AutomationEngine:
+        """Create an engine for one cover."""
+
+        config = {ConfKeys.COVERS.value: ["cover.test_1"], ConfKeys.WEATHER_ENTITY_ID.value: "weather.test"}
+        return AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+
+    @staticmethod
+    async def _idle_process(cover_automation: CoverAutomation, _state, _sensor_data) -> CoverState:
+        """Stand in for an evaluation that finds nothing to do."""
+
+        cover_automation.last_evaluation_idle = True
+        return CoverState(pos_current=50, pos_target_desired=50)
+
+    async def test_unchanged_inputs_skip_evaluation(self, mock_ha_interface, mock_logger):
+        """An idle cover is only re-evaluated once its state or the sensor data changes noticeably."""
+
+        engine = self._make_engine(mock_ha_interface, mock_logger)
+        sensor_data = TestPendingCoverExecutionQueue._make_plan().sensor_data
+        cover_state = State("cover.test_1", "open", {"current_position": 50})
+
+        with patch.object(CoverAutomation, "process", autospec=True, side_effect=self._idle_process) as mock_process:
+            result = CoordinatorData(covers={})
+            await engine._process_covers(("cover.test_1",), {"cover.test_1": cover_state}, sensor_data, result)
+            await engine._process_covers(("cover.test_1",), {"cover.test_1": cover_state}, sensor_data, result)
+            assert mock_process.call_count == 1
+            assert result.covers["cover.test_1"].pos_current == 50
+            assert engine._cover_pos_history_mgr.get_latest_entry("cover.test_1").position == 50
+
+            # Sun movement below the quantum keeps the previous result
+            sensor_data.sun_azimuth += const.COVER_EVALUATION_SUN_QUANTUM / 4
+            await engine._process_covers(("cover.test_1",), {"cover.test_1": cover_state}, sensor_data, result)
+            assert mock_process.call_count == 1
+
+            sensor_data.sun_azimuth += const.COVER_EVALUATION_SUN_QUANTUM
+            await engine._process_covers(("cover.test_1",), {"cover.test_1": cover_state}, sensor_data, result)
+            assert mock_process.call_count == 2
+
+            updated_state = State(
+                "cover.test_1", "open", {"current_position": 50}, last_updated=cover_state.last_updated + timedelta(seconds=60)
+            )
+            await engine._process_covers(("cover.test_1",), {"cover.test_1": updated_state}, sensor_data, result)
+            assert mock_process.call_count == 3
+
+    async def test_pending_expiry_forces_evaluation(self, mock_ha_interface, mock_logger):
+        """Covers with a pending time-based expiry are evaluated on every run."""
+
+        engine = self._make_engine(mock_ha_interface, mock_logger)
+        sensor_data = TestPendingCoverExecutionQueue._make_plan().sensor_data
+        cover_state = State("cover.test_1", "open", {"current_position": 50})
+
+        with patch.object(CoverAutomation, "process", autospec=True, side_effect=self._idle_process) as mock_process:
+            result = CoordinatorData(covers={})
+            await engine._process_covers(("cover.test_1",), {"cover.test_1": cover_state}, sensor_data, result)
+            engine._cover_pos_history_mgr.set_delayed_reopen_action("cover.test_1", dt_util.utcnow())
+            await engine._process_covers(("cover.test_1",), {"cover.test_1": cover_state}, sensor_data, result)
+
+        assert mock_process.call_count == 2
+
+
+class TestConcurrentCoverExecution:
+    """Test bounded-concurrency execution when no stagger delay is configured."""
+
+    @staticmethod
+    def _make_engine(mock_ha_interface, mock_logger, max_concurrency: int) -> AutomationEngine:
+        """Create an engine for two covers with the given concurrency limit."""
+
+        config = {
+            ConfKeys.COVERS.value: ["cover.test_1", "cover.test_2"],
+            ConfKeys.WEATHER_ENTITY_ID.value: "weather.test",
+            ConfKeys.COVER_MOVEMENT_MAX_CONCURRENCY.value: max_concurrency,
+        }
+        return AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+
+    async def test_plans_execute_in_parallel(self, mock_ha_interface, mock_logger):
+        """All evaluated plans are executed concurrently up to the configured limit."""
+
+        engine = self._make_engine(mock_ha_interface, mock_logger, max_concurrency=2)
+        plan = TestPendingCoverExecutionQueue._make_plan()
+        snapshot = TestPendingCoverExecutionQueue._ownership_snapshot()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute_side_effect(_plan):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return CoverState(pos_target_final=20)
+
+        with (
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.evaluate",
+                new=AsyncMock(return_value=(CoverState(), plan, snapshot)),
+            ) as mock_evaluate,
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.execute_plan",
+                new=AsyncMock(side_effect=execute_side_effect),
+            ) as mock_execute,
+        ):
+            result = CoordinatorData(covers={})
+            await engine._process_covers(("cover.test_1", "cover.test_2"), {}, plan.sensor_data, result)
+
+        assert mock_evaluate.await_count == 2
+        assert mock_execute.await_count == 2
+        assert max_in_flight == 2
+        assert all(cover_state.pos_target_final == 20 for cover_state in result.covers.values())
+
+    async def test_failed_execution_does_not_block_other_covers(self, mock_ha_interface, mock_logger):
+        """An exception while executing one cover keeps its evaluated state and lets the others finish."""
+
+        engine = self._make_engine(mock_ha_interface, mock_logger, max_concurrency=2)
+        plan = TestPendingCoverExecutionQueue._make_plan()
+        snapshot = TestPendingCoverExecutionQueue._ownership_snapshot()
+        evaluated_state = CoverState(pos_current=10)
+
+        with (
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.evaluate",
+                new=AsyncMock(return_value=(evaluated_state, plan, snapshot)),
+            ),
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.execute_plan",
+                new=AsyncMock(side_effect=[RuntimeError("boom"), CoverState(pos_target_final=20)]),
+            ),
+        ):
+            result = CoordinatorData(covers={})
+            await engine._process_covers(("cover.test_1", "cover.test_2"), {}, plan.sensor_data, result)
+
+        assert result.covers["cover.test_1"] is evaluated_state
+        assert result.covers["cover.test_2"].pos_target_final == 20
+        mock_logger.error.assert_any_call("[cover.test_1] Failed cover execution: boom")
+
+    async def test_logbook_batch_wraps_cover_processing(self, mock_ha_interface, mock_logger):
+        """With batched logbook entries, the batch is opened before and flushed after processing."""
+
+        config = {
+            ConfKeys.COVERS.value: ["cover.test_1"],
+            ConfKeys.WEATHER_ENTITY_ID.value: "weather.test",
+            ConfKeys.LOGBOOK_BATCH_ENTRIES.value: True,
+        }
+        engine = AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+        mock_ha_interface.async_flush_logbook_batch = AsyncMock()
+
+        with patch(
+            "custom_components.smart_cover_automation.automation_engine.CoverAutomation.process",
+            new=AsyncMock(side_effect=RuntimeError("boom")),
+        ):
+            with pytest.raises(RuntimeError):
+                await engine._process_covers(
+                    ("cover.test_1",), {}, TestPendingCoverExecutionQueue._make_plan().sensor_data, CoordinatorData(covers={})
+                )
+
+        mock_ha_interface.begin_logbook_batch.assert_called_once()
+        mock_ha_interface.async_flush_logbook_batch.assert_awaited_once()
+
+    async def test_grouped_service_calls_execute_plans_in_one_batch(self, mock_ha_interface, mock_logger):
+        """With grouped service calls, the evaluated plans are executed together in one service call batch."""
+
+        config = {
+            ConfKeys.COVERS.value: ["cover.test_1", "cover.test_2"],
+            ConfKeys.WEATHER_ENTITY_ID.value: "weather.test",
+            ConfKeys.COVER_MOVEMENT_GROUP_SERVICE_CALLS.value: True,
+        }
+        engine = AutomationEngine(resolved=resolve(config), config=config, ha_interface=mock_ha_interface, logger=mock_logger)
+        executions = []
+
+        async def _run_batch(batch_executions):
+            executions.extend(batch_executions)
+            await asyncio.gather(*batch_executions)
+
+        mock_ha_interface.async_run_service_call_batch = AsyncMock(side_effect=_run_batch)
+        plan = TestPendingCoverExecutionQueue._make_plan()
+        snapshot = TestPendingCoverExecutionQueue._ownership_snapshot()
+        moved_state = CoverState(pos_target_final=20)
+
+        with (
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.evaluate",
+                new=AsyncMock(return_value=(CoverState(), plan, snapshot)),
+            ),
+            patch(
+                "custom_components.smart_cover_automation.automation_engine.CoverAutomation.execute_plan",
+                new=AsyncMock(return_value=moved_state),
+            ) as mock_execute_plan,
+        ):
+            result = CoordinatorData(covers={})
+            await engine._process_covers(("cover.test_1", "cover.test_2"), {}, plan.sensor_data, result)
+
+        mock_ha_interface.async_run_service_call_batch.assert_awaited_once()
+        assert len(executions) == 2
+        assert mock_execute_plan.await_count == 2
+        assert result.covers == {"cover.test_1": moved_state, "cover.test_2": moved_state}
+        mock_ha_interface.begin_logbook_batch.assert_not_called()
+
+    async def test_default_limit_processes_sequentially(self, mock_ha_interface, mock_logger):
+        """With the default limit of 1, covers are processed one after another."""
+
+        engine = self._make_engine(mock_ha_interface, mock_logger, max_concurrency=1)
+
+        with patch(
+            "custom_components.smart_cover_automation.automation_engine.CoverAutomation.process",
+            new=AsyncMock(return_value=CoverState()),
+        ) as mock_process:
+            result = CoordinatorData(covers={})
+            await engine._process_covers(
+                ("cover.test_1", "cover.test_2"), {}, TestPendingCoverExecutionQueue._make_plan().sensor_data, result
+            )
+
+        assert mock_process.await_count == 2
+
 
 class TestLogAutomationResult:
     """Test _log_automation_result method."""
@@ -2271,7 +2748,7 @@ class TestCheckSunsetClosing:
     #
     # test_check_sunset_closing_before_window
     #
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_check_sunset_closing_before_window(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that method returns False when current time is before the closing window."""
         from datetime import datetime
@@ -2302,7 +2779,7 @@ class TestCheckSunsetClosing:
     #
     # test_check_sunset_closing_inside_window_first_time
     #
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_check_sunset_closing_inside_window_first_time(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that method returns True once when entering the closing window."""
         from datetime import datetime
@@ -2433,7 +2910,7 @@ class TestComputePostEveningClosure:
             "external-at-cutoff",
         ],
     )
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_morning_opening_matrix_releases_carryover_at_resolved_cutoff(
         self,
         mock_get_astral,
@@ -2559,7 +3036,7 @@ class TestComputePostEveningClosure:
             "11:30:00",
         )
 
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_relative_morning_opening_matches_sunrise_by_default(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that relative morning opening with zero delay releases at sunrise."""
 
@@ -2710,7 +3187,7 @@ class TestComputePostEveningClosure:
     #
     # test_check_sunset_closing_inside_window_already_closed
     #
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_check_sunset_closing_inside_window_already_closed(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that method returns False if already closed within the window."""
         from datetime import datetime
@@ -2742,7 +3219,7 @@ class TestComputePostEveningClosure:
     #
     # test_check_sunset_closing_after_window_resets_state
     #
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_check_sunset_closing_after_window_resets_state(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that state resets after the closing window ends."""
         from datetime import datetime
@@ -2776,7 +3253,7 @@ class TestComputePostEveningClosure:
     #
     # test_check_sunset_closing_zero_delay
     #
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_check_sunset_closing_zero_delay(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that zero delay triggers at sunset time."""
         from datetime import datetime
@@ -2805,7 +3282,7 @@ class TestComputePostEveningClosure:
     #
     # test_check_sunset_closing_sunset_unavailable
     #
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_check_sunset_closing_sunset_unavailable(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that method returns False when sunset time is unavailable."""
 
@@ -2830,7 +3307,7 @@ class TestComputePostEveningClosure:
     #
     # test_check_sunset_closing_multiple_day_cycles
     #
-    @patch("custom_components.smart_cover_automation.automation_engine.get_astral_event_date")
+    @patch("custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date")
     def test_check_sunset_closing_multiple_day_cycles(self, mock_get_astral, mock_ha_interface, mock_logger, freezer):
         """Test that feature works correctly across multiple days."""
         from datetime import datetime
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -48,17 +48,18 @@ async def test_global_external_tilt_number_set_native_value_persists_integer(
     entity_class,
     config_key,
 ) -> None:
-    """Global external tilt numbers should persist integer values to options."""
+    """Global external tilt numbers should store integer values as runtime settings, not in the options."""
 
     entity = entity_class(mock_coordinator_basic)
     mock_coordinator_basic.hass.config_entries.async_update_entry = Mock()
+    mock_coordinator_basic.async_request_refresh = AsyncMock()
 
     await entity.async_set_native_value(37.0)
 
-    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_called_once()
-    call_kwargs = mock_coordinator_basic.hass.config_entries.async_update_entry.call_args
-    options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-    assert options[config_key] == 37
+    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_not_called()
+    mock_coordinator_basic.async_request_refresh.assert_awaited_once()
+    assert mock_coordinator_basic.effective_options[config_key] == 37
+    assert entity.native_value == 37.0
 
 
 @pytest.mark.parametrize(
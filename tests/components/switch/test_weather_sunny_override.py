@@ -295,62 +295,64 @@ class TestWeatherSunnyOverrideSwitchToggle:
     """Test WeatherSunnyExternalControlSwitch turn on/off behavior."""
 
     async def test_turn_on_persists_true(self, override_switch) -> None:
-        """Test that turning the switch ON persists True to config options."""
+        """Test that turning the switch ON stores True as a runtime setting, not in the config options."""
 
-        override_switch.coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator = override_switch.coordinator
+        coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator.async_request_refresh = AsyncMock()
 
         await override_switch.async_turn_on()
 
-        # Verify async_update_entry was called with the override set to True
-        override_switch.coordinator.hass.config_entries.async_update_entry.assert_called_once()
-        call_kwargs = override_switch.coordinator.hass.config_entries.async_update_entry.call_args
-        options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-        assert options[SWITCH_KEY_WEATHER_SUNNY_EXTERNAL_CONTROL] is True
+        coordinator.hass.config_entries.async_update_entry.assert_not_called()
+        coordinator.async_request_refresh.assert_awaited_once()
+        assert coordinator.effective_options[SWITCH_KEY_WEATHER_SUNNY_EXTERNAL_CONTROL] is True
 
     async def test_turn_off_persists_false(self, override_switch) -> None:
-        """Test that turning the switch OFF persists False to config options."""
+        """Test that turning the switch OFF stores False as a runtime setting, not in the config options."""
 
-        override_switch.coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator = override_switch.coordinator
+        coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator.async_request_refresh = AsyncMock()
 
         await override_switch.async_turn_off()
 
-        # Verify async_update_entry was called with the override set to False
-        override_switch.coordinator.hass.config_entries.async_update_entry.assert_called_once()
-        call_kwargs = override_switch.coordinator.hass.config_entries.async_update_entry.call_args
-        options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-        assert options[SWITCH_KEY_WEATHER_SUNNY_EXTERNAL_CONTROL] is False
+        coordinator.hass.config_entries.async_update_entry.assert_not_called()
+        coordinator.async_request_refresh.assert_awaited_once()
+        assert coordinator.effective_options[SWITCH_KEY_WEATHER_SUNNY_EXTERNAL_CONTROL] is False
 
 
 class TestWeatherHotOverrideSwitchToggle:
     """Test WeatherHotExternalControlSwitch turn on/off behavior."""
 
     async def test_turn_on_persists_true(self, hot_override_switch) -> None:
-        """Test that turning the switch ON persists True to config options."""
+        """Test that turning the switch ON stores True as a runtime setting, not in the config options."""
 
-        hot_override_switch.coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator = hot_override_switch.coordinator
+        coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator.async_request_refresh = AsyncMock()
 
         await hot_override_switch.async_turn_on()
 
-        hot_override_switch.coordinator.hass.config_entries.async_update_entry.assert_called_once()
-        call_kwargs = hot_override_switch.coordinator.hass.config_entries.async_update_entry.call_args
-        options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-        assert options[SWITCH_KEY_WEATHER_HOT_EXTERNAL_CONTROL] is True
+        coordinator.hass.config_entries.async_update_entry.assert_not_called()
+        coordinator.async_request_refresh.assert_awaited_once()
+        assert coordinator.effective_options[SWITCH_KEY_WEATHER_HOT_EXTERNAL_CONTROL] is True
 
 
 class TestCoverWeatherHotOverrideSwitchToggle:
     """Test CoverWeatherHotExternalControlSwitch turn on/off behavior."""
 
     async def test_turn_off_persists_false(self, cover_hot_override_switch) -> None:
-        """Test that turning the switch OFF persists False to config options."""
+        """Test that turning the switch OFF stores False as a runtime setting, not in the config options."""
 
-        cover_hot_override_switch.coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator = cover_hot_override_switch.coordinator
+        coordinator.hass.config_entries.async_update_entry = Mock()
+        coordinator.async_request_refresh = AsyncMock()
 
         await cover_hot_override_switch.async_turn_off()
 
-        cover_hot_override_switch.coordinator.hass.config_entries.async_update_entry.assert_called_once()
-        call_kwargs = cover_hot_override_switch.coordinator.hass.config_entries.async_update_entry.call_args
-        options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-        assert options[f"cover.test_cover_{COVER_SFX_WEATHER_HOT_EXTERNAL_CONTROL}"] is False
+        coordinator.hass.config_entries.async_update_entry.assert_not_called()
+        coordinator.async_request_refresh.assert_awaited_once()
+        assert coordinator.effective_options[f"cover.test_cover_{COVER_SFX_WEATHER_HOT_EXTERNAL_CONTROL}"] is False
 
 
 class TestWeatherSunnyOverrideSwitchRemoval:
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import time
 from types import SimpleNamespace
 from typing import Iterable, cast
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 from homeassistant.helpers.entity import Entity
 
@@ -219,17 +219,18 @@ def test_morning_opening_external_time_invalid_native_value_returns_none(mock_co
 # test_morning_opening_external_time_async_set_value_persists_isoformat
 #
 async def test_morning_opening_external_time_async_set_value_persists_isoformat(mock_coordinator_basic) -> None:
-    """Setting a new time value should persist it to config entry options."""
+    """Setting a new time value should store it as a runtime setting, not in the config entry options."""
 
     entity = MorningOpeningExternalTime(mock_coordinator_basic)
     mock_coordinator_basic.hass.config_entries.async_update_entry = Mock()
+    mock_coordinator_basic.async_request_refresh = AsyncMock()
 
     await entity.async_set_value(time(7, 45))
 
-    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_called_once()
-    call_kwargs = mock_coordinator_basic.hass.config_entries.async_update_entry.call_args
-    options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-    assert options[TIME_KEY_MORNING_OPENING_EXTERNAL_TIME] == "07:45:00"
+    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_not_called()
+    mock_coordinator_basic.async_request_refresh.assert_awaited_once()
+    assert mock_coordinator_basic.effective_options[TIME_KEY_MORNING_OPENING_EXTERNAL_TIME] == "07:45:00"
+    assert entity.native_value == time(7, 45)
 
 
 #
@@ -254,17 +255,18 @@ def test_evening_closure_external_time_metadata_and_native_value(mock_coordinato
 # test_evening_closure_external_time_async_set_value_persists_isoformat
 #
 async def test_evening_closure_external_time_async_set_value_persists_isoformat(mock_coordinator_basic) -> None:
-    """Setting a new evening time value should persist it to config entry options."""
+    """Setting a new evening time value should store it as a runtime setting, not in the config entry options."""
 
     entity = EveningClosureExternalTime(mock_coordinator_basic)
     mock_coordinator_basic.hass.config_entries.async_update_entry = Mock()
+    mock_coordinator_basic.async_request_refresh = AsyncMock()
 
     await entity.async_set_value(time(18, 30))
 
-    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_called_once()
-    call_kwargs = mock_coordinator_basic.hass.config_entries.async_update_entry.call_args
-    options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-    assert options[TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME] == "18:30:00"
+    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_not_called()
+    mock_coordinator_basic.async_request_refresh.assert_awaited_once()
+    assert mock_coordinator_basic.effective_options[TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME] == "18:30:00"
+    assert entity.native_value == time(18, 30)
 
 
 def test_blocked_time_range_external_start_metadata_and_native_value(mock_coordinator_basic) -> None:
@@ -283,14 +285,13 @@ def test_blocked_time_range_external_start_metadata_and_native_value(mock_coordi
 
 
 async def test_blocked_time_range_external_end_async_set_value_persists_isoformat(mock_coordinator_basic) -> None:
-    """Setting a blocked-time external end should persist it to config entry options."""
+    """Setting a blocked-time external end should store it as a runtime setting, not in the config entry options."""
 
     entity = AutomationDisabledTimeRangeExternalEnd(mock_coordinator_basic)
     mock_coordinator_basic.hass.config_entries.async_update_entry = Mock()
+    mock_coordinator_basic.async_request_refresh = AsyncMock()
 
     await entity.async_set_value(time(6, 10))
 
-    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_called_once()
-    call_kwargs = mock_coordinator_basic.hass.config_entries.async_update_entry.call_args
-    options = call_kwargs[1]["options"] if "options" in call_kwargs[1] else call_kwargs[0][1]
-    assert options[TIME_KEY_AUTOMATION_DISABLED_TIME_RANGE_EXTERNAL_END] == "06:10:00"
+    mock_coordinator_basic.hass.config_entries.async_update_entry.assert_not_called()
+    assert mock_coordinator_basic.effective_options[TIME_KEY_AUTOMATION_DISABLED_TIME_RANGE_EXTERNAL_END] == "06:10:00"
@@ -872,7 +872,7 @@ class TestOptionsFlowIntegration:
         assert flow._config_data[ConfKeys.TILT_DRIFT_TOLERANCE.value] == 7
 
     async def test_step_5_persists_cover_movement_stagger_delay(self, mock_hass_with_covers: MagicMock) -> None:
-        """Step 5 should persist the stagger-delay setting alongside window-sensor settings."""
+        """Step 5 should persist the additional settings alongside window-sensor settings."""
 
         existing_data = {
             ConfKeys.COVERS.value: [MOCK_COVER_ENTITY_ID],
@@ -886,6 +886,13 @@ class TestOptionsFlowIntegration:
             {
                 const.STEP_5_SECTION_ADDITIONAL_SETTINGS: {
                     ConfKeys.COVER_MOVEMENT_STAGGER_DELAY.value: 12,
+                    ConfKeys.COVER_MOVEMENT_MAX_CONCURRENCY.value: 4,
+                    ConfKeys.COVER_MOVEMENT_RATE_LIMIT.value: 12,
+                    ConfKeys.COVER_MOVEMENT_RATE_LIMIT_BURST.value: 3,
+                    ConfKeys.COVER_MOVEMENT_RATE_LIMIT_SCOPE.value: "device",
+                    ConfKeys.COVER_MOVEMENT_GROUP_SERVICE_CALLS.value: True,
+                    ConfKeys.LOGBOOK_BATCH_ENTRIES.value: True,
+                    ConfKeys.SHARED_STATE_STORAGE.value: True,
                 },
                 const.STEP_5_SECTION_WINDOW_SENSORS: {},
             }
@@ -894,6 +901,13 @@ class TestOptionsFlowIntegration:
         assert _as_dict(result)["type"] == FlowResultType.FORM
         assert _as_dict(result)["step_id"] == "6"
         assert flow._config_data[ConfKeys.COVER_MOVEMENT_STAGGER_DELAY.value] == 12
+        assert flow._config_data[ConfKeys.COVER_MOVEMENT_MAX_CONCURRENCY.value] == 4
+        assert flow._config_data[ConfKeys.COVER_MOVEMENT_RATE_LIMIT.value] == 12
+        assert flow._config_data[ConfKeys.COVER_MOVEMENT_RATE_LIMIT_BURST.value] == 3
+        assert flow._config_data[ConfKeys.COVER_MOVEMENT_RATE_LIMIT_SCOPE.value] == "device"
+        assert flow._config_data[ConfKeys.COVER_MOVEMENT_GROUP_SERVICE_CALLS.value] is True
+        assert flow._config_data[ConfKeys.LOGBOOK_BATCH_ENTRIES.value] is True
+        assert flow._config_data[ConfKeys.SHARED_STATE_STORAGE.value] is True
 
     async def test_removes_orphaned_max_closure_settings(self, mock_hass_with_covers: MagicMock) -> None:
         """Test that per-cover max_closure settings are removed when covers are removed.
@@ -485,6 +485,7 @@ def mock_hass_with_covers() -> MagicMock:
         return None
 
     hass = MagicMock()
+    hass.data = {}
     hass.states.get.side_effect = mock_get_state
     hass.config_entries = MagicMock()
 
@@ -1054,6 +1055,7 @@ def mock_hass_with_weather_and_covers() -> MagicMock:
         Mock Home Assistant instance with simulated weather and cover entities
     """
     hass = MagicMock()
+    hass.data = {}
 
     def mock_get_state(entity_id: str) -> MagicMock | None:
         if entity_id.startswith("cover."):
@@ -1167,6 +1169,7 @@ def create_mock_hass_with_weather_service() -> MagicMock:
     hass = MagicMock(spec=HomeAssistant)
     hass.states = MagicMock()
     hass.services = MagicMock()
+    hass.data = {}
 
     # Setup weather service mock with standard pattern
     hass.services.async_call = AsyncMock(side_effect=create_mock_weather_service())
@@ -1238,6 +1241,7 @@ def mock_basic_hass() -> MagicMock:
     hass.states = MagicMock()
     hass.services = MagicMock()
     hass.config_entries = MagicMock()
+    hass.data = {}
     return hass
 
 
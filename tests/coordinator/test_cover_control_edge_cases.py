@@ -29,6 +29,7 @@ class TestCoverControlEdgeCases:
     async def test_minor_position_adjustment_skipped(self) -> None:
         """Test that minor position adjustments are skipped based on min_position_delta."""
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -62,6 +63,7 @@ class TestCoverControlEdgeCases:
     async def test_exact_position_no_movement_needed(self) -> None:
         """Test that no movement is made when cover is already at desired position."""
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -118,6 +120,7 @@ class TestCoverControlEdgeCases:
     async def test_cover_debug_logging_paths(self) -> None:
         """Test debug logging paths in cover evaluation."""
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
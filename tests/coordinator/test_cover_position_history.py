@@ -304,6 +304,27 @@ class TestAutomationClosedMarkers:
 
         assert callback.call_count == 2
 
+    def test_managed_state_change_callback_receives_only_changed_cover(self) -> None:
+        """Persistence callback should receive the changed cover only, not a full export."""
+
+        callback = MagicMock()
+        manager = CoverPositionHistoryManager(on_automation_managed_states_changed=callback)
+        manager.set_automation_managed_state(
+            "cover.living_room",
+            AutomationManagedState(position=0, automation_mode=AutomationMode.EVENING_CLOSURE),
+        )
+        manager.set_automation_managed_state(
+            "cover.bedroom",
+            AutomationManagedState(position=35, automation_mode=AutomationMode.HEAT_PROTECTION),
+        )
+        manager.clear_automation_managed_state("cover.living_room")
+
+        assert [call.args[0] for call in callback.call_args_list] == [
+            {"cover.living_room": {"position": 0, "automation_mode": AutomationMode.EVENING_CLOSURE.value}},
+            {"cover.bedroom": {"position": 35, "automation_mode": AutomationMode.HEAT_PROTECTION.value}},
+            {"cover.living_room": None},
+        ]
+
     def test_set_automation_owned_position_ignores_unknown_cover(self) -> None:
         """Updating an owned position should be a no-op without managed state."""
 
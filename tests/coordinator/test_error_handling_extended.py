@@ -28,6 +28,7 @@ class TestCoordinatorErrorHandling:
     async def test_configuration_resolution_exception(self, caplog) -> None:
         """Test handling of configuration resolution exceptions."""
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -68,6 +69,7 @@ class TestCoordinatorErrorHandling:
         are properly caught and wrapped in ServiceCallError with appropriate messages.
         """
         hass = MagicMock()
+        hass.data = {}
         config_entry = MockConfigEntry(create_temperature_config())
         coordinator = DataUpdateCoordinator(hass, cast(IntegrationConfigEntry, config_entry))
 
@@ -81,6 +83,7 @@ class TestCoordinatorErrorHandling:
     async def test_service_call_error_during_automation_update(self, caplog) -> None:
         """Test service call error handling during full automation update."""
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -130,6 +133,7 @@ class TestCoordinatorErrorHandling:
         functionality rather than completely failing.
         """
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -177,6 +181,7 @@ class TestCoordinatorErrorHandling:
         - Expected behavior: Warning logged, automation continues with temp_max=0.0, entities remain available
         """
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
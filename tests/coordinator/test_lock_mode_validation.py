@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from custom_components.smart_cover_automation.automation_state_store import RestoredAutomationState
 from custom_components.smart_cover_automation.const import HeatProtectionMode, LockMode, ReopeningMode
 from custom_components.smart_cover_automation.coordinator import DataUpdateCoordinator
 
@@ -25,6 +26,7 @@ class TestLockModeValidation:
     def mock_hass(self):
         """Create a mock Home Assistant instance."""
         hass = MagicMock()
+        hass.data = {}
         hass.config_entries = MagicMock()
         hass.config_entries.async_update_entry = MagicMock()
         hass.states = MagicMock()
@@ -151,6 +153,7 @@ class TestAutomaticReopeningModeValidation:
     def mock_hass(self):
         """Create a mock Home Assistant instance."""
         hass = MagicMock()
+        hass.data = {}
         hass.config_entries = MagicMock()
         hass.config_entries.async_update_entry = MagicMock()
         hass.states = MagicMock()
@@ -192,6 +195,7 @@ class TestHeatProtectionModeValidation:
     def mock_hass(self):
         """Create a mock Home Assistant instance."""
         hass = MagicMock()
+        hass.data = {}
         hass.config_entries = MagicMock()
         hass.config_entries.async_update_entry = MagicMock()
         hass.states = MagicMock()
@@ -241,6 +245,7 @@ class TestCoordinatorRuntimeStateAndProperties:
     def mock_hass(self):
         """Create a mock Home Assistant instance."""
         hass = MagicMock()
+        hass.data = {}
         hass.config_entries = MagicMock()
         hass.config_entries.async_update_entry = MagicMock()
         hass.states = MagicMock()
@@ -260,9 +265,15 @@ class TestCoordinatorRuntimeStateAndProperties:
         stored_markers = {"cover.test": "heat_protection"}
         stored_extrema = {"date": "2026-05-24", "temp_max": 25.0, "temp_min": 15.0}
         coordinator._automation_state_store = MagicMock(
-            async_load_automation_managed_states=AsyncMock(return_value=stored_managed_states),
-            async_load_closed_markers=AsyncMock(return_value=stored_markers),
-            async_load_current_day_temperature_extrema=AsyncMock(return_value=stored_extrema),
+            async_load_runtime_state=AsyncMock(
+                return_value=RestoredAutomationState(
+                    automation_managed_states=stored_managed_states,
+                    closed_markers=stored_markers,
+                    current_day_temperature_extrema=stored_extrema,
+                    runtime_settings={},
+                    startup_migrations={},
+                )
+            ),
         )
         coordinator._automation_engine = MagicMock(
             restore_automation_managed_states=MagicMock(),
@@ -271,14 +282,12 @@ class TestCoordinatorRuntimeStateAndProperties:
 
         await coordinator.async_restore_runtime_state()
 
-        coordinator._automation_state_store.async_load_automation_managed_states.assert_awaited_once()
-        coordinator._automation_state_store.async_load_closed_markers.assert_awaited_once()
-        coordinator._automation_state_store.async_load_current_day_temperature_extrema.assert_awaited_once()
+        coordinator._automation_state_store.async_load_runtime_state.assert_awaited_once()
         coordinator._automation_engine.restore_automation_managed_states.assert_called_once_with(stored_managed_states, stored_markers)
         coordinator._automation_engine.restore_current_day_temperature_extrema.assert_called_once_with(stored_extrema)
 
     async def test_async_persist_runtime_state_saves_both_engine_exports(self, coordinator):
-        """Test persisting both runtime-state payloads from the automation engine."""
+        """Test persisting all runtime-state payloads from the automation engine with one save."""
 
         exported_managed_states = {"cover.test": {"position": 20, "automation_mode": "heat_protection"}}
         exported_markers = {"cover.test": "manual_override"}
@@ -288,17 +297,16 @@ class TestCoordinatorRuntimeStateAndProperties:
             export_closed_by_automation_markers=MagicMock(return_value=exported_markers),
             export_current_day_temperature_extrema=MagicMock(return_value=exported_extrema),
         )
-        coordinator._automation_state_store = MagicMock(
-            async_save_automation_managed_states=AsyncMock(),
-            async_save_closed_markers=AsyncMock(),
-            async_save_current_day_temperature_extrema=AsyncMock(),
-        )
+        coordinator._automation_state_store = MagicMock(async_save_runtime_state=AsyncMock())
 
         await coordinator.async_persist_runtime_state()
 
-        coordinator._automation_state_store.async_save_automation_managed_states.assert_awaited_once_with(exported_managed_states)
-        coordinator._automation_state_store.async_save_closed_markers.assert_awaited_once_with(exported_markers)
-        coordinator._automation_state_store.async_save_current_day_temperature_extrema.assert_awaited_once_with(exported_extrema)
+        coordinator._automation_state_store.async_save_runtime_state.assert_awaited_once_with(
+            automation_managed_states=exported_managed_states,
+            closed_markers=exported_markers,
+            current_day_temperature_extrema=exported_extrema,
+            runtime_settings={},
+        )
 
     async def test_async_remove_runtime_state_delegates_to_state_store(self, coordinator):
         """Test removing persisted runtime state."""
@@ -40,6 +40,15 @@ class TestLogbookEntries:
         registry = MagicMock()
         # entities is a dict-like object that supports .values()
         registry.entities = {}
+
+        # Emulate the registry's (domain, platform, unique_id) index on top of the entities dict
+        def _async_get_entity_id(domain: str, platform: str, unique_id: str) -> str | None:
+            for entity in registry.entities.values():
+                if entity.unique_id == unique_id and entity.platform == platform and entity.entity_id.startswith(f"{domain}."):
+                    return entity.entity_id
+            return None
+
+        registry.async_get_entity_id.side_effect = _async_get_entity_id
         return registry
 
     @pytest.fixture
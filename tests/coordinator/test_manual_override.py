@@ -657,7 +657,7 @@ class TestManualOverride(TestDataUpdateCoordinatorBase):
             ATTR_SUPPORTED_FEATURES: int(CoverEntityFeature.SET_POSITION),
         }
 
-        expired_time = latest_entry.timestamp + (const.UPDATE_INTERVAL * (const.COVER_AUTOMATION_SETTLE_CYCLES + 1))
+        expired_time = latest_entry.timestamp + const.COVER_AUTOMATION_SETTLE_WINDOW + timedelta(minutes=1)
         with patch("custom_components.smart_cover_automation.cover_automation.datetime") as mock_datetime:
             mock_datetime.now.return_value = expired_time
             mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
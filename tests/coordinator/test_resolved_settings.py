@@ -0,0 +1,57 @@
+"""Tests for the resolved-settings cache in DataUpdateCoordinator."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.smart_cover_automation.config import ConfKeys, resolve
+from custom_components.smart_cover_automation.coordinator import DataUpdateCoordinator
+
+
+class TestResolvedSettingsCache:
+    """Resolved settings are computed once per options revision."""
+
+    #
+    # test_repeated_access_resolves_once
+    #
+    async def test_repeated_access_resolves_once(self, coordinator: DataUpdateCoordinator) -> None:
+        """Repeated access with unchanged options returns the cached instance, also via the public property."""
+
+        coordinator.invalidate_resolved_settings()
+
+        with patch("custom_components.smart_cover_automation.config.resolve", wraps=resolve) as mock_resolve:
+            first = coordinator._resolved_settings()
+            _ = coordinator.lock_mode
+            _ = coordinator.heat_protection_mode
+            second = coordinator.resolved_settings
+
+        assert first is second
+        assert mock_resolve.call_count == 1
+
+    #
+    # test_options_change_is_picked_up
+    #
+    async def test_options_change_is_picked_up(self, coordinator: DataUpdateCoordinator) -> None:
+        """A changed option produces freshly resolved settings."""
+
+        before = coordinator._resolved_settings()
+        coordinator.config_entry.options[ConfKeys.SIMULATION_MODE.value] = not before.simulation_mode
+
+        after = coordinator._resolved_settings()
+
+        assert after is not before
+        assert after.simulation_mode is not before.simulation_mode
+
+    #
+    # test_invalidate_forces_rebuild
+    #
+    async def test_invalidate_forces_rebuild(self, coordinator: DataUpdateCoordinator) -> None:
+        """Invalidation drops the cache even when the options are unchanged."""
+
+        before = coordinator._resolved_settings()
+        coordinator.invalidate_resolved_settings()
+
+        after = coordinator._resolved_settings()
+
+        assert after is not before
+        assert after == before
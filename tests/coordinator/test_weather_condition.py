@@ -43,6 +43,7 @@ class TestWeatherCondition:
         robust automation behavior when weather data is unavailable.
         """
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -96,6 +97,7 @@ class TestWeatherCondition:
     def test_get_weather_condition_direct_call(self) -> None:
         """Test _get_weather_condition method directly."""
         hass = MagicMock()
+        hass.data = {}
         config_entry = MockConfigEntry(create_temperature_config())
         coordinator = DataUpdateCoordinator(hass, cast(IntegrationConfigEntry, config_entry))
 
@@ -138,6 +140,7 @@ class TestWeatherCondition:
         temperature and sun position would normally trigger closing.
         """
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -185,6 +188,7 @@ class TestWeatherCondition:
         temperature and sun position conditions are met.
         """
         hass = MagicMock()
+        hass.data = {}
         hass.services = MagicMock()
         hass.states = MagicMock()
 
@@ -15,6 +15,7 @@ This module tests CoverAutomation in isolation, focusing on:
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
@@ -4275,3 +4276,14 @@ class TestLogCoverMsg:
 
         cover_automation._log_cover_msg("Test message", const.LogSeverity.ERROR)
         mock_logger.error.assert_called_once()
+
+    def test_log_cover_msg_skips_disabled_level(self, cover_automation, mock_logger):
+        """Messages below the logger's level are dropped before formatting."""
+
+        mock_logger.isEnabledFor.side_effect = lambda level: level >= logging.INFO
+
+        cover_automation._log_cover_msg("Test message", const.LogSeverity.DEBUG)
+        cover_automation._log_cover_msg("Test message", const.LogSeverity.INFO)
+
+        mock_logger.debug.assert_not_called()
+        mock_logger.info.assert_called_once()
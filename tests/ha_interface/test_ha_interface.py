@@ -12,7 +12,8 @@ a clean abstraction layer over Home Assistant's APIs. Tests cover:
 
 from __future__ import annotations
 
-from datetime import date, datetime, time, timezone
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
@@ -35,6 +36,7 @@ from homeassistant.exceptions import HomeAssistantError
 from custom_components.smart_cover_automation import const
 from custom_components.smart_cover_automation import ha_interface as ha_interface_module
 from custom_components.smart_cover_automation.config import ResolvedConfig
+from custom_components.smart_cover_automation.forecast_cache import ForecastCache
 from custom_components.smart_cover_automation.ha_interface import (
     HomeAssistantInterface,
     InvalidSensorReadingError,
@@ -342,6 +344,107 @@ class TestSetCoverPosition:
         with pytest.raises(ServiceCallError, match="Unexpected error"):
             await ha_interface.set_cover_position(MOCK_COVER_ENTITY_ID, 50, int(features))
 
+    #
+    # test_service_call_batch_groups_identical_targets
+    #
+    async def test_service_call_batch_groups_identical_targets(self, ha_interface: HomeAssistantInterface, mock_hass: MagicMock) -> None:
+        """Batched calls with identical service data are issued once, position calls before tilt calls."""
+
+        position_and_tilt = int(CoverEntityFeature.SET_POSITION | CoverEntityFeature.SET_TILT_POSITION)
+        positions: dict[str, int] = {}
+
+        async def _move(entity_id: str, position: int, tilt: int | None) -> None:
+            positions[entity_id] = await ha_interface.set_cover_position(entity_id, position, position_and_tilt)
+            if tilt is not None:
+                await ha_interface.set_cover_tilt_position(entity_id, tilt, position_and_tilt)
+
+        await ha_interface.async_run_service_call_batch([_move("cover.a", 0, 30), _move("cover.b", 0, 30), _move("cover.c", 40, None)])
+
+        assert positions == {"cover.a": 0, "cover.b": 0, "cover.c": 40}
+        assert mock_hass.services.async_call.call_args_list == [
+            call(Platform.COVER, SERVICE_SET_COVER_POSITION, {ATTR_ENTITY_ID: ["cover.a", "cover.b"], ATTR_POSITION: 0}),
+            call(Platform.COVER, SERVICE_SET_COVER_POSITION, {ATTR_ENTITY_ID: "cover.c", ATTR_POSITION: 40}),
+            call(Platform.COVER, SERVICE_SET_COVER_TILT_POSITION, {ATTR_ENTITY_ID: ["cover.a", "cover.b"], ATTR_TILT_POSITION: 30}),
+        ]
+
+        # The batch is closed after running
+        mock_hass.services.async_call.reset_mock()
+        await ha_interface.set_cover_position("cover.a", 100, position_and_tilt)
+        mock_hass.services.async_call.assert_called_once_with(Platform.COVER, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: "cover.a"})
+
+    #
+    # test_service_call_batch_failure_raises_for_targeted_covers_only
+    #
+    async def test_service_call_batch_failure_raises_for_targeted_covers_only(
+        self, ha_interface: HomeAssistantInterface, mock_hass: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        """A failing grouped call raises for the covers it targeted; the remaining groups still succeed."""
+
+        mock_hass.services.async_call.side_effect = [HomeAssistantError("gateway busy"), None]
+        features = int(CoverEntityFeature.SET_POSITION)
+        outcomes: dict[str, str] = {}
+
+        async def _move(entity_id: str, position: int) -> None:
+            try:
+                await ha_interface.set_cover_position(entity_id, position, features)
+            except ServiceCallError as err:
+                outcomes[entity_id] = err.error
+            else:
+                outcomes[entity_id] = "moved"
+
+        await ha_interface.async_run_service_call_batch([_move("cover.a", 0), _move("cover.b", 0), _move("cover.c", 100)])
+
+        assert mock_hass.services.async_call.call_count == 2
+        assert outcomes == {"cover.a": "gateway busy", "cover.b": "gateway busy", "cover.c": "moved"}
+        assert "cover.a, cover.b" in mock_logger.error.call_args_list[0][0][0]
+
+    #
+    # test_service_call_batch_ignores_calls_from_other_tasks
+    #
+    async def test_service_call_batch_ignores_calls_from_other_tasks(
+        self, ha_interface: HomeAssistantInterface, mock_hass: MagicMock
+    ) -> None:
+        """Calls from tasks not participating in the batch, e.g. scheduled executions, are issued immediately."""
+
+        features = int(CoverEntityFeature.SET_POSITION)
+        outside_call_issued = asyncio.Event()
+
+        async def _outside() -> None:
+            await ha_interface.set_cover_position("cover.scheduled", 20, features)
+            outside_call_issued.set()
+
+        async def _move() -> None:
+            outside = asyncio.create_task(_outside())
+            await outside_call_issued.wait()
+            await outside
+            await ha_interface.set_cover_position("cover.a", 0, features)
+
+        await ha_interface.async_run_service_call_batch([_move()])
+
+        assert mock_hass.services.async_call.call_args_list == [
+            call(Platform.COVER, SERVICE_SET_COVER_POSITION, {ATTR_ENTITY_ID: "cover.scheduled", ATTR_POSITION: 20}),
+            call(Platform.COVER, SERVICE_SET_COVER_POSITION, {ATTR_ENTITY_ID: "cover.a", ATTR_POSITION: 0}),
+        ]
+
+
+class TestGetCoverCommandGroup:
+    """Test resolution of the command group sharing one rate limit."""
+
+    def test_groups_by_scope(self, ha_interface: HomeAssistantInterface) -> None:
+        """Covers are grouped per config entry, device or integration."""
+
+        registry_entry = MagicMock(device_id="dev1", platform="zha")
+        with patch("custom_components.smart_cover_automation.ha_interface.ha_entity_registry.async_get") as mock_registry:
+            mock_registry.return_value.async_get.side_effect = lambda entity_id: registry_entry if entity_id == "cover.known" else None
+
+            assert ha_interface.get_cover_command_group("cover.known", const.CoverCommandGroupScope.ENTRY) == "entry"
+            assert ha_interface.get_cover_command_group("cover.known", const.CoverCommandGroupScope.DEVICE) == "device:dev1"
+            assert ha_interface.get_cover_command_group("cover.known", const.CoverCommandGroupScope.INTEGRATION) == "integration:zha"
+            assert ha_interface.get_cover_command_group("cover.unknown", const.CoverCommandGroupScope.INTEGRATION) == "cover.unknown"
+
+            registry_entry.device_id = None
+            assert ha_interface.get_cover_command_group("cover.known", const.CoverCommandGroupScope.DEVICE) == "cover.known"
+
 
 class TestSetCoverTiltPosition:
     """Test set_cover_tilt_position method."""
@@ -1266,22 +1369,19 @@ class TestForecastConditionHelpers:
 
         assert result == (150.0, 33.0)
 
-    @patch("custom_components.smart_cover_automation.ha_interface.astral_elevation")
-    @patch("custom_components.smart_cover_automation.ha_interface.astral_azimuth")
+    @patch("custom_components.smart_cover_automation.ha_interface.astral_zenith_and_azimuth")
     @patch("custom_components.smart_cover_automation.ha_interface.get_astral_observer")
     def test_get_solar_position_for_datetime_prefers_observer_helper(
         self,
         mock_get_astral_observer: MagicMock,
-        mock_astral_azimuth: MagicMock,
-        mock_astral_elevation: MagicMock,
+        mock_astral_zenith_and_azimuth: MagicMock,
         ha_interface: HomeAssistantInterface,
     ) -> None:
         """Newer Home Assistant versions should use the observer-based helper."""
 
         observer = MagicMock()
         mock_get_astral_observer.return_value = observer
-        mock_astral_azimuth.return_value = 150.0
-        mock_astral_elevation.return_value = 33.0
+        mock_astral_zenith_and_azimuth.return_value = (57.0, 150.0)
         target_datetime = datetime(2026, 5, 24, 6, 0, tzinfo=timezone.utc)
 
         result = ha_interface_module._get_solar_position_for_datetime(ha_interface.hass, target_datetime)
@@ -1289,32 +1389,34 @@ class TestForecastConditionHelpers:
         assert result == (150.0, 33.0)
         mock_get_astral_observer.assert_called_once_with(ha_interface.hass)
 
-    @patch("custom_components.smart_cover_automation.ha_interface.get_astral_event_date")
-    @patch.object(HomeAssistantInterface, "get_sun_data_for_datetime")
+    @patch("custom_components.smart_cover_automation.ha_interface.get_sun_event_for_date")
+    @patch("custom_components.smart_cover_automation.ha_interface._get_solar_positions_for_datetimes")
     def test_get_sun_samples_from_sunrise_until(
         self,
-        mock_get_sun_data_for_datetime: MagicMock,
+        mock_get_solar_positions: MagicMock,
         mock_get_astral_event_date: MagicMock,
         ha_interface: HomeAssistantInterface,
     ) -> None:
         """Pre-close sun sampling should cover sunrise through the blocked-time end."""
 
-        mock_get_astral_event_date.return_value = datetime(2026, 5, 24, 6, 0, tzinfo=timezone.utc)
-        mock_get_sun_data_for_datetime.side_effect = [
-            (100.0, 5.0),
-            (130.0, 20.0),
-            (150.0, 33.0),
-        ]
+        sunrise = datetime(2026, 5, 24, 6, 0, tzinfo=timezone.utc)
+        target = datetime(2026, 5, 24, 6, 30, tzinfo=timezone.utc)
+        mock_get_astral_event_date.return_value = sunrise
+        mock_get_solar_positions.return_value = ((100.0, 5.0), (130.0, 20.0), (150.0, 33.0))
 
-        result = ha_interface.get_sun_samples_from_sunrise_until(datetime(2026, 5, 24, 6, 30, tzinfo=timezone.utc))
+        result = ha_interface.get_sun_samples_from_sunrise_until(target)
 
         assert result == ((100.0, 5.0), (130.0, 20.0), (150.0, 33.0))
+        mock_get_solar_positions.assert_called_once_with(
+            ha_interface.hass,
+            [sunrise, sunrise + ha_interface_module.PRE_CLOSE_SUN_SAMPLE_INTERVAL, target],
+        )
 
-    @patch("custom_components.smart_cover_automation.ha_interface.get_astral_event_date")
-    @patch.object(HomeAssistantInterface, "get_sun_data_for_datetime")
+    @patch("custom_components.smart_cover_automation.ha_interface.get_sun_event_for_date")
+    @patch("custom_components.smart_cover_automation.ha_interface._get_solar_positions_for_datetimes")
     def test_get_sun_samples_from_sunrise_until_uses_target_when_sunrise_is_unavailable(
         self,
-        mock_get_sun_data_for_datetime: MagicMock,
+        mock_get_solar_positions: MagicMock,
         mock_get_astral_event_date: MagicMock,
         ha_interface: HomeAssistantInterface,
     ) -> None:
@@ -1322,12 +1424,53 @@ class TestForecastConditionHelpers:
 
         target = datetime(2026, 5, 24, 6, 30, tzinfo=timezone.utc)
         mock_get_astral_event_date.return_value = None
-        mock_get_sun_data_for_datetime.return_value = (150.0, 33.0)
+        mock_get_solar_positions.return_value = ((150.0, 33.0),)
 
         result = ha_interface.get_sun_samples_from_sunrise_until(target)
 
         assert result == ((150.0, 33.0),)
-        mock_get_sun_data_for_datetime.assert_called_once_with(target)
+        mock_get_solar_positions.assert_called_once_with(ha_interface.hass, [target])
+
+    @patch("custom_components.smart_cover_automation.ha_interface.get_sun_event_for_date")
+    @patch("custom_components.smart_cover_automation.ha_interface._get_solar_positions_for_datetimes")
+    def test_get_sun_samples_from_sunrise_until_is_cached_per_date(
+        self,
+        mock_get_solar_positions: MagicMock,
+        mock_get_astral_event_date: MagicMock,
+        ha_interface: HomeAssistantInterface,
+    ) -> None:
+        """Repeated sampling for the same target reuses the series; a new date evicts older ones."""
+
+        target = datetime(2026, 5, 24, 6, 30, tzinfo=timezone.utc)
+        next_target = target + timedelta(days=1)
+        mock_get_astral_event_date.return_value = None
+        mock_get_solar_positions.return_value = ((150.0, 33.0),)
+
+        first = ha_interface.get_sun_samples_from_sunrise_until(target)
+        second = ha_interface.get_sun_samples_from_sunrise_until(target)
+        ha_interface.get_sun_samples_from_sunrise_until(next_target)
+
+        assert first is second
+        assert mock_get_solar_positions.call_count == 2
+        assert len(ha_interface._sun_samples_cache) == 1
+
+    @patch("custom_components.smart_cover_automation.ha_interface.astral_zenith_and_azimuth")
+    @patch("custom_components.smart_cover_automation.ha_interface.get_astral_observer")
+    def test_get_solar_positions_for_datetimes_resolves_observer_once(
+        self,
+        mock_get_astral_observer: MagicMock,
+        mock_astral_zenith_and_azimuth: MagicMock,
+        ha_interface: HomeAssistantInterface,
+    ) -> None:
+        """Batched solar positions should resolve the observer once for the whole series."""
+
+        mock_astral_zenith_and_azimuth.side_effect = [(80.0, 100.0), (60.0, 130.0)]
+        start = datetime(2026, 5, 24, 6, 0, tzinfo=timezone.utc)
+
+        result = ha_interface_module._get_solar_positions_for_datetimes(ha_interface.hass, [start, start + timedelta(minutes=15)])
+
+        assert result == ((100.0, 10.0), (130.0, 30.0))
+        mock_get_astral_observer.assert_called_once_with(ha_interface.hass)
 
     async def test_get_daily_temperature_extrema_for_date_raises_when_entity_missing(
         self,
@@ -1607,6 +1750,50 @@ class TestForecastConditionHelpers:
             f"Weather forecast service response for {MOCK_WEATHER_ENTITY_ID} (next-morning pre-close forecast for 2026-05-24): {response}"
         )
 
+    async def test_get_forecast_list_uses_shared_cache(
+        self,
+        ha_interface: HomeAssistantInterface,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Cached forecasts are reused until the weather entity's state is updated."""
+
+        response = {MOCK_WEATHER_ENTITY_ID: {"forecast": [{"datetime": "2026-05-24T00:00:00+00:00", "condition": "sunny"}]}}
+        mock_hass.services.async_call = AsyncMock(return_value=response)
+        weather_state = MagicMock(last_updated=datetime(2026, 5, 24, 6, 0, tzinfo=timezone.utc))
+        mock_hass.states.get = MagicMock(return_value=weather_state)
+        ha_interface._forecast_cache = ForecastCache()
+
+        first = await ha_interface._get_forecast_list(MOCK_WEATHER_ENTITY_ID)
+        second = await ha_interface._get_forecast_list(MOCK_WEATHER_ENTITY_ID)
+
+        assert first == second == response[MOCK_WEATHER_ENTITY_ID]["forecast"]
+        assert mock_hass.services.async_call.await_count == 1
+
+        weather_state.last_updated = datetime(2026, 5, 24, 7, 0, tzinfo=timezone.utc)
+        await ha_interface._get_forecast_list(MOCK_WEATHER_ENTITY_ID)
+
+        assert mock_hass.services.async_call.await_count == 2
+
+    async def test_get_forecast_list_refetches_after_cache_ttl(
+        self,
+        ha_interface: HomeAssistantInterface,
+        mock_hass: MagicMock,
+    ) -> None:
+        """Cached forecasts are fetched again once they are older than the cache TTL."""
+
+        response = {MOCK_WEATHER_ENTITY_ID: {"forecast": [{"datetime": "2026-05-24T00:00:00+00:00", "condition": "sunny"}]}}
+        mock_hass.services.async_call = AsyncMock(return_value=response)
+        mock_hass.states.get = MagicMock(return_value=MagicMock(last_updated=datetime(2026, 5, 24, 6, 0, tzinfo=timezone.utc)))
+        ha_interface._forecast_cache = ForecastCache()
+        now = datetime(2026, 5, 24, 7, 0, tzinfo=timezone.utc)
+
+        with patch("custom_components.smart_cover_automation.forecast_cache.dt_util.utcnow", return_value=now) as mock_now:
+            await ha_interface._get_forecast_list(MOCK_WEATHER_ENTITY_ID)
+            mock_now.return_value = now + const.WEATHER_FORECAST_CACHE_TTL
+            await ha_interface._get_forecast_list(MOCK_WEATHER_ENTITY_ID)
+
+        assert mock_hass.services.async_call.await_count == 2
+
     def test_find_day_forecast_for_date_returns_requested_entry(self, ha_interface: HomeAssistantInterface) -> None:
         """Explicit-date lookup should return the matching forecast entry."""
 
@@ -1912,13 +2099,8 @@ class TestAddLogbookEntry:
             patch("custom_components.smart_cover_automation.ha_interface.async_log_entry") as mock_log_entry,
         ):
             # Mock entity registry
-            mock_entity = MagicMock()
-            mock_entity.unique_id = TEST_UNIQUE_ID
-            mock_entity.entity_id = "binary_sensor.smart_cover_status"
-            mock_entity.platform = const.DOMAIN
-
             mock_reg = MagicMock()
-            mock_reg.entities.values.return_value = [mock_entity]
+            mock_reg.async_get_entity_id.return_value = "binary_sensor.smart_cover_status"
             mock_registry.return_value = mock_reg
 
             # Mock translations
@@ -1930,13 +2112,73 @@ class TestAddLogbookEntry:
 
             await ha_interface.add_logbook_entry("opening", MOCK_COVER_ENTITY_ID, "sun_hitting", 50)
 
+            # Verify the status sensor was resolved through the registry's unique_id index
+            mock_reg.async_get_entity_id.assert_called_once_with(Platform.BINARY_SENSOR, const.DOMAIN, TEST_UNIQUE_ID)
+
             # Verify log entry was called
             mock_log_entry.assert_called_once()
             call_args = mock_log_entry.call_args
+            assert call_args.kwargs["entity_id"] == "binary_sensor.smart_cover_status"
             assert call_args.kwargs["domain"] == const.DOMAIN
             assert call_args.kwargs["name"] == const.INTEGRATION_NAME
             assert MOCK_COVER_ENTITY_ID in call_args.kwargs["message"]
 
+    #
+    # test_add_logbook_entry_caches_translations_per_language
+    #
+    async def test_add_logbook_entry_caches_translations_per_language(
+        self, ha_interface: HomeAssistantInterface, mock_hass: MagicMock
+    ) -> None:
+        """Translations are loaded once per language and reloaded after a language change."""
+
+        base_key = f"component.{const.DOMAIN}.{const.TRANSL_KEY_SERVICES}.{const.SERVICE_LOGBOOK_ENTRY}.{const.TRANSL_KEY_FIELDS}"
+        with (
+            patch("custom_components.smart_cover_automation.ha_interface.ha_entity_registry.async_get") as mock_registry,
+            patch("custom_components.smart_cover_automation.ha_interface.translation.async_get_translations") as mock_translations,
+            patch("custom_components.smart_cover_automation.ha_interface.async_log_entry") as mock_log_entry,
+        ):
+            mock_registry.return_value.async_get_entity_id.return_value = "binary_sensor.smart_cover_status"
+            mock_translations.return_value = {
+                f"{base_key}.opening.{const.TRANSL_ATTR_NAME}": "Opening",
+                f"{base_key}.sun_hitting.{const.TRANSL_ATTR_NAME}": "sun hitting",
+                f"{base_key}.{const.TRANSL_LOGBOOK_TEMPLATE_COVER_MOVEMENT}.{const.TRANSL_ATTR_NAME}": "{verb} {entity_id}: {reason}",
+            }
+
+            await ha_interface.add_logbook_entry("opening", MOCK_COVER_ENTITY_ID, "sun_hitting", 50)
+            await ha_interface.add_logbook_entry("opening", "cover.other", "sun_hitting", 20)
+
+            assert mock_translations.await_count == 1
+            assert mock_log_entry.call_args.kwargs["message"] == "Opening cover.other: sun hitting"
+
+            mock_hass.config.language = "de"
+            await ha_interface.add_logbook_entry("opening", MOCK_COVER_ENTITY_ID, "sun_hitting", 50)
+
+            assert mock_translations.await_count == 2
+            assert mock_translations.await_args.args[1] == "de"
+
+    #
+    # test_logbook_batch_combines_identical_movements
+    #
+    async def test_logbook_batch_combines_identical_movements(self, ha_interface: HomeAssistantInterface) -> None:
+        """Batched entries are written once per verb, reason and position when the batch is flushed."""
+
+        with patch.object(ha_interface, "_async_write_logbook_entry", new=AsyncMock()) as mock_write:
+            ha_interface.begin_logbook_batch()
+            await ha_interface.add_logbook_entry("verb_closing", "cover.a", "reason_heat_protection", 0)
+            await ha_interface.add_logbook_entry("verb_closing", "cover.b", "reason_heat_protection", 0)
+            await ha_interface.add_logbook_entry("verb_opening", "cover.c", "reason_let_light_in", 100)
+
+            mock_write.assert_not_awaited()
+
+            await ha_interface.async_flush_logbook_batch()
+            await ha_interface.add_logbook_entry("verb_opening", "cover.d", "reason_let_light_in", 100)
+
+        assert [call.args for call in mock_write.await_args_list] == [
+            ("verb_closing", "cover.a, cover.b", "reason_heat_protection", 0),
+            ("verb_opening", "cover.c", "reason_let_light_in", 100),
+            ("verb_opening", "cover.d", "reason_let_light_in", 100),
+        ]
+
     #
     # test_add_logbook_entry_entity_not_found
     #
@@ -1946,7 +2188,7 @@ class TestAddLogbookEntry:
         with patch("custom_components.smart_cover_automation.ha_interface.ha_entity_registry.async_get") as mock_registry:
             # Mock empty entity registry
             mock_reg = MagicMock()
-            mock_reg.entities.values.return_value = []
+            mock_reg.async_get_entity_id.return_value = None
             mock_registry.return_value = mock_reg
 
             # Should not raise exception, just log warning
@@ -1964,13 +2206,8 @@ class TestAddLogbookEntry:
             patch("custom_components.smart_cover_automation.ha_interface.async_log_entry") as mock_log_entry,
         ):
             # Mock entity registry
-            mock_entity = MagicMock()
-            mock_entity.unique_id = TEST_UNIQUE_ID
-            mock_entity.entity_id = "binary_sensor.smart_cover_status"
-            mock_entity.platform = const.DOMAIN
-
             mock_reg = MagicMock()
-            mock_reg.entities.values.return_value = [mock_entity]
+            mock_reg.async_get_entity_id.return_value = "binary_sensor.smart_cover_status"
             mock_registry.return_value = mock_reg
 
             # Mock incomplete translations
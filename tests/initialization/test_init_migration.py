@@ -15,7 +15,7 @@ Key testing areas include:
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.cover import CoverEntityFeature
@@ -24,6 +24,7 @@ from custom_components.smart_cover_automation import (
     _async_migrate_temperature_threshold_keys,
     _async_migrate_unique_ids,
     _async_remove_stale_registry_entities,
+    _async_run_startup_migrations,
     _get_entry_options_dict,
     _get_valid_external_blocked_time_range_keys,
     _get_valid_external_evening_closure_keys,
@@ -1327,6 +1328,77 @@ class TestAsyncRemoveStaleRegistryEntities:
         assert "Failed to remove stale entity-registry entry" in caplog.text
 
 
+class TestAsyncRunStartupMigrations:
+    """Test that startup migrations are skipped once recorded as complete."""
+
+    @staticmethod
+    def _make_entry() -> MagicMock:
+        """Create a config entry with one cover."""
+
+        entry = MagicMock()
+        entry.entry_id = "test_entry_id"
+        entry.options = {ConfKeys.COVERS.value: ["cover.one"]}
+        return entry
+
+    async def test_runs_all_migrations_and_records_them_without_record(self) -> None:
+        """Without a migration record, all migrations and the sweep should run and be recorded."""
+
+        hass = MagicMock()
+        entry = self._make_entry()
+        coordinator = MagicMock()
+        coordinator.startup_migrations = {}
+
+        with (
+            patch("custom_components.smart_cover_automation._async_migrate_temperature_threshold_keys", new=AsyncMock()) as mock_threshold,
+            patch("custom_components.smart_cover_automation._async_migrate_unique_ids", new=AsyncMock()) as mock_unique_ids,
+            patch("custom_components.smart_cover_automation._async_remove_stale_registry_entities", new=AsyncMock()) as mock_sweep,
+        ):
+            await _async_run_startup_migrations(hass, entry, coordinator, "1.0.0")
+
+        mock_threshold.assert_awaited_once_with(hass, entry)
+        mock_unique_ids.assert_awaited_once_with(hass, entry)
+        mock_sweep.assert_awaited_once_with(hass, entry)
+        record = coordinator.set_startup_migrations.call_args.args[0]
+        assert record[const.STARTUP_MIGRATIONS_KEY_VERSION] == const.STARTUP_MIGRATIONS_VERSION
+        assert const.STARTUP_MIGRATIONS_KEY_STALE_ENTITY_FINGERPRINT in record
+
+    async def test_skips_completed_migrations_until_covers_or_version_change(self) -> None:
+        """A matching record should skip everything; a changed cover list or version should only rerun the sweep."""
+
+        hass = MagicMock()
+        entry = self._make_entry()
+        coordinator = MagicMock()
+        coordinator.startup_migrations = {}
+
+        with (
+            patch("custom_components.smart_cover_automation._async_migrate_temperature_threshold_keys", new=AsyncMock()),
+            patch("custom_components.smart_cover_automation._async_migrate_unique_ids", new=AsyncMock()),
+            patch("custom_components.smart_cover_automation._async_remove_stale_registry_entities", new=AsyncMock()),
+        ):
+            await _async_run_startup_migrations(hass, entry, coordinator, "1.0.0")
+        coordinator.startup_migrations = coordinator.set_startup_migrations.call_args.args[0]
+        coordinator.set_startup_migrations.reset_mock()
+
+        with (
+            patch("custom_components.smart_cover_automation._async_migrate_temperature_threshold_keys", new=AsyncMock()) as mock_threshold,
+            patch("custom_components.smart_cover_automation._async_migrate_unique_ids", new=AsyncMock()) as mock_unique_ids,
+            patch("custom_components.smart_cover_automation._async_remove_stale_registry_entities", new=AsyncMock()) as mock_sweep,
+        ):
+            await _async_run_startup_migrations(hass, entry, coordinator, "1.0.0")
+
+            mock_threshold.assert_not_awaited()
+            mock_unique_ids.assert_not_awaited()
+            mock_sweep.assert_not_awaited()
+            coordinator.set_startup_migrations.assert_not_called()
+
+            entry.options = {ConfKeys.COVERS.value: ["cover.one", "cover.two"]}
+            await _async_run_startup_migrations(hass, entry, coordinator, "1.0.0")
+            await _async_run_startup_migrations(hass, entry, coordinator, "1.1.0")
+
+            mock_unique_ids.assert_not_awaited()
+            assert mock_sweep.await_count == 2
+
+
 class TestInitHelperFunctions:
     """Test small helper functions in __init__.py that drive cleanup behavior."""
 
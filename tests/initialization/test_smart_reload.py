@@ -434,3 +434,27 @@ class TestSmartReload:
 
         # Verify full reload WAS called
         mock_hass_with_spec.config_entries.async_reload.assert_called_once_with(mock_config_entry_basic.entry_id)
+
+    async def test_reload_turning_off_shared_storage_moves_state_first(
+        self,
+        mock_hass_with_spec,
+        mock_config_entry_basic,
+    ) -> None:
+        """Test that turning off shared state storage moves the state into the entry's own file before the reload."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._merged_config = {"shared_state_storage": True, "covers": ["cover.test"]}
+        mock_coordinator.async_move_runtime_state_to_entry_file = AsyncMock()
+
+        mock_runtime_data = MagicMock(spec=RuntimeData)
+        mock_runtime_data.coordinator = mock_coordinator
+        mock_config_entry_basic.runtime_data = mock_runtime_data
+        mock_config_entry_basic.data = {}
+        mock_config_entry_basic.options = {"shared_state_storage": False, "covers": ["cover.test"]}
+
+        mock_hass_with_spec.config_entries = MagicMock()
+        mock_hass_with_spec.config_entries.async_reload = AsyncMock()
+
+        await async_reload_entry(mock_hass_with_spec, cast(IntegrationConfigEntry, mock_config_entry_basic))
+
+        mock_coordinator.async_move_runtime_state_to_entry_file.assert_awaited_once()
+        mock_hass_with_spec.config_entries.async_reload.assert_called_once_with(mock_config_entry_basic.entry_id)
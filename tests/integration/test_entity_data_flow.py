@@ -916,7 +916,7 @@ class TestTimeEntityDataFlow:
         self,
         hass: HomeAssistant,
     ) -> None:
-        """Setting the external morning-opening time entity should update options and entity state."""
+        """Setting the external morning-opening time entity should update the runtime settings and entity state."""
 
         entry = _create_config_entry(
             hass,
@@ -935,7 +935,8 @@ class TestTimeEntityDataFlow:
         )
         await hass.async_block_till_done()
 
-        assert entry.options[TIME_KEY_MORNING_OPENING_EXTERNAL_TIME] == "07:45:00"
+        assert TIME_KEY_MORNING_OPENING_EXTERNAL_TIME not in entry.options
+        assert entry.runtime_data.coordinator.effective_options[TIME_KEY_MORNING_OPENING_EXTERNAL_TIME] == "07:45:00"
 
         state = hass.states.get(entity_id)
         assert state is not None
@@ -977,7 +978,8 @@ class TestTimeEntityDataFlow:
             )
             await hass.async_block_till_done()
 
-            assert entry.options[TIME_KEY_MORNING_OPENING_EXTERNAL_TIME] == "08:10:00"
+            assert TIME_KEY_MORNING_OPENING_EXTERNAL_TIME not in entry.options
+            assert entry.runtime_data.coordinator.effective_options[TIME_KEY_MORNING_OPENING_EXTERNAL_TIME] == "08:10:00"
 
             assert await hass.config_entries.async_reload(entry.entry_id)
             await hass.async_block_till_done()
@@ -995,7 +997,7 @@ class TestTimeEntityDataFlow:
         self,
         hass: HomeAssistant,
     ) -> None:
-        """Setting the external evening-closure time entity should update options and entity state."""
+        """Setting the external evening-closure time entity should update the runtime settings and entity state."""
 
         entry = _create_config_entry(
             hass,
@@ -1014,7 +1016,8 @@ class TestTimeEntityDataFlow:
         )
         await hass.async_block_till_done()
 
-        assert entry.options[TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME] == "18:35:00"
+        assert TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME not in entry.options
+        assert entry.runtime_data.coordinator.effective_options[TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME] == "18:35:00"
 
         state = hass.states.get(entity_id)
         assert state is not None
@@ -1049,7 +1052,8 @@ class TestTimeEntityDataFlow:
             )
             await hass.async_block_till_done()
 
-            assert entry.options[TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME] == "18:50:00"
+            assert TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME not in entry.options
+            assert entry.runtime_data.coordinator.effective_options[TIME_KEY_EVENING_CLOSURE_EXTERNAL_TIME] == "18:50:00"
 
             assert await hass.config_entries.async_reload(entry.entry_id)
             await hass.async_block_till_done()
@@ -1104,7 +1108,7 @@ class TestMorningOpeningIntegrationFlow:
         )
 
         with patch(
-            "custom_components.smart_cover_automation.automation_engine.get_astral_event_date",
+            "custom_components.smart_cover_automation.automation_engine.get_sun_event_for_date",
             side_effect=_astral_event,
         ):
             await _setup_integration(hass, entry)
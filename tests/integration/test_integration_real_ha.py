@@ -727,7 +727,7 @@ class TestIntegrationRealHA:
         )
         await hass.async_block_till_done()
 
-        assert entry.options[per_cover_unique_key] == stored_value
+        assert entry.runtime_data.coordinator.effective_options[per_cover_unique_key] == stored_value
 
         delete_result = await _run_options_flow(
             hass,
@@ -747,4 +747,5 @@ class TestIntegrationRealHA:
         assert delete_result["type"] is FlowResultType.CREATE_ENTRY
         assert entry.options[per_cover_mode_key] == TiltMode.AUTO
         assert per_cover_unique_key not in entry.options
+        assert per_cover_unique_key not in entry.runtime_data.coordinator.runtime_setting_keys
         assert _get_registry_entry_by_unique_id(hass, entry, per_cover_unique_key) is None
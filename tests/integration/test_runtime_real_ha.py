@@ -39,6 +39,7 @@ from custom_components.smart_cover_automation.const import (
     HA_SUN_ATTR_AZIMUTH,
     HA_SUN_ATTR_ELEVATION,
     HA_SUN_ENTITY_ID,
+    STATE_CHANGE_REFRESH_COOLDOWN_SECONDS,
     UPDATE_INTERVAL,
     LockMode,
     ReopeningMode,
@@ -909,11 +910,6 @@ class TestRuntimeBehavior:
 
             cover_calls.append(call)
 
-        async def _immediate_sleep(delay: float) -> None:
-            """Fast-forward queued staggered tasks once the test releases them."""
-
-            return None
-
         hass.services.async_register("cover", "set_cover_position", _record_set_cover_position)
 
         entry = _create_config_entry(
@@ -948,40 +944,38 @@ class TestRuntimeBehavior:
         _setup_cover_entity(hass, TEST_COVER_2, position=COVER_POS_FULLY_CLOSED)
 
         scheduled = pending[TEST_COVER_2]
-        scheduled.task.cancel()
-        with patch("custom_components.smart_cover_automation.automation_engine.asyncio.sleep", side_effect=_immediate_sleep):
-            await coordinator._automation_engine._run_pending_cover_execution(
-                TEST_COVER_2,
-                scheduled.schedule_id,
-                CoverAutomation(
-                    entity_id=TEST_COVER_2,
-                    resolved=coordinator._automation_engine.resolved,
-                    config=coordinator._automation_engine.config,
-                    cover_pos_history_mgr=coordinator._automation_engine._cover_pos_history_mgr,
-                    ha_interface=coordinator._automation_engine._ha_interface,
-                    logger=coordinator._automation_engine._logger,
-                ),
-                CoverExecutionPlan(
-                    cover_state=coordinator.data.covers[TEST_COVER_2],
-                    sensor_data=SensorData(
-                        sun_azimuth=coordinator.data.sun_azimuth or SUN_DIRECT_AZIMUTH,
-                        sun_elevation=coordinator.data.sun_elevation or SUN_HIGH_ELEVATION,
-                        temp_max=coordinator.data.temp_current_max,
-                        temp_min=coordinator.data.temp_current_min,
-                        temp_hot=coordinator.data.temp_hot,
-                        weather_condition="sunny",
-                        weather_sunny=coordinator.data.weather_sunny,
-                        evening_closure=False,
-                        post_evening_closure=False,
-                    ),
-                    features=COVER_FEATURES_SET_POSITION,
-                    current_pos=COVER_POS_FULLY_OPEN,
-                    desired_pos=COVER_POS_FULLY_CLOSED,
-                    movement_reason=CoverMovementReason.CLOSING_HEAT_PROTECTION,
-                    planned_tilt_target=None,
+        coordinator._automation_engine._command_scheduler.cancel(TEST_COVER_2)
+        await coordinator._automation_engine._run_pending_cover_execution(
+            TEST_COVER_2,
+            scheduled.schedule_id,
+            CoverAutomation(
+                entity_id=TEST_COVER_2,
+                resolved=coordinator._automation_engine.resolved,
+                config=coordinator._automation_engine.config,
+                cover_pos_history_mgr=coordinator._automation_engine._cover_pos_history_mgr,
+                ha_interface=coordinator._automation_engine._ha_interface,
+                logger=coordinator._automation_engine._logger,
+            ),
+            CoverExecutionPlan(
+                cover_state=coordinator.data.covers[TEST_COVER_2],
+                sensor_data=SensorData(
+                    sun_azimuth=coordinator.data.sun_azimuth or SUN_DIRECT_AZIMUTH,
+                    sun_elevation=coordinator.data.sun_elevation or SUN_HIGH_ELEVATION,
+                    temp_max=coordinator.data.temp_current_max,
+                    temp_min=coordinator.data.temp_current_min,
+                    temp_hot=coordinator.data.temp_hot,
+                    weather_condition="sunny",
+                    weather_sunny=coordinator.data.weather_sunny,
+                    evening_closure=False,
+                    post_evening_closure=False,
                 ),
-                0,
-            )
+                features=COVER_FEATURES_SET_POSITION,
+                current_pos=COVER_POS_FULLY_OPEN,
+                desired_pos=COVER_POS_FULLY_CLOSED,
+                movement_reason=CoverMovementReason.CLOSING_HEAT_PROTECTION,
+                planned_tilt_target=None,
+            ),
+        )
 
         assert [call.data["entity_id"] for call in cover_calls] == [TEST_COVER_1]
 
@@ -1355,3 +1349,68 @@ class TestRuntimeEdgeCases:
         # (the automation logic runs, it just doesn't send commands).
         # Verify the cover was at least evaluated by the automation.
         assert cover_data.sun_hitting is not None, "Automation should have evaluated sun_hitting even in simulation mode"
+
+
+class TestStateChangeTracking:
+    """Tests for refreshes triggered by state changes of the automation's input entities."""
+
+    #
+    # test_sun_state_change_triggers_debounced_refresh
+    #
+    async def test_sun_state_change_triggers_debounced_refresh(self, hass: HomeAssistant) -> None:
+        """A burst of sun updates is coalesced into a single automation run."""
+
+        entry = _create_config_entry(hass)
+        await _setup_integration(hass, entry, temp_max=COMFORTABLE_TEMP)
+        coordinator = _get_coordinator(hass, entry)
+        engine = coordinator._automation_engine
+
+        with (
+            patch.object(engine, "run", new=AsyncMock(wraps=engine.run)) as mock_run,
+            patch(
+                "custom_components.smart_cover_automation.ha_interface.HomeAssistantInterface.get_daily_temperature_extrema",
+                new_callable=AsyncMock,
+                return_value=(COMFORTABLE_TEMP, 18.0),
+            ),
+        ):
+            _setup_sun_entity(hass, elevation=SUN_HIGH_ELEVATION, azimuth=SUN_DIRECT_AZIMUTH + 1)
+            _setup_sun_entity(hass, elevation=SUN_HIGH_ELEVATION, azimuth=SUN_DIRECT_AZIMUTH + 2)
+            await hass.async_block_till_done()
+            assert mock_run.await_count == 0
+
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=STATE_CHANGE_REFRESH_COOLDOWN_SECONDS + 1))
+            await hass.async_block_till_done()
+
+        assert mock_run.await_count == 1
+
+    #
+    # test_moving_cover_does_not_trigger_refresh
+    #
+    async def test_moving_cover_does_not_trigger_refresh(self, hass: HomeAssistant) -> None:
+        """Intermediate states of a cover in motion are ignored until it settles."""
+
+        entry = _create_config_entry(hass)
+        await _setup_integration(hass, entry, temp_max=COMFORTABLE_TEMP)
+        coordinator = _get_coordinator(hass, entry)
+        engine = coordinator._automation_engine
+
+        with (
+            patch.object(engine, "run", new=AsyncMock(wraps=engine.run)) as mock_run,
+            patch(
+                "custom_components.smart_cover_automation.ha_interface.HomeAssistantInterface.get_daily_temperature_extrema",
+                new_callable=AsyncMock,
+                return_value=(COMFORTABLE_TEMP, 18.0),
+            ),
+        ):
+            hass.states.async_set(TEST_COVER_1, "closing", {"current_position": 60, ATTR_SUPPORTED_FEATURES: COVER_FEATURES_SET_POSITION})
+            await hass.async_block_till_done()
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=STATE_CHANGE_REFRESH_COOLDOWN_SECONDS + 1))
+            await hass.async_block_till_done()
+            assert mock_run.await_count == 0
+
+            _setup_cover_entity(hass, TEST_COVER_1, position=50)
+            await hass.async_block_till_done()
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=STATE_CHANGE_REFRESH_COOLDOWN_SECONDS + 1))
+            await hass.async_block_till_done()
+
+        assert mock_run.await_count == 1
@@ -6,13 +6,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from custom_components.smart_cover_automation.automation_state_store import AutomationStateStore
+from custom_components.smart_cover_automation.automation_state_store import (
+    AutomationStateStore,
+    RestoredAutomationState,
+    get_shared_automation_state_store,
+)
 from custom_components.smart_cover_automation.const import (
+    DATA_SHARED_STATE_STORE,
     DOMAIN,
     STORAGE_KEY_AUTOMATION_CLOSED_MARKERS,
     STORAGE_KEY_AUTOMATION_MANAGED_STATES,
     STORAGE_KEY_AUTOMATION_STATE,
     STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA,
+    STORAGE_KEY_RUNTIME_SETTINGS,
+    STORAGE_KEY_STARTUP_MIGRATIONS,
     STORAGE_SAVE_DELAY_SECONDS,
     STORAGE_VERSION,
 )
@@ -184,8 +191,7 @@ class TestAutomationStateStore:
 
         with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
             store = AutomationStateStore(mock_hass, "entry_123")
-
-        assert await store.async_load_current_day_temperature_extrema() is None
+            assert await store.async_load_current_day_temperature_extrema() is None
 
     @pytest.mark.asyncio
     async def test_async_save_current_day_extrema_preserves_existing_closed_markers(self, mock_hass: MagicMock) -> None:
@@ -370,8 +376,7 @@ class TestAutomationStateStore:
 
         with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
             store = AutomationStateStore(mock_hass, "entry_123")
-
-        assert await store.async_load_closed_markers() == expected
+            assert await store.async_load_closed_markers() == expected
 
     @pytest.mark.asyncio
     async def test_load_automation_managed_states_filters_invalid_payloads(self, mock_hass: MagicMock) -> None:
@@ -405,6 +410,125 @@ class TestAutomationStateStore:
             "automation_mode": "evening_closure",
         }
 
+    async def test_load_runtime_state_reads_payload_once(self, mock_hass: MagicMock) -> None:
+        """The bulk load should read the payload once and return all validated sections."""
+
+        self._prepare_hass(mock_hass)
+
+        mock_store = MagicMock()
+        mock_store.async_load = AsyncMock(
+            return_value={
+                STORAGE_KEY_AUTOMATION_MANAGED_STATES: {"cover.kitchen": {"position": 20}, "cover.invalid": "bad"},
+                STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close", "cover.invalid": 1},
+                STORAGE_KEY_CURRENT_DAY_TEMPERATURE_EXTREMA: {"date": "2026-05-26", "temp_max": 29, "temp_min": None},
+                STORAGE_KEY_RUNTIME_SETTINGS: {"cover.kitchen_tilt_external_value_day": 40, "invalid": [1]},
+                STORAGE_KEY_STARTUP_MIGRATIONS: {"version": 1},
+            }
+        )
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
+            store = AutomationStateStore(mock_hass, "entry_123")
+
+        restored = await store.async_load_runtime_state()
+
+        mock_store.async_load.assert_awaited_once()
+        assert restored == RestoredAutomationState(
+            automation_managed_states={"cover.kitchen": {"position": 20}},
+            closed_markers={"cover.kitchen": "evening_close"},
+            current_day_temperature_extrema={"date": "2026-05-26", "temp_max": 29.0, "temp_min": None},
+            runtime_settings={"cover.kitchen_tilt_external_value_day": 40},
+            startup_migrations={"version": 1},
+        )
+
+    def test_schedule_save_runtime_settings_passes_builder_and_delay_to_store(self, mock_hass: MagicMock) -> None:
+        """Runtime settings should be saved through the debounced store write."""
+
+        self._prepare_hass(mock_hass)
+
+        mock_store = MagicMock()
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
+            store = AutomationStateStore(mock_hass, "entry_123")
+
+        settings = {"evening_closure_external_time": "21:30:00"}
+        store.schedule_save_runtime_settings(settings)
+        settings["evening_closure_external_time"] = "22:00:00"
+
+        mock_store.async_delay_save.assert_called_once()
+        payload_builder, delay = mock_store.async_delay_save.call_args.args
+        assert delay == STORAGE_SAVE_DELAY_SECONDS
+        assert payload_builder() == {STORAGE_KEY_RUNTIME_SETTINGS: {"evening_closure_external_time": "21:30:00"}}
+
+    def test_schedule_save_skips_unchanged_content(self, mock_hass: MagicMock) -> None:
+        """Scheduling identical content again should not schedule another write."""
+
+        self._prepare_hass(mock_hass)
+
+        mock_store = MagicMock()
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
+            store = AutomationStateStore(mock_hass, "entry_123")
+
+        store.schedule_save_closed_markers({"cover.kitchen": "evening_close"})
+        store.schedule_save_closed_markers({"cover.kitchen": "evening_close"})
+        store.schedule_save_current_day_temperature_extrema(None)
+
+        mock_store.async_delay_save.assert_called_once()
+
+    def test_schedule_save_managed_state_changes_updates_only_changed_entries(self, mock_hass: MagicMock) -> None:
+        """Per-cover changes should be merged into the cached states and written with one payload build."""
+
+        self._prepare_hass(mock_hass)
+
+        mock_store = MagicMock()
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
+            store = AutomationStateStore(mock_hass, "entry_123")
+
+        store.schedule_save_automation_managed_states(
+            {
+                "cover.kitchen": {"position": 20, "automation_mode": "evening_closure"},
+                "cover.office": {"position": 0, "automation_mode": "heat_protection"},
+            }
+        )
+        store.schedule_save_automation_managed_state_changes({"cover.kitchen": {"position": 0, "automation_mode": "evening_closure"}})
+        store.schedule_save_automation_managed_state_changes({"cover.office": None})
+        store.schedule_save_automation_managed_state_changes({"cover.office": None, "cover.kitchen": {"position": 0, "automation_mode": "evening_closure"}})
+
+        assert mock_store.async_delay_save.call_count == 3
+        payload_builder = mock_store.async_delay_save.call_args.args[0]
+        assert payload_builder() == {
+            STORAGE_KEY_AUTOMATION_MANAGED_STATES: {"cover.kitchen": {"position": 0, "automation_mode": "evening_closure"}},
+        }
+
+    @pytest.mark.asyncio
+    async def test_async_save_runtime_state_writes_once_and_skips_when_unchanged(self, mock_hass: MagicMock) -> None:
+        """The bulk save should write all sections at once and skip the write when nothing changed."""
+
+        self._prepare_hass(mock_hass)
+
+        mock_store = MagicMock()
+        mock_store.async_save = AsyncMock()
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
+            store = AutomationStateStore(mock_hass, "entry_123")
+
+        for _ in range(2):
+            await store.async_save_runtime_state(
+                automation_managed_states={"cover.kitchen": {"position": 0, "automation_mode": "evening_closure"}},
+                closed_markers={"cover.kitchen": "evening_close"},
+                current_day_temperature_extrema=None,
+                runtime_settings={"evening_closure_external_time": "21:30:00"},
+            )
+
+        mock_store.async_save.assert_awaited_once_with(
+            {
+                STORAGE_KEY_AUTOMATION_MANAGED_STATES: {"cover.kitchen": {"position": 0, "automation_mode": "evening_closure"}},
+                STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"},
+                STORAGE_KEY_RUNTIME_SETTINGS: {"evening_closure_external_time": "21:30:00"},
+            }
+        )
+
     def test_schedule_save_automation_managed_states_uses_fallback_snapshot(self) -> None:
         """Fallback mode should store a detached managed-state snapshot."""
 
@@ -486,12 +610,12 @@ class TestAutomationStateStore:
         self._prepare_hass(mock_hass)
 
         mock_store = MagicMock()
+        mock_store.async_load = AsyncMock(return_value=None)
         mock_store.async_remove = AsyncMock()
 
         with patch("custom_components.smart_cover_automation.automation_state_store.Store", return_value=mock_store):
             store = AutomationStateStore(mock_hass, "entry_123")
-
-        await store.async_remove()
+            await store.async_remove()
 
         mock_store.async_remove.assert_awaited_once_with()
 
@@ -554,3 +678,177 @@ class TestAutomationStateStore:
         warning_args = mock_logger.warning.call_args.args
         assert warning_args[0] == f"{expected_message}: %s"
         assert warning_args[1] == side_effect
+
+
+class TestSharedAutomationStateStore:
+    """Test runtime state kept in the storage file shared by all config entries."""
+
+    @staticmethod
+    def _make_stores(mock_hass: MagicMock, files: dict[str, object]) -> dict[str, MagicMock]:
+        """Prepare Home Assistant and return one mock Store per storage key, preloaded with the given file contents."""
+
+        mock_hass.data = {}
+        mock_hass.config = MagicMock()
+
+        stores: dict[str, MagicMock] = {}
+        for key, content in files.items():
+            mock_store = MagicMock()
+            mock_store.async_load = AsyncMock(return_value=content)
+            mock_store.async_save = AsyncMock()
+            mock_store.async_remove = AsyncMock()
+            stores[key] = mock_store
+        return stores
+
+    @staticmethod
+    def _store_factory(stores: dict[str, MagicMock]):
+        """Return a Store replacement that hands out the mock for the requested key."""
+
+        return lambda _hass, _version, key: stores[key]
+
+    async def test_shared_mode_migrates_entry_file_into_shared_file(self, mock_hass: MagicMock) -> None:
+        """The first shared load should move the entry's own file into the shared file and remove it."""
+
+        shared_key = f"{DOMAIN}.{STORAGE_KEY_AUTOMATION_STATE}"
+        entry_key = f"{DOMAIN}.entry_123.{STORAGE_KEY_AUTOMATION_STATE}"
+        stores = self._make_stores(
+            mock_hass,
+            {
+                shared_key: {"other_entry": {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.office": "evening_close"}}},
+                entry_key: {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"}},
+            },
+        )
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", side_effect=self._store_factory(stores)):
+            store = AutomationStateStore(mock_hass, "entry_123", shared=True)
+
+        assert await store.async_load_closed_markers() == {"cover.kitchen": "evening_close"}
+
+        stores[shared_key].async_save.assert_awaited_once_with(
+            {
+                "other_entry": {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.office": "evening_close"}},
+                "entry_123": {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"}},
+            }
+        )
+        stores[entry_key].async_remove.assert_awaited_once()
+
+    async def test_shared_mode_coalesces_entries_into_one_delayed_write(self, mock_hass: MagicMock) -> None:
+        """Changes of several entries should be written with one shared payload."""
+
+        shared_key = f"{DOMAIN}.{STORAGE_KEY_AUTOMATION_STATE}"
+        stores = self._make_stores(
+            mock_hass,
+            {
+                shared_key: None,
+                f"{DOMAIN}.entry_a.{STORAGE_KEY_AUTOMATION_STATE}": None,
+                f"{DOMAIN}.entry_b.{STORAGE_KEY_AUTOMATION_STATE}": None,
+            },
+        )
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", side_effect=self._store_factory(stores)):
+            store_a = AutomationStateStore(mock_hass, "entry_a", shared=True)
+            store_b = AutomationStateStore(mock_hass, "entry_b", shared=True)
+
+        await store_a.async_load_runtime_state()
+        await store_b.async_load_runtime_state()
+        store_a.schedule_save_closed_markers({"cover.kitchen": "evening_close"})
+        store_b.schedule_save_runtime_settings({"evening_closure_external_time": "21:30:00"})
+
+        assert get_shared_automation_state_store(mock_hass) is get_shared_automation_state_store(mock_hass)
+        stores[shared_key].async_load.assert_awaited_once()
+        payload_builder = stores[shared_key].async_delay_save.call_args.args[0]
+        assert payload_builder() == {
+            "entry_a": {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"}},
+            "entry_b": {STORAGE_KEY_RUNTIME_SETTINGS: {"evening_closure_external_time": "21:30:00"}},
+        }
+
+    async def test_entry_mode_never_touches_shared_file(self, mock_hass: MagicMock) -> None:
+        """Without shared storage, loading and removal should only use the entry's own file."""
+
+        entry_key = f"{DOMAIN}.entry_123.{STORAGE_KEY_AUTOMATION_STATE}"
+        stores = self._make_stores(mock_hass, {entry_key: None})
+
+        # The factory has no shared store mock, so creating the shared Store would fail
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", side_effect=self._store_factory(stores)):
+            entry_store = AutomationStateStore(mock_hass, "entry_123")
+            assert await entry_store.async_load_closed_markers() == {}
+            await entry_store.async_remove()
+
+        assert DATA_SHARED_STATE_STORE not in mock_hass.data.get(DOMAIN, {})
+        stores[entry_key].async_remove.assert_awaited_once()
+
+    async def test_move_to_entry_file_migrates_section_out_of_shared_file(self, mock_hass: MagicMock) -> None:
+        """Turning shared storage off should move the entry's section into its own file."""
+
+        shared_key = f"{DOMAIN}.{STORAGE_KEY_AUTOMATION_STATE}"
+        entry_key = f"{DOMAIN}.entry_123.{STORAGE_KEY_AUTOMATION_STATE}"
+        stores = self._make_stores(
+            mock_hass,
+            {
+                shared_key: {"entry_123": {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"}}},
+                entry_key: None,
+            },
+        )
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", side_effect=self._store_factory(stores)):
+            store = AutomationStateStore(mock_hass, "entry_123", shared=True)
+
+        await store.async_load_runtime_state()
+        await store.async_move_to_entry_file()
+        await store.async_save_closed_markers({"cover.office": "evening_close"})
+
+        assert stores[entry_key].async_save.await_args_list[0].args == ({STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"}},)
+        assert stores[entry_key].async_save.await_args_list[1].args == ({STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.office": "evening_close"}},)
+        stores[shared_key].async_save.assert_awaited_once_with({})
+
+    async def test_move_to_entry_file_keeps_shared_section_when_write_fails(self, mock_hass: MagicMock) -> None:
+        """The shared section should only be removed once it was written to the entry's own file."""
+
+        shared_key = f"{DOMAIN}.{STORAGE_KEY_AUTOMATION_STATE}"
+        entry_key = f"{DOMAIN}.entry_123.{STORAGE_KEY_AUTOMATION_STATE}"
+        stores = self._make_stores(
+            mock_hass,
+            {
+                shared_key: {"entry_123": {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"}}},
+                entry_key: None,
+            },
+        )
+        stores[entry_key].async_save.side_effect = OSError("disk full")
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", side_effect=self._store_factory(stores)):
+            store = AutomationStateStore(mock_hass, "entry_123", shared=True)
+
+        await store.async_load_runtime_state()
+        await store.async_move_to_entry_file()
+        store.schedule_save_closed_markers({"cover.office": "evening_close"})
+
+        stores[shared_key].async_save.assert_not_awaited()
+        stores[shared_key].async_delay_save.assert_called_once()
+
+    async def test_failed_shared_load_never_overwrites_shared_file(self, mock_hass: MagicMock) -> None:
+        """After a failed load, the shared file is read-only and the entry keeps using its own file."""
+
+        shared_key = f"{DOMAIN}.{STORAGE_KEY_AUTOMATION_STATE}"
+        entry_key = f"{DOMAIN}.entry_123.{STORAGE_KEY_AUTOMATION_STATE}"
+        stores = self._make_stores(
+            mock_hass,
+            {
+                shared_key: None,
+                entry_key: {STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.kitchen": "evening_close"}},
+            },
+        )
+        stores[shared_key].async_load.side_effect = ValueError("corrupt file")
+
+        with patch("custom_components.smart_cover_automation.automation_state_store.Store", side_effect=self._store_factory(stores)):
+            store = AutomationStateStore(mock_hass, "entry_123", shared=True)
+
+        assert await store.async_load_closed_markers() == {"cover.kitchen": "evening_close"}
+        store.schedule_save_closed_markers({"cover.office": "evening_close"})
+        await store.async_save_closed_markers({"cover.office": "heat_protection"})
+
+        shared_store = get_shared_automation_state_store(mock_hass)
+        assert shared_store.read_only
+        stores[shared_key].async_save.assert_not_awaited()
+        stores[shared_key].async_delay_save.assert_not_called()
+        stores[entry_key].async_remove.assert_not_awaited()
+        stores[entry_key].async_delay_save.assert_called_once()
+        stores[entry_key].async_save.assert_awaited_once_with({STORAGE_KEY_AUTOMATION_CLOSED_MARKERS: {"cover.office": "heat_protection"}})
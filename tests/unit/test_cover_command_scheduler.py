@@ -0,0 +1,190 @@
+"""Tests for the rate-limited cover command scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.smart_cover_automation.config import ConfKeys, resolve
+from custom_components.smart_cover_automation.cover_command_scheduler import (
+    CoverCommandPriority,
+    CoverCommandScheduler,
+    _ScheduledCommand,
+)
+
+
+def _make_scheduler(rate_limit: int = 0, burst: int = 1) -> CoverCommandScheduler:
+    """Create a scheduler with the given rate limit settings."""
+
+    resolved = resolve(
+        {
+            ConfKeys.COVER_MOVEMENT_RATE_LIMIT.value: rate_limit,
+            ConfKeys.COVER_MOVEMENT_RATE_LIMIT_BURST.value: burst,
+        }
+    )
+    return CoverCommandScheduler(lambda: resolved, MagicMock())
+
+
+class TestCoverCommandScheduler:
+    """Test dispatch order, rate limiting and cancellation."""
+
+    async def test_due_commands_run_in_priority_order(self) -> None:
+        """Due commands are dispatched by priority, then by due time."""
+
+        scheduler = _make_scheduler()
+        order: list[str] = []
+        done = asyncio.Event()
+
+        def job(name: str):
+            async def _run() -> None:
+                order.append(name)
+                if len(order) == 3:
+                    done.set()
+
+            return _run
+
+        scheduler.schedule("cover.open", "gw", CoverCommandPriority.OPENING, 0, job("cover.open"))
+        scheduler.schedule("cover.close", "gw", CoverCommandPriority.CLOSING, 0, job("cover.close"))
+        scheduler.schedule("cover.heat", "gw", CoverCommandPriority.HEAT_PROTECTION, 0, job("cover.heat"))
+        await asyncio.wait_for(done.wait(), timeout=1)
+
+        assert order == ["cover.heat", "cover.close", "cover.open"]
+        assert "cover.open" not in scheduler
+
+    async def test_rescheduling_replaces_queued_command(self) -> None:
+        """A key has at most one queued command; the newest one wins."""
+
+        scheduler = _make_scheduler()
+        first = AsyncMock()
+        second = AsyncMock()
+
+        scheduler.schedule("cover.a", None, CoverCommandPriority.OPENING, 60, first)
+        scheduler.schedule("cover.a", None, CoverCommandPriority.OPENING, 0, second)
+        await asyncio.sleep(0.05)
+
+        first.assert_not_awaited()
+        second.assert_awaited_once()
+
+    async def test_token_bucket_limits_each_group(self) -> None:
+        """A group without tokens waits for its refill without blocking other groups."""
+
+        scheduler = _make_scheduler(rate_limit=60, burst=1)
+        for sequence, (key, group) in enumerate((("cover.a1", "gw_a"), ("cover.a2", "gw_a"), ("cover.b1", "gw_b"))):
+            scheduler._commands[key] = _ScheduledCommand(key, group, CoverCommandPriority.OPENING, 0.0, sequence, AsyncMock())
+            heapq.heappush(scheduler._timeline, (0.0, sequence, key))
+
+        command, _ = scheduler._next_command(100.0)
+        assert command.key == "cover.a1"
+        del scheduler._commands[command.key]
+
+        command, _ = scheduler._next_command(100.0)
+        assert command.key == "cover.b1"
+        del scheduler._commands[command.key]
+
+        command, wait_seconds = scheduler._next_command(100.5)
+        assert command is None
+        assert wait_seconds == 0.5
+
+        command, _ = scheduler._next_command(101.0)
+        assert command.key == "cover.a2"
+
+    async def test_replaced_command_waits_on_single_timer(self) -> None:
+        """Replacing a queued command creates no task and leaves at most one armed timer."""
+
+        scheduler = _make_scheduler()
+        job = AsyncMock()
+        scheduler.schedule("cover.a", None, CoverCommandPriority.OPENING, 60, job)
+        first_timer = scheduler._timer
+
+        with patch("custom_components.smart_cover_automation.cover_command_scheduler.asyncio.create_task") as mock_create_task:
+            scheduler.schedule("cover.a", None, CoverCommandPriority.OPENING, 30, job)
+            scheduler.schedule("cover.a", None, CoverCommandPriority.OPENING, 90, job)
+
+        mock_create_task.assert_not_called()
+        assert first_timer is not None and first_timer.cancelled()
+        assert scheduler._timer is not None and scheduler._timer.when() == scheduler._timeline[0][0]
+        assert len(scheduler._timeline) == 3
+
+        scheduler.cancel_all()
+        assert scheduler._timer is None
+        assert scheduler._timeline == []
+
+    async def test_groups_execute_concurrently_one_command_each(self) -> None:
+        """A slow command only holds back its own group; each group has one command in flight."""
+
+        scheduler = _make_scheduler(rate_limit=60, burst=10)
+        release_a1 = asyncio.Event()
+        started: list[str] = []
+
+        def job(name: str, gate: asyncio.Event | None = None):
+            async def _run() -> None:
+                started.append(name)
+                if gate is not None:
+                    await gate.wait()
+
+            return _run
+
+        scheduler.schedule("cover.a1", "gw_a", CoverCommandPriority.HEAT_PROTECTION, 0, job("cover.a1", release_a1))
+        scheduler.schedule("cover.a2", "gw_a", CoverCommandPriority.HEAT_PROTECTION, 0, job("cover.a2"))
+        scheduler.schedule("cover.b1", "gw_b", CoverCommandPriority.OPENING, 0, job("cover.b1"))
+        await asyncio.sleep(0.05)
+
+        assert started == ["cover.a1", "cover.b1"]
+        assert "cover.a2" in scheduler
+
+        release_a1.set()
+        await asyncio.sleep(0.05)
+
+        assert started == ["cover.a1", "cover.b1", "cover.a2"]
+        assert scheduler._in_flight == {}
+
+    async def test_staggered_commands_overlap_without_rate_limit(self) -> None:
+        """Without rate limiting, a slow command does not delay the next staggered one."""
+
+        scheduler = _make_scheduler(rate_limit=0)
+        release_a = asyncio.Event()
+        b_done = asyncio.Event()
+
+        async def slow_a() -> None:
+            await release_a.wait()
+
+        async def quick_b() -> None:
+            b_done.set()
+
+        scheduler.schedule("cover.a", None, CoverCommandPriority.OPENING, 0, slow_a)
+        scheduler.schedule("cover.b", None, CoverCommandPriority.OPENING, 0.02, quick_b)
+        await asyncio.wait_for(b_done.wait(), timeout=1)
+
+        assert scheduler._in_flight == {None: 1}
+
+        release_a.set()
+        await asyncio.sleep(0.01)
+        assert scheduler._in_flight == {}
+
+    async def test_failed_job_does_not_stop_dispatching(self) -> None:
+        """A failing command is logged and the remaining commands still run."""
+
+        scheduler = _make_scheduler()
+        succeeding = AsyncMock()
+
+        scheduler.schedule("cover.a", None, CoverCommandPriority.HEAT_PROTECTION, 0, AsyncMock(side_effect=RuntimeError("boom")))
+        scheduler.schedule("cover.b", None, CoverCommandPriority.OPENING, 0, succeeding)
+        await asyncio.sleep(0.05)
+
+        succeeding.assert_awaited_once()
+        scheduler._logger.error.assert_called_once()
+
+    async def test_cancel_all_disarms_timer(self) -> None:
+        """Cancelling all commands empties the queue and disarms the timer."""
+
+        scheduler = _make_scheduler()
+        job = AsyncMock()
+        scheduler.schedule("cover.a", None, CoverCommandPriority.OPENING, 60, job)
+
+        scheduler.cancel_all()
+        await asyncio.sleep(0)
+
+        assert "cover.a" not in scheduler
+        assert scheduler._timer is None
+        job.assert_not_awaited()
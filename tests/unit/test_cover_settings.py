@@ -0,0 +1,86 @@
+"""Tests for precompiled per-cover settings."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.smart_cover_automation import const
+from custom_components.smart_cover_automation.config import ConfKeys, resolve
+from custom_components.smart_cover_automation.cover_settings import compile_per_cover_settings, compile_per_cover_settings_table
+
+COVER = "cover.test"
+
+
+class TestCompilePerCoverSettings:
+    """Test compile_per_cover_settings()."""
+
+    def test_global_fallbacks(self) -> None:
+        """Covers without overrides inherit the global settings."""
+
+        config = {ConfKeys.COVERS.value: [COVER], f"{COVER}_{const.COVER_SFX_AZIMUTH}": "180"}
+        resolved = resolve(config)
+
+        settings = compile_per_cover_settings(COVER, resolved, config, MagicMock())
+
+        assert settings.azimuth == 180.0
+        assert settings.sun_azimuth_tolerance_start == resolved.sun_azimuth_tolerance
+        assert settings.sun_azimuth_tolerance_end == resolved.sun_azimuth_tolerance
+        assert settings.sun_elevation_min == float(resolved.sun_elevation_threshold)
+        assert settings.sun_elevation_max == float(resolved.sun_elevation_max)
+        assert settings.min_closure == resolved.covers_min_closure
+        assert settings.max_closure == resolved.covers_max_closure
+        assert settings.evening_closure_max_closure == resolved.evening_closure_max_closure
+        assert settings.external_tilt_value_day is None
+        assert settings.external_tilt_value_night is None
+
+    def test_per_cover_overrides(self) -> None:
+        """Per-cover keys are coerced and take precedence over global settings."""
+
+        config = {
+            ConfKeys.COVERS.value: [COVER],
+            f"{COVER}_{const.COVER_SFX_AZIMUTH}": 90,
+            f"{COVER}_{const.COVER_SFX_SUN_AZIMUTH_TOLERANCE_START}": "30",
+            f"{COVER}_{const.COVER_SFX_SUN_AZIMUTH_TOLERANCE_END}": 60,
+            f"{COVER}_{const.COVER_SFX_SUN_ELEVATION_MIN}": "5.5",
+            f"{COVER}_{const.COVER_SFX_SUN_ELEVATION_MAX}": 70,
+            f"{COVER}_{const.COVER_SFX_MIN_CLOSURE}": 80,
+            f"{COVER}_{const.COVER_SFX_MAX_CLOSURE}": "10",
+            f"{COVER}_{const.COVER_SFX_EVENING_CLOSURE_MAX_CLOSURE}": 5,
+            f"{COVER}_{const.COVER_SFX_TILT_MODE_NIGHT}": const.TiltMode.EXTERNAL,
+            f"{COVER}_{const.COVER_SFX_TILT_EXTERNAL_VALUE_NIGHT}": 25,
+            const.NUMBER_KEY_TILT_EXTERNAL_VALUE_DAY: 40,
+            const.NUMBER_KEY_TILT_EXTERNAL_VALUE_NIGHT: 44,
+        }
+
+        settings = compile_per_cover_settings(COVER, resolve(config), config, MagicMock())
+
+        assert settings.azimuth == 90.0
+        assert (settings.sun_azimuth_tolerance_start, settings.sun_azimuth_tolerance_end) == (30, 60)
+        assert (settings.sun_elevation_min, settings.sun_elevation_max) == (5.5, 70.0)
+        assert (settings.min_closure, settings.max_closure, settings.evening_closure_max_closure) == (80, 10, 5)
+        assert settings.external_tilt_value_day == 40
+        assert settings.external_tilt_value_night == 25
+
+    def test_invalid_external_tilt_is_dropped_and_logged(self) -> None:
+        """Invalid external tilt values are rejected once, at compile time."""
+
+        config = {ConfKeys.COVERS.value: [COVER], const.NUMBER_KEY_TILT_EXTERNAL_VALUE_DAY: 150}
+        logger = MagicMock()
+
+        settings = compile_per_cover_settings(COVER, resolve(config), config, logger)
+
+        assert settings.external_tilt_value_day is None
+        logger.warning.assert_called_once_with(
+            f"[{COVER}] External tilt value out of range for {const.NUMBER_KEY_TILT_EXTERNAL_VALUE_DAY}: 150, skipping"
+        )
+
+    def test_table_is_keyed_by_entity_id(self) -> None:
+        """The table holds one record per cover."""
+
+        covers = [COVER, "cover.other"]
+        config = {ConfKeys.COVERS.value: covers}
+
+        table = compile_per_cover_settings_table(covers, resolve(config), config, MagicMock())
+
+        assert list(table) == covers
+        assert table["cover.other"].entity_id == "cover.other"
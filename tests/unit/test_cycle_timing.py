@@ -0,0 +1,96 @@
+"""Tests for the automation cycle timing statistics and their diagnostics."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.smart_cover_automation.cycle_timing import CycleStage, CycleTimings
+from custom_components.smart_cover_automation.diagnostics import async_get_config_entry_diagnostics
+
+
+class TestCycleTimings:
+    """Test stage accumulation and percentile summaries."""
+
+    def test_stage_time_is_summed_per_cycle(self) -> None:
+        """Stage time within a cycle becomes one sample; per-cover time is kept per cover."""
+
+        timings = CycleTimings()
+        with timings.cycle():
+            timings.record(CycleStage.SERVICE_CALLS, 0.010)
+            timings.record(CycleStage.SERVICE_CALLS, 0.020)
+            timings.record(CycleStage.EVALUATE, 0.005, "cover.slow")
+
+        stages = timings.as_dict()["stages"]
+        assert stages["service_calls"] == {"count": 1, "p50_ms": 30.0, "p95_ms": 30.0, "max_ms": 30.0}
+        assert stages["cycle"]["count"] == 1
+        assert timings.as_dict()["covers"]["cover.slow"]["evaluate"]["max_ms"] == 5.0
+
+    def test_work_outside_a_cycle_is_its_own_sample(self) -> None:
+        """Queued executions dispatched between cycles are still recorded."""
+
+        timings = CycleTimings()
+        timings.record(CycleStage.EXECUTE, 0.1, "cover.a")
+        timings.record(CycleStage.EXECUTE, 0.3, "cover.a")
+
+        assert timings.as_dict()["stages"]["execute"]["count"] == 2
+        assert timings.as_dict()["covers"]["cover.a"]["execute"]["count"] == 2
+
+    async def test_work_is_attributed_by_context(self) -> None:
+        """Only work started from the cycle adds to its totals; other or outliving tasks get samples of their own."""
+
+        timings = CycleTimings()
+        in_cycle = asyncio.Event()
+        after_cycle = asyncio.Event()
+
+        async def _record(event: asyncio.Event, seconds: float) -> None:
+            await event.wait()
+            timings.record(CycleStage.EXECUTE, seconds)
+
+        outside_task = asyncio.create_task(_record(in_cycle, 0.1))
+        with timings.cycle():
+            inside_tasks = [asyncio.create_task(_record(in_cycle, seconds)) for seconds in (0.2, 0.3)]
+            outliving_task = asyncio.create_task(_record(after_cycle, 0.4))
+            in_cycle.set()
+            await asyncio.gather(outside_task, *inside_tasks)
+        after_cycle.set()
+        await outliving_task
+
+        execute = timings.as_dict()["stages"]["execute"]
+        assert execute["count"] == 3
+        assert execute["max_ms"] == 500.0
+
+    def test_rolling_percentiles(self) -> None:
+        """p50/p95/max are computed over the most recent samples only."""
+
+        timings = CycleTimings(window_size=20)
+        for milliseconds in range(1, 31):
+            timings.record(CycleStage.LOGBOOK, milliseconds / 1000)
+
+        assert timings.as_dict()["stages"]["logbook"] == {"count": 20, "p50_ms": 20.0, "p95_ms": 29.0, "max_ms": 30.0}
+
+    def test_forget_covers(self) -> None:
+        """Per-cover samples of removed covers are dropped."""
+
+        timings = CycleTimings()
+        timings.record(CycleStage.EVALUATE, 0.001, "cover.a")
+        timings.record(CycleStage.EVALUATE, 0.001, "cover.b")
+
+        timings.forget_covers({"cover.b"})
+
+        assert list(timings.as_dict()["covers"]) == ["cover.b"]
+
+
+async def test_config_entry_diagnostics() -> None:
+    """The diagnostics download contains the coordinator's cycle timings."""
+
+    timings = CycleTimings()
+    timings.record(CycleStage.SENSOR_DATA, 0.002)
+    coordinator = SimpleNamespace(last_update_success=True, cycle_timings=timings)
+    entry = SimpleNamespace(runtime_data=SimpleNamespace(coordinator=coordinator))
+
+    diagnostics = await async_get_config_entry_diagnostics(MagicMock(), entry)
+
+    assert diagnostics["last_update_success"] is True
+    assert diagnostics["cycle_timings"]["stages"]["sensor_data"]["max_ms"] == 2.0
@@ -0,0 +1,73 @@
+"""Tests for the shared weather forecast cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from custom_components.smart_cover_automation import const
+from custom_components.smart_cover_automation.forecast_cache import ForecastCache, get_shared_forecast_cache
+
+WEATHER = "weather.home"
+LAST_UPDATED = datetime(2026, 6, 1, 8, 0, tzinfo=timezone.utc)
+FORECAST = [{"datetime": "2026-06-01T00:00:00+00:00", "native_temperature": 26.0}]
+
+
+class TestForecastCache:
+    """Test ForecastCache lookups and invalidation."""
+
+    def test_hit_until_ttl_expires(self) -> None:
+        """A stored forecast is returned until it is older than the cache TTL."""
+
+        cache = ForecastCache()
+        now = datetime(2026, 6, 1, 9, 0, tzinfo=timezone.utc)
+
+        with patch("custom_components.smart_cover_automation.forecast_cache.dt_util.utcnow", return_value=now) as mock_now:
+            cache.store(WEATHER, "daily", LAST_UPDATED, FORECAST)
+            assert cache.get(WEATHER, "daily", LAST_UPDATED) is FORECAST
+            assert cache.get(WEATHER, "hourly", LAST_UPDATED) is None
+
+            mock_now.return_value = now + const.WEATHER_FORECAST_CACHE_TTL - timedelta(seconds=1)
+            assert cache.get(WEATHER, "daily", LAST_UPDATED) is FORECAST
+
+            mock_now.return_value = now + const.WEATHER_FORECAST_CACHE_TTL
+            assert cache.get(WEATHER, "daily", LAST_UPDATED) is None
+
+    def test_weather_state_update_invalidates(self) -> None:
+        """A changed last_updated of the weather entity makes the cached forecast stale."""
+
+        cache = ForecastCache()
+        cache.store(WEATHER, "daily", LAST_UPDATED, FORECAST)
+
+        assert cache.get(WEATHER, "daily", LAST_UPDATED + timedelta(minutes=1)) is None
+        assert cache.get(WEATHER, "daily", LAST_UPDATED) is None
+
+    def test_invalidate_by_entity(self) -> None:
+        """Invalidation can be limited to one weather entity."""
+
+        cache = ForecastCache()
+        cache.store(WEATHER, "daily", LAST_UPDATED, FORECAST)
+        cache.store("weather.other", "daily", LAST_UPDATED, FORECAST)
+
+        cache.invalidate(WEATHER)
+
+        assert cache.get(WEATHER, "daily", LAST_UPDATED) is None
+        assert cache.get("weather.other", "daily", LAST_UPDATED) is FORECAST
+
+        cache.invalidate()
+        assert cache.get("weather.other", "daily", LAST_UPDATED) is None
+
+
+class TestGetSharedForecastCache:
+    """Test get_shared_forecast_cache()."""
+
+    def test_instance_is_shared_via_hass_data(self) -> None:
+        """All callers with the same hass instance share one cache."""
+
+        hass = MagicMock()
+        hass.data = {}
+
+        cache = get_shared_forecast_cache(hass)
+
+        assert get_shared_forecast_cache(hass) is cache
+        assert hass.data[const.DOMAIN][const.DATA_FORECAST_CACHE] is cache
@@ -0,0 +1,113 @@
+"""Tests for the shared sensor snapshot hub."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.smart_cover_automation import const
+from custom_components.smart_cover_automation.forecast_cache import get_shared_forecast_cache
+from custom_components.smart_cover_automation.ha_interface import HomeAssistantInterface, InvalidSensorReadingError
+from custom_components.smart_cover_automation.sensor_snapshot import SensorSnapshotHub, get_shared_sensor_snapshot_hub
+
+WEATHER = "weather.home"
+NOW = datetime(2026, 6, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def _make_ha_interface() -> MagicMock:
+    """Create an HA interface mock whose entity states never change."""
+
+    states = {
+        const.HA_SUN_ENTITY_ID: MagicMock(last_updated=NOW),
+        WEATHER: MagicMock(last_updated=NOW),
+    }
+    ha_interface = MagicMock()
+    ha_interface.hass.states.get = MagicMock(side_effect=states.get)
+    ha_interface.get_sun_data = MagicMock(return_value=(180.0, 45.0))
+    ha_interface.get_daily_temperature_extrema = AsyncMock(return_value=(28.0, 15.0))
+    ha_interface.get_weather_condition = MagicMock(return_value="sunny")
+    return ha_interface
+
+
+class TestSensorSnapshotHub:
+    """Test snapshot sharing and invalidation."""
+
+    async def test_snapshot_is_shared_until_max_age(self) -> None:
+        """Consecutive requests within the max. age reuse one snapshot."""
+
+        ha_interface = _make_ha_interface()
+        hub = SensorSnapshotHub(ha_interface)
+
+        with patch("custom_components.smart_cover_automation.sensor_snapshot.dt_util.utcnow", return_value=NOW) as mock_now:
+            first = await hub.async_get_snapshot(WEATHER)
+            second = await hub.async_get_snapshot(WEATHER)
+
+            assert first is second
+            assert first.get_sun_data() == (180.0, 45.0)
+            assert first.get_daily_temperature_extrema() == (28.0, 15.0)
+            assert first.get_weather_condition() == "sunny"
+            ha_interface.get_daily_temperature_extrema.assert_awaited_once_with(WEATHER)
+
+            mock_now.return_value = NOW + const.SENSOR_SNAPSHOT_MAX_AGE
+            third = await hub.async_get_snapshot(WEATHER)
+
+        assert third is not first
+        assert ha_interface.get_daily_temperature_extrema.await_count == 2
+
+    async def test_state_update_takes_new_snapshot(self) -> None:
+        """An updated sun or weather state invalidates the shared snapshot."""
+
+        ha_interface = _make_ha_interface()
+        hub = SensorSnapshotHub(ha_interface)
+
+        first = await hub.async_get_snapshot(WEATHER)
+        ha_interface.hass.states.get(const.HA_SUN_ENTITY_ID).last_updated = NOW + timedelta(minutes=1)
+        second = await hub.async_get_snapshot(WEATHER)
+
+        assert second is not first
+        assert ha_interface.get_sun_data.call_count == 2
+
+    async def test_read_errors_are_reraised_by_each_consumer(self) -> None:
+        """Errors while reading an input are captured and raised on access."""
+
+        ha_interface = _make_ha_interface()
+        hub = SensorSnapshotHub(ha_interface)
+        ha_interface.get_weather_condition.side_effect = InvalidSensorReadingError(WEATHER, "unavailable")
+
+        snapshot = await hub.async_get_snapshot(WEATHER)
+
+        assert snapshot.get_sun_data() == (180.0, 45.0)
+        with pytest.raises(InvalidSensorReadingError) as first:
+            snapshot.get_weather_condition()
+        with pytest.raises(InvalidSensorReadingError) as second:
+            snapshot.get_weather_condition()
+
+        # Each consumer gets its own instance, so tracebacks do not pile up
+        assert first.value is not second.value
+        assert str(first.value) == str(second.value) == str(ha_interface.get_weather_condition.side_effect)
+        assert first.value.__cause__ is ha_interface.get_weather_condition.side_effect
+
+    def test_hub_is_shared_via_hass_data(self) -> None:
+        """All callers with the same hass instance share one hub."""
+
+        hass = MagicMock()
+        hass.data = {}
+
+        hub = get_shared_sensor_snapshot_hub(hass)
+
+        assert get_shared_sensor_snapshot_hub(hass) is hub
+        assert hass.data[const.DOMAIN][const.DATA_SENSOR_SNAPSHOT_HUB] is hub
+
+    def test_hub_reads_through_its_own_interface(self) -> None:
+        """The shared hub does not depend on the HA interface of any config entry."""
+
+        hass = MagicMock()
+        hass.data = {}
+
+        hub = get_shared_sensor_snapshot_hub(hass)
+
+        assert isinstance(hub._ha_interface, HomeAssistantInterface)
+        assert hub._ha_interface.hass is hass
+        assert hub._ha_interface._forecast_cache is get_shared_forecast_cache(hass)
@@ -0,0 +1,76 @@
+"""Tests for the per-day sun event ephemeris cache."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
+
+from custom_components.smart_cover_automation import const, sun_ephemeris
+from custom_components.smart_cover_automation.sun_ephemeris import get_daily_sun_ephemeris, get_sun_event_for_date
+
+TARGET_DATE = date(2026, 6, 1)
+SUNRISE = datetime(2026, 6, 1, 3, 15, tzinfo=timezone.utc)
+SUNSET = datetime(2026, 6, 1, 19, 45, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def clear_ephemeris_cache():
+    """Isolate tests from the module-level cache."""
+
+    sun_ephemeris._ephemeris_cache.clear()
+    yield
+    sun_ephemeris._ephemeris_cache.clear()
+
+
+def _make_hass(latitude: float = 52.5) -> MagicMock:
+    """Create a hass mock with a configured location."""
+
+    hass = MagicMock()
+    hass.config.latitude = latitude
+    hass.config.longitude = 13.4
+    hass.config.elevation = 34
+    hass.config.time_zone = "Europe/Berlin"
+    return hass
+
+
+def _fake_astral_event_date(_hass, event, _target_date):
+    return SUNRISE if event == SUN_EVENT_SUNRISE else SUNSET
+
+
+class TestSunEphemeris:
+    """Test sun event caching."""
+
+    @patch("custom_components.smart_cover_automation.sun_ephemeris.get_astral_event_date", side_effect=_fake_astral_event_date)
+    def test_events_are_computed_once_per_date(self, mock_get_astral_event_date: MagicMock) -> None:
+        """Sunrise and sunset of one date are calculated once and then served from the cache."""
+
+        hass = _make_hass()
+
+        assert get_sun_event_for_date(hass, SUN_EVENT_SUNSET, TARGET_DATE) == SUNSET
+        assert get_sun_event_for_date(hass, SUN_EVENT_SUNRISE, TARGET_DATE) == SUNRISE
+        assert get_sun_event_for_date(hass, SUN_EVENT_SUNSET, TARGET_DATE) == SUNSET
+
+        assert mock_get_astral_event_date.call_count == 2
+
+    @patch("custom_components.smart_cover_automation.sun_ephemeris.get_astral_event_date", side_effect=_fake_astral_event_date)
+    def test_location_change_recalculates(self, mock_get_astral_event_date: MagicMock) -> None:
+        """A different location is a different cache key."""
+
+        get_daily_sun_ephemeris(_make_hass(), TARGET_DATE)
+        get_daily_sun_ephemeris(_make_hass(latitude=48.1), TARGET_DATE)
+
+        assert mock_get_astral_event_date.call_count == 4
+
+    @patch("custom_components.smart_cover_automation.sun_ephemeris.get_astral_event_date", side_effect=_fake_astral_event_date)
+    def test_cache_is_bounded(self, _mock_get_astral_event_date: MagicMock) -> None:
+        """The least recently used dates are evicted beyond the configured size."""
+
+        hass = _make_hass()
+        for offset in range(const.SUN_EPHEMERIS_CACHE_SIZE + 3):
+            get_daily_sun_ephemeris(hass, TARGET_DATE + timedelta(days=offset))
+
+        assert len(sun_ephemeris._ephemeris_cache) == const.SUN_EPHEMERIS_CACHE_SIZE
+        assert all(key[-1] != TARGET_DATE for key in sun_ephemeris._ephemeris_cache)
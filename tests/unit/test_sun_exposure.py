@@ -0,0 +1,63 @@
+"""Tests for per-cover sun-exposure windows."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from custom_components.smart_cover_automation import const
+from custom_components.smart_cover_automation.config import ConfKeys, resolve
+from custom_components.smart_cover_automation.cover_settings import compile_per_cover_settings
+from custom_components.smart_cover_automation.sun_exposure import compute_sun_exposure_windows, is_sun_hitting
+
+COVER = "cover.south"
+START = datetime(2026, 6, 1, 6, 0, tzinfo=timezone.utc)
+
+
+def _settings(azimuth: float | None = 180.0):
+    config = {ConfKeys.COVERS.value: [COVER], ConfKeys.SUN_AZIMUTH_TOLERANCE.value: 45}
+    if azimuth is not None:
+        config[f"{COVER}_{const.COVER_SFX_AZIMUTH}"] = azimuth
+    return compile_per_cover_settings(COVER, resolve(config), config, MagicMock())
+
+
+class TestIsSunHitting:
+    """Test the sun-hitting predicate."""
+
+    def test_azimuth_tolerance_and_elevation_range(self) -> None:
+        """The sun hits within the open azimuth tolerance range and the elevation range."""
+
+        settings = _settings()
+
+        assert is_sun_hitting(settings, 180.0, 45.0) is True
+        assert is_sun_hitting(settings, 224.0, 45.0) is True
+        assert is_sun_hitting(settings, 225.0, 45.0) is False
+        assert is_sun_hitting(settings, 135.0, 45.0) is False
+        assert is_sun_hitting(settings, 180.0, -5.0) is False
+
+    def test_cover_without_azimuth_is_never_hit(self) -> None:
+        """Covers without an azimuth have no exposure."""
+
+        assert is_sun_hitting(_settings(azimuth=None), 180.0, 45.0) is False
+
+
+class TestComputeSunExposureWindows:
+    """Test window extraction from sampled sun positions."""
+
+    def test_windows_follow_hitting_samples(self) -> None:
+        """A window spans from the first hitting sample to the next non-hitting one."""
+
+        sample_times = [START + timedelta(hours=hour) for hour in range(6)]
+        positions = [(90.0, 10.0), (150.0, 30.0), (180.0, 50.0), (250.0, 30.0), (170.0, 20.0), (240.0, 5.0)]
+
+        windows = compute_sun_exposure_windows(_settings(), sample_times, positions)
+
+        assert [(window.start, window.end) for window in windows] == [
+            (sample_times[1], sample_times[3]),
+            (sample_times[4], sample_times[5]),
+        ]
+
+    def test_no_samples_no_windows(self) -> None:
+        """Empty sample series produce no windows."""
+
+        assert compute_sun_exposure_windows(_settings(), [], []) == ()